@@ -100,6 +100,7 @@ podman run --rm --pull=always \
   -w /output \
   ${YOINKC_DEBUG:+-e YOINKC_DEBUG=1} \
   ${YOINKC_EXCLUDE_PREREQS:+--env YOINKC_EXCLUDE_PREREQS} \
+  ${YOINKC_NATIVE_RPMDB:+--env YOINKC_NATIVE_RPMDB} \
   -e YOINKC_HOST_CWD="$(pwd)" \
   -e YOINKC_HOSTNAME="${YOINKC_HOSTNAME:-$(hostname -s)}" \
   -v /:/host:ro \
@@ -5,29 +5,60 @@ CLI entry point. Parses args and delegates to pipeline.
 import os
 import sys
 import traceback
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional
 
-from .cli import parse_args
+from .cli import parse_args, parse_baseline_args
 from .pipeline import run_pipeline
 from .schema import InspectionSnapshot
 
 
 def _run_inspectors(host_root: Path, args) -> InspectionSnapshot:
     """Run all inspectors and merge into one snapshot."""
+    from .executor import RecordingExecutor, ReplayExecutor, make_executor
     from .inspectors import run_all
+    from .progress import ProgressStream
 
-    return run_all(
-        host_root,
-        config_diffs=args.config_diffs,
-        deep_binary_scan=args.deep_binary_scan,
-        query_podman=args.query_podman,
-        baseline_packages_file=args.baseline_packages,
-        target_version=args.target_version,
-        target_image=args.target_image,
-        user_strategy=args.user_strategy,
-        no_baseline_opt_in=args.no_baseline,
-    )
+    executor = None
+    if args.replay:
+        executor = ReplayExecutor(args.replay, host_root=str(host_root),
+                                  replay_latency=args.replay_latency)
+    elif args.record:
+        executor = RecordingExecutor(make_executor(str(host_root)), args.record,
+                                     host_root=str(host_root))
+    progress = None
+    try:
+        if args.progress_fd is not None or args.progress_file:
+            progress = ProgressStream.open(fd=args.progress_fd, path=args.progress_file)
+        with progress.activate() if progress else nullcontext():
+            return run_all(
+                host_root,
+                executor=executor,
+                config_diffs=args.config_diffs,
+                deep_binary_scan=args.deep_binary_scan,
+                query_podman=args.query_podman,
+                baseline_packages_file=args.baseline_packages,
+                target_version=args.target_version,
+                target_image=args.target_image,
+                user_strategy=args.user_strategy,
+                no_baseline_opt_in=args.no_baseline,
+                jobs=args.jobs,
+                cache_dir=args.cache_dir,
+                cache_max_bytes=args.cache_max_size * 1024 * 1024,
+                baseline_cache_dir=args.baseline_cache,
+                baseline_mount=args.baseline_mount,
+                baseline_bundle_file=args.baseline_bundle,
+                sections=args.sections,
+                time_budget=args.time_budget,
+                verify_scope=args.verify_scope,
+                verify_jobs=args.verify_jobs,
+            )
+    finally:
+        if progress is not None:
+            progress.close()
+        if isinstance(executor, RecordingExecutor):
+            executor.close()
 
 
 def _run_renderers(snapshot: InspectionSnapshot, output_dir: Path) -> None:
@@ -37,12 +68,41 @@ def _run_renderers(snapshot: InspectionSnapshot, output_dir: Path) -> None:
     run_all(snapshot, output_dir)
 
 
+def _baseline_export(args) -> int:
+    """Write a baseline bundle for ``args.image`` (``yoinkc baseline export``)."""
+    import re
+    from .baseline import BaselineResolver, write_baseline_bundle_file
+    from .executor import subprocess_executor
+
+    resolver = BaselineResolver(subprocess_executor, nsenter=False,
+                                mount_root=Path("/") if args.mount else None)
+    bundle = resolver.query_bundle(args.image)
+    if bundle is None:
+        print(f"Error: could not read a baseline from {args.image} "
+              "(is podman installed and the image pullable?).", file=sys.stderr)
+        return 1
+    bundle.image = args.image
+    bundle.digest = resolver.image_digest(args.image)
+    name = re.sub(r"[^A-Za-z0-9._-]+", "_", args.image.rsplit("/", 1)[-1])
+    output = args.output or Path(f"{name}.baseline.json.gz")
+    write_baseline_bundle_file(bundle, output)
+    print(f"Baseline bundle for {args.image} written to {output}")
+    print(f"  {len(bundle.packages)} packages, {len(bundle.presets)} preset files, "
+          f"{len(bundle.etc_files)} /etc files, {len(bundle.sysctl)} sysctl files")
+    return 0
+
+
 def main(argv: Optional[list] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "baseline":
+        return _baseline_export(parse_baseline_args(argv[1:]))
     args = parse_args(argv)
 
     # Preflight: bail out early if container privileges are missing.
+    # A replayed run never touches the host, so there is nothing to check.
     if (
         args.from_snapshot is None
+        and args.replay is None
         and str(args.host_root) != "/"
         and not args.skip_preflight
     ):
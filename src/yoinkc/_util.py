@@ -46,14 +46,15 @@ if not sys.stderr.isatty():
 
 def status(msg: str) -> None:
     """Print a user-facing progress line to stderr."""
-    print(f"  {_C.GREEN}\uf00c{_C.RESET}  {msg}", file=sys.stderr)
+    # Single write per line so output from concurrent inspectors never interleaves.
+    print(f"  {_C.GREEN}\uf00c{_C.RESET}  {msg}\n", end="", file=sys.stderr)
 
 
 def section_banner(title: str, step: int, total: int) -> None:
     """Print a section header with a [step/total] counter to stderr."""
     counter = f"{_C.DIM}[{step}/{total}]{_C.RESET}"
     rule = f"{_C.DIM}{'─' * (42 - len(title))}{_C.RESET}"
-    print(f"{_C.CYAN}──{_C.RESET} {counter} {_C.BOLD}{title}{_C.RESET} {rule}", file=sys.stderr)
+    print(f"{_C.CYAN}──{_C.RESET} {counter} {_C.BOLD}{title}{_C.RESET} {rule}\n", end="", file=sys.stderr)
 
 
 def safe_iterdir(d: Path) -> List[Path]:
@@ -92,20 +93,44 @@ def parse_dist_info_name(stem: str) -> Tuple[str, str]:
     return stem, ""
 
 
+def _rpm_query_commands(host_root: Path, args: List[str]) -> Tuple[List[str], Optional[List[str]]]:
+    """Return the (primary, fallback) rpm command lines for *args*."""
+    if str(host_root) == "/":
+        return ["rpm"] + args, None
+    return (
+        ["rpm", "--dbpath", str(host_root / "var" / "lib" / "rpm")] + args,
+        ["rpm", "--root", str(host_root)] + _RPM_LOCK_DEFINE + args,
+    )
+
+
 def run_rpm_query(executor, host_root: Path, args: List[str]):
     """Run an rpm query against *host_root* with ``--dbpath`` fallback to ``--root``.
 
-    On RHEL/CentOS the ``--dbpath`` form is preferred because it avoids
+    ``rpm -qa`` queries against a sqlite rpmdb are answered in-process
+    (see ``yoinkc.rpmdb_sqlite``) without running rpm at all.  Otherwise, on
+    RHEL/CentOS the ``--dbpath`` form is preferred because it avoids
     chroot limitations.  If it fails (e.g. locked DB), we retry with
     ``--root`` plus the lock-path override.
     """
-    if str(host_root) == "/":
-        prefix: List[str] = ["rpm"]
-    else:
-        prefix = ["rpm", "--dbpath", str(host_root / "var" / "lib" / "rpm")]
-    result = executor(prefix + args)
-    if result.returncode != 0 and str(host_root) != "/":
-        result = executor(
-            ["rpm", "--root", str(host_root)] + _RPM_LOCK_DEFINE + args
-        )
+    from .rpmdb_sqlite import query as native_query
+    result = native_query(host_root, args)
+    if result is not None:
+        return result
+    primary, fallback = _rpm_query_commands(host_root, args)
+    result = executor(primary)
+    if result.returncode != 0 and fallback is not None:
+        result = executor(fallback)
+    return result
+
+
+async def run_rpm_query_async(executor, host_root: Path, args: List[str]):
+    """Async variant of run_rpm_query for an ``AsyncExecutor``."""
+    from .rpmdb_sqlite import query as native_query
+    result = native_query(host_root, args)
+    if result is not None:
+        return result
+    primary, fallback = _rpm_query_commands(host_root, args)
+    result = await executor(primary)
+    if result.returncode != 0 and fallback is not None:
+        result = await executor(fallback)
     return result
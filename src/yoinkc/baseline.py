@@ -9,15 +9,38 @@ exactly the ``dnf install`` list the Containerfile needs.
 When running inside a container (the normal case), podman is not available
 directly. The tool uses ``nsenter -t 1 -m -u -i -n`` to execute podman in
 the host's namespaces.  This requires ``--pid=host`` on the outer container.
+
+Everything yoinkc needs from the image is extracted by a single container
+run into a ``BaselineBundle``: package NEVRAs, systemd presets, the shipped
+``/usr/lib/sysctl.d`` defaults, the unit files under
+``/usr/lib/systemd/system`` and the rpm-owned ``/etc`` files with their
+digests.  With ``--baseline-mount`` the image is not run at all: ``podman
+image mount`` exposes its filesystem and the bundle is read from it with
+the same rpmdb and file readers used for the host root.  With a
+``BaselineCache`` (``--baseline-cache``), the bundle is
+stored on disk keyed by the image's digest, so hosts that target the same
+image — and later runs on the same host — skip ``podman run`` entirely.
+
+For air-gapped hosts, ``yoinkc baseline export IMAGE`` writes the bundle to
+a versioned, gzip-compressed JSON file on a machine that can pull the
+image; ``--baseline-bundle FILE`` then supplies it to inspection without
+podman or network access.
 """
 
+import gzip
+import hashlib
+import json
 import subprocess
+from datetime import datetime, timezone
 import sys
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Dict, List, Optional, Set, Tuple
 
+from . import __version__
+from .cache import DEFAULT_MAX_BYTES, ResultCache
 from .preflight import in_user_namespace
-from ._util import debug as _debug_fn
+from .rpmdb import RpmDatabase
+from ._util import debug as _debug_fn, safe_iterdir as _safe_iterdir, safe_read as _safe_read, status as _status
 
 
 def _debug(msg: str) -> None:
@@ -119,6 +142,250 @@ def load_baseline_packages_file(path: Path) -> Optional[Set[str]]:
     return names
 
 
+# ---------------------------------------------------------------------------
+# BaselineBundle — all base image facts from one container run
+# ---------------------------------------------------------------------------
+
+# Emits "@@ <section>" headers, then section lines; each file is introduced
+# by "@@ file <path>" and printed line by line so a missing final newline
+# cannot swallow the next header.
+_BUNDLE_SCRIPT = r"""
+echo '@@ packages'
+rpm -qa --queryformat '%{NAME}\t%{EPOCHNUM}:%{NAME}-%{VERSION}-%{RELEASE}.%{ARCH}\n'
+echo '@@ etc_files'
+rpm -qa --queryformat '[%{FILENAMES}\t%{FILEDIGESTS}\n]' | grep '^/etc/'
+echo '@@ unit_files'
+ls -1 /usr/lib/systemd/system 2>/dev/null
+for f in /usr/lib/systemd/system-preset/*.preset /usr/lib/sysctl.d/*.conf; do
+    [ -f "$f" ] || continue
+    echo "@@ file $f"
+    while IFS= read -r line || [ -n "$line" ]; do printf '%s\n' "$line"; done < "$f"
+done
+true
+"""
+
+
+class BaselineBundle:
+    """Facts about a base image, in ``_BUNDLE_SCRIPT``'s output format.
+
+    ``parse`` reads that format and ``to_text`` writes it; the baseline
+    cache stores the text.  ``to_dict``/``from_dict`` are the structured
+    form used in exported bundle files, which also record the image
+    reference and digest.
+    """
+
+    def __init__(self) -> None:
+        self.image: Optional[str] = None
+        self.digest: Optional[str] = None
+        # (name, "epoch:name-version-release.arch"), in rpm -qa order.
+        self.packages: List[Tuple[str, str]] = []
+        self.etc_files: Dict[str, str] = {}
+        self.unit_files: List[str] = []
+        self.presets: Dict[str, str] = {}
+        self.sysctl: Dict[str, str] = {}
+
+    @classmethod
+    def parse(cls, text: str) -> "BaselineBundle":
+        bundle = cls()
+        section = ""
+        file_lines: Optional[List[str]] = None
+        for line in text.splitlines():
+            if line.startswith("@@ "):
+                section = line[3:]
+                file_lines = None
+                if section.startswith("file /"):
+                    path = section[5:]
+                    file_lines = []
+                    target = bundle.presets if path.endswith(".preset") else bundle.sysctl
+                    target[path] = ""
+                continue
+            if file_lines is not None:
+                target[path] += line + "\n"
+            elif section == "packages":
+                name, _, nevra = line.partition("\t")
+                if name and nevra:
+                    bundle.packages.append((name, nevra))
+            elif section == "etc_files":
+                path_, _, digest = line.partition("\t")
+                if path_:
+                    bundle.etc_files[path_] = digest
+            elif section == "unit_files" and line.strip():
+                bundle.unit_files.append(line.strip())
+        return bundle
+
+    @classmethod
+    def from_root(cls, root: Path, executor) -> Optional["BaselineBundle"]:
+        """Read the bundle from an image filesystem at *root*; None without an rpmdb.
+
+        Packages and /etc digests come from ``RpmDatabase`` (the in-process
+        sqlite reader, else rpm ``--dbpath`` through *executor*).
+        """
+        root = Path(root)
+        rpmdb = RpmDatabase.query(executor, root)
+        if rpmdb is None:
+            return None
+        bundle = cls()
+        bundle.packages = [(p.name, p.nevra) for p in rpmdb.packages]
+        for path in rpmdb.owned_paths("/etc/"):
+            bundle.etc_files[path] = rpmdb.file(path).digest
+        bundle.unit_files = [f.name for f in _safe_iterdir(root / "usr/lib/systemd/system")]
+        for rel, suffix, target in (("usr/lib/systemd/system-preset", ".preset", bundle.presets),
+                                    ("usr/lib/sysctl.d", ".conf", bundle.sysctl)):
+            for f in _safe_iterdir(root / rel):
+                if f.suffix == suffix and f.is_file():
+                    target[f"/{rel}/{f.name}"] = _safe_read(f, "baseline")
+        return bundle
+
+    def to_text(self) -> str:
+        """Return the bundle in ``_BUNDLE_SCRIPT``'s output format."""
+        out = ["@@ packages\n"]
+        out.extend(f"{name}\t{nevra}\n" for name, nevra in self.packages)
+        out.append("@@ etc_files\n")
+        out.extend(f"{path}\t{digest}\n" for path, digest in self.etc_files.items())
+        out.append("@@ unit_files\n")
+        out.extend(f"{name}\n" for name in self.unit_files)
+        for files in (self.presets, self.sysctl):
+            for path, text in files.items():
+                out.append(f"@@ file {path}\n{text}")
+                if text and not text.endswith("\n"):
+                    out.append("\n")
+        return "".join(out)
+
+    def to_dict(self) -> dict:
+        return {
+            "packages": [{"name": name, "nevra": nevra} for name, nevra in self.packages],
+            "presets": dict(self.presets),
+            "sysctl": dict(self.sysctl),
+            "etc_files": dict(self.etc_files),
+            "unit_files": list(self.unit_files),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BaselineBundle":
+        bundle = cls()
+        bundle.packages = [(p["name"], p["nevra"]) for p in data["packages"]]
+        bundle.presets = dict(data.get("presets", {}))
+        bundle.sysctl = dict(data.get("sysctl", {}))
+        bundle.etc_files = dict(data.get("etc_files", {}))
+        bundle.unit_files = list(data.get("unit_files", []))
+        return bundle
+
+    @property
+    def package_names(self) -> Set[str]:
+        return {name for name, _ in self.packages}
+
+    @property
+    def preset_text(self) -> str:
+        """All preset files concatenated in name order, like ``cat *.preset``."""
+        return "".join(self.presets[p] for p in sorted(self.presets))
+
+
+# Exported bundle files: {"format", "version", "image", "digest", "sha256",
+# "bundle": BaselineBundle.to_dict()}, gzip'd.  Readers reject newer versions.
+BUNDLE_FILE_FORMAT = "yoinkc-baseline-bundle"
+BUNDLE_FILE_VERSION = 1
+
+
+def _bundle_checksum(data: dict) -> str:
+    return hashlib.sha256(json.dumps(data, sort_keys=True, separators=(",", ":")).encode()).hexdigest()
+
+
+def write_baseline_bundle_file(bundle: BaselineBundle, path: Path) -> None:
+    """Write *bundle* as an exported bundle file at *path*."""
+    data = bundle.to_dict()
+    payload = {
+        "format": BUNDLE_FILE_FORMAT,
+        "version": BUNDLE_FILE_VERSION,
+        "yoinkc": __version__,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "image": bundle.image,
+        "digest": bundle.digest,
+        "sha256": _bundle_checksum(data),
+        "bundle": data,
+    }
+    with gzip.open(Path(path), "wt", encoding="utf-8") as fh:
+        json.dump(payload, fh, separators=(",", ":"))
+
+
+def load_baseline_bundle_file(path: Path) -> BaselineBundle:
+    """Read an exported bundle file; raise ValueError if it is unusable."""
+    path = Path(path)
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            payload = json.load(fh)
+    except (OSError, ValueError) as exc:
+        raise ValueError(f"cannot read baseline bundle {path}: {exc}") from exc
+    if not isinstance(payload, dict) or payload.get("format") != BUNDLE_FILE_FORMAT:
+        raise ValueError(f"{path} is not a yoinkc baseline bundle")
+    version = payload.get("version")
+    if not isinstance(version, int) or version > BUNDLE_FILE_VERSION:
+        raise ValueError(f"baseline bundle {path} has unsupported version {version!r}; "
+                         f"this yoinkc reads up to version {BUNDLE_FILE_VERSION}")
+    data = payload.get("bundle")
+    if not isinstance(data, dict) or payload.get("sha256") != _bundle_checksum(data):
+        raise ValueError(f"baseline bundle {path} failed its integrity check")
+    try:
+        bundle = BaselineBundle.from_dict(data)
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"baseline bundle {path} is malformed: {exc}") from exc
+    if not bundle.packages:
+        raise ValueError(f"baseline bundle {path} lists no packages")
+    bundle.image = payload.get("image")
+    bundle.digest = payload.get("digest")
+    _debug(f"loaded baseline bundle for {bundle.image} ({bundle.digest}): "
+           f"{len(bundle.packages)} packages from {path}")
+    return bundle
+
+
+# ---------------------------------------------------------------------------
+# BaselineCache — per-image query results on disk
+# ---------------------------------------------------------------------------
+
+class BaselineCache:
+    """Base image query results, keyed by image digest, in a size-bounded store.
+
+    Keying by digest rather than tag means a retagged or updated image is
+    queried afresh.  Each entry records the digest and a SHA-256 of its
+    data; an entry that fails either check is discarded and treated as a
+    miss.
+    """
+
+    # Bump when _BUNDLE_SCRIPT's output format changes.
+    FORMAT = 2
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._store = ResultCache(Path(root), max_bytes)
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, kind: str, digest: str) -> str:
+        return hashlib.sha256(f"baseline:{self.FORMAT}:{kind}:{digest}".encode()).hexdigest()
+
+    def get(self, kind: str, digest: str) -> Optional[str]:
+        """Return the *kind* data stored for image *digest*, or None."""
+        key = self._key(kind, digest)
+        payload = self._store.get(key)
+        if payload is not None:
+            data = payload.get("data")
+            if (payload.get("digest") == digest and isinstance(data, str)
+                    and payload.get("sha256") == hashlib.sha256(data.encode()).hexdigest()):
+                self.hits += 1
+                _debug(f"baseline cache hit: {kind} for {digest}")
+                return data
+            _debug(f"baseline cache entry for {kind} {digest} failed its integrity check")
+            self._store.discard(key)
+        self.misses += 1
+        return None
+
+    def put(self, kind: str, digest: str, data: str) -> None:
+        self._store.put(self._key(kind, digest), {
+            "kind": kind,
+            "digest": digest,
+            "sha256": hashlib.sha256(data.encode()).hexdigest(),
+            "data": data,
+        })
+
+
 # ---------------------------------------------------------------------------
 # BaselineResolver — holds nsenter probe cache as instance state
 # ---------------------------------------------------------------------------
@@ -135,11 +402,44 @@ class BaselineResolver:
     executor:
         The executor callable used to run subprocesses.  May be None, in which
         case all podman queries are skipped.
+    cache:
+        Optional ``BaselineCache`` consulted, by image digest, before running
+        the base image.
+    mount_root:
+        The host's root as yoinkc sees it.  When given, images are read
+        through ``podman image mount`` under this root instead of being run;
+        if the mount fails or is not visible, the container run is used.
+    bundle:
+        A pre-exported ``BaselineBundle`` (``--baseline-bundle``).  It answers
+        every query; podman is never run.
+    nsenter:
+        Run podman through nsenter into PID 1's namespaces (the default, for
+        yoinkc running in a container).  ``baseline export`` runs on the
+        machine that has podman and turns this off.
+
+    ``stream_pull`` (default True) lets ``podman pull`` write its layer
+    progress to the terminal.  When the query runs in the background,
+    alongside other output, it is set to False and the pull is reported
+    as one status line before and after.
     """
 
-    def __init__(self, executor) -> None:
+    def __init__(self, executor, cache: Optional[BaselineCache] = None,
+                 mount_root: Optional[Path] = None, bundle: Optional[BaselineBundle] = None,
+                 nsenter: bool = True) -> None:
         self._executor = executor
+        self._cache = cache
+        self._mount_root = mount_root
+        self._bundle = bundle
+        self._nsenter = nsenter
+        self.stream_pull = True
+        self._digests: Dict[str, Optional[str]] = {}
         self._nsenter_available: Optional[bool] = None
+        # Packages and presets queries both check auth and pull the same
+        # image; remember the answers so each probe runs once per run.
+        self._auth_ok: Dict[str, bool] = {}
+        self._available_images: Set[str] = set()
+        # One bundle (or failed attempt) per image per run.
+        self._bundles: Dict[str, Optional[BaselineBundle]] = {}
 
     # ------------------------------------------------------------------
     # nsenter probe
@@ -187,7 +487,10 @@ class BaselineResolver:
         """Run *cmd* via nsenter into PID 1's namespaces.
 
         Returns the RunResult, or None if nsenter is not available.
+        Without nsenter (see the class docstring), *cmd* runs directly.
         """
+        if not self._nsenter:
+            return self._executor(cmd)
         if not self._probe_nsenter():
             return None
         nsenter_cmd = ["nsenter", "-t", "1", "-m", "-u", "-i", "-n", "--"] + cmd
@@ -203,11 +506,15 @@ class BaselineResolver:
 
     def _image_is_cached(self, base_image: str) -> bool:
         """Return True if *base_image* is already present in the local podman store."""
+        if base_image in self._available_images:
+            return True
         result = self._run_on_host(["podman", "image", "exists", base_image])
         if result is None:
             return False
         cached = result.returncode == 0
         _debug(f"image {'cached' if cached else 'not cached'}: {base_image}")
+        if cached:
+            self._available_images.add(base_image)
         return cached
 
     def pull_image(self, base_image: str) -> bool:
@@ -226,42 +533,89 @@ class BaselineResolver:
         # _run_on_host).  This guard handles the case where the probe
         # failed — _image_is_cached returned False because nsenter is
         # unavailable, not because the image is uncached.
-        if not self._probe_nsenter():
+        if self._nsenter and not self._probe_nsenter():
             return False
 
-        print(f"  Pulling baseline image {base_image}\u2026", file=sys.stderr)
-        nsenter_pull = [
-            "nsenter", "-t", "1", "-m", "-u", "-i", "-n", "--",
-            "podman", "pull", base_image,
-        ]
-        _debug(f"pulling: {' '.join(nsenter_pull)}")
+        if self.stream_pull:
+            print(f"  Pulling baseline image {base_image}\u2026", file=sys.stderr)
+        else:
+            _status(f"Pulling baseline image {base_image} in the background\u2026")
+        pull_cmd = ["podman", "pull", base_image]
+        if self._nsenter:
+            pull_cmd = ["nsenter", "-t", "1", "-m", "-u", "-i", "-n", "--"] + pull_cmd
+        _debug(f"pulling: {' '.join(pull_cmd)}")
 
         try:
             result = subprocess.run(
-                nsenter_pull,
-                stderr=None,        # inherit — streams podman's layer progress to terminal
+                pull_cmd,
+                # Inheriting stderr streams podman's layer progress to the terminal.
+                stderr=None if self.stream_pull else subprocess.PIPE,
                 stdout=subprocess.DEVNULL,
                 timeout=_PULL_TIMEOUT_S,
             )
         except subprocess.TimeoutExpired:
-            print(
-                f"  ERROR: podman pull timed out after {_PULL_TIMEOUT_S}s.",
-                file=sys.stderr,
-            )
+            # One write per message so it cannot interleave with other output.
+            print(f"  ERROR: podman pull timed out after {_PULL_TIMEOUT_S}s.\n", end="", file=sys.stderr)
             _debug(f"podman pull timed out after {_PULL_TIMEOUT_S}s")
             return False
         except FileNotFoundError:
-            print("  ERROR: nsenter or podman not found; cannot pull base image.", file=sys.stderr)
+            print("  ERROR: nsenter or podman not found; cannot pull base image.\n", end="", file=sys.stderr)
             _debug("nsenter or podman not found during pull")
             return False
 
         if result.returncode != 0:
-            _debug(f"podman pull failed (rc={result.returncode})")
+            stderr = result.stderr.decode(errors="replace").strip()[-800:] if result.stderr else ""
+            _debug(f"podman pull failed (rc={result.returncode})" + (f": {stderr}" if stderr else ""))
             return False
 
+        if not self.stream_pull:
+            _status(f"Pulled baseline image {base_image}")
         _debug(f"pull succeeded: {base_image}")
+        self._available_images.add(base_image)
         return True
 
+    # ------------------------------------------------------------------
+    # Digest-keyed cache
+    # ------------------------------------------------------------------
+
+    def image_digest(self, base_image: str) -> Optional[str]:
+        """Return *base_image*'s digest: from the local store, else the registry.
+
+        Only successful lookups are remembered, so a digest that could not
+        be read before a pull is looked up again after it.
+        """
+        if "@sha256:" in base_image:
+            return base_image.rsplit("@", 1)[1]
+        if self._digests.get(base_image):
+            return self._digests[base_image]
+        if self._image_is_cached(base_image):
+            cmd = ["podman", "image", "inspect", "--format", "{{.Digest}}", base_image]
+        else:
+            cmd = ["skopeo", "inspect", "--format", "{{.Digest}}", f"docker://{base_image}"]
+        result = self._run_on_host(cmd)
+        if result is None or result.returncode != 0:
+            return None
+        digest = result.stdout.strip()
+        if not digest.startswith("sha256:"):
+            _debug(f"unexpected digest for {base_image}: {digest[:80]!r}")
+            return None
+        _debug(f"{base_image} is {digest}")
+        self._digests[base_image] = digest
+        return digest
+
+    def _cache_get(self, kind: str, base_image: str) -> Optional[str]:
+        if self._cache is None:
+            return None
+        digest = self.image_digest(base_image)
+        return self._cache.get(kind, digest) if digest else None
+
+    def _cache_put(self, kind: str, base_image: str, data: str) -> None:
+        if self._cache is None:
+            return
+        digest = self.image_digest(base_image)
+        if digest:
+            self._cache.put(kind, digest, data)
+
     # ------------------------------------------------------------------
     # Podman queries
     # ------------------------------------------------------------------
@@ -274,6 +628,11 @@ class BaselineResolver:
         """
         if "registry.redhat.io" not in image:
             return True
+        if "registry.redhat.io" not in self._auth_ok:
+            self._auth_ok["registry.redhat.io"] = self._query_registry_auth()
+        return self._auth_ok["registry.redhat.io"]
+
+    def _query_registry_auth(self) -> bool:
         result = self._run_on_host(["podman", "login", "--get-login", "registry.redhat.io"])
         if result is None:
             return False
@@ -293,21 +652,43 @@ class BaselineResolver:
         _debug(f"registry.redhat.io auth OK (logged in as {result.stdout.strip()})")
         return True
 
-    def query_packages(self, base_image: str) -> Optional[Set[str]]:
-        """Run ``podman run --rm <base_image> rpm -qa`` via nsenter.
+    def query_bundle(self, base_image: str) -> Optional[BaselineBundle]:
+        """Extract a ``BaselineBundle`` from *base_image* with one ``podman run``.
 
         Pulls the image first if it is not already cached, so progress is
-        visible to the user.  Returns the set of package names, or None on failure.
+        visible to the user.  With a baseline cache, a stored bundle for the
+        image's digest is used without running the image.  The result is
+        remembered for the rest of the run; returns None on failure.
+        A pre-exported bundle is returned for any image.
         """
+        if self._bundle is not None:
+            return self._bundle
+        if base_image not in self._bundles:
+            self._bundles[base_image] = self._extract_bundle(base_image)
+        return self._bundles[base_image]
+
+    def _extract_bundle(self, base_image: str) -> Optional[BaselineBundle]:
+        cached = self._cache_get("bundle", base_image)
+        if cached is not None:
+            return BaselineBundle.parse(cached)
         if not self._check_registry_auth(base_image):
             return None
         if not self.pull_image(base_image):
             return None
+        # Without skopeo the digest is only readable once the image is local.
+        cached = self._cache_get("bundle", base_image)
+        if cached is not None:
+            return BaselineBundle.parse(cached)
+        if self._mount_root is not None:
+            bundle = self._bundle_from_mount(base_image)
+            if bundle is not None:
+                self._cache_put("bundle", base_image, bundle.to_text())
+                return bundle
         cmd = [
             "podman", "run", "--rm", "--cgroups=disabled", base_image,
-            "rpm", "-qa", "--queryformat", r"%{NAME}\n",
+            "bash", "-c", _BUNDLE_SCRIPT,
         ]
-        _debug(f"querying base image: {' '.join(cmd)}")
+        _debug(f"querying base image: podman run --rm --cgroups=disabled {base_image} bash -c <bundle script>")
         result = self._run_on_host(cmd)
         if result is None:
             return None
@@ -315,48 +696,82 @@ class BaselineResolver:
             _debug(f"podman run failed (rc={result.returncode}): "
                    f"{result.stderr.strip()[:800]}")
             return None
-        names: Set[str] = set()
-        for line in result.stdout.splitlines():
-            name = line.strip()
-            if name:
-                names.add(name)
-        _debug(f"base image has {len(names)} packages")
-        return names
+        bundle = BaselineBundle.parse(result.stdout)
+        if not bundle.packages:
+            _debug(f"base image returned no packages: {result.stderr.strip()[:800]}")
+            return None
+        _debug(f"base image has {len(bundle.packages)} packages, {len(bundle.presets)} preset files, "
+               f"{len(bundle.sysctl)} sysctl files, {len(bundle.unit_files)} unit files, "
+               f"{len(bundle.etc_files)} /etc files")
+        self._cache_put("bundle", base_image, bundle.to_text())
+        return bundle
+
+    def _bundle_from_mount(self, base_image: str) -> Optional[BaselineBundle]:
+        """Read the bundle from ``podman image mount``; None if that does not work."""
+        result = self._run_on_host(["podman", "image", "mount", base_image])
+        if result is None or result.returncode != 0 or not result.stdout.strip():
+            _debug("podman image mount failed"
+                   + (f" (rc={result.returncode}): {result.stderr.strip()[:200]}" if result else ""))
+            return None
+        mountpoint = result.stdout.strip().splitlines()[-1]
+        try:
+            root = Path(self._mount_root) / mountpoint.lstrip("/")
+            if not (root / "usr").is_dir():
+                _debug(f"image mounted at {mountpoint} but not visible under {self._mount_root}")
+                return None
+            bundle = BaselineBundle.from_root(root, self._executor)
+            if bundle is None or not bundle.packages:
+                _debug(f"no rpmdb readable in mounted image at {mountpoint}")
+                return None
+            _debug(f"read base image from mount {mountpoint}: {len(bundle.packages)} packages")
+            return bundle
+        finally:
+            self._run_on_host(["podman", "image", "unmount", base_image])
+
+    def query_packages(self, base_image: str) -> Optional[Set[str]]:
+        """Return the package names in *base_image* (see ``query_bundle``), or None."""
+        bundle = self.query_bundle(base_image)
+        return bundle.package_names if bundle is not None else None
 
     def query_presets(self, base_image: str) -> Optional[str]:
-        """Dump all systemd preset content from the base image via nsenter.
+        """Return all systemd preset content from *base_image* (see ``query_bundle``).
 
-        Checks registry auth, pulls the image if not cached, then queries.
-        Returns the concatenated preset text, or None on failure.
+        Returns the concatenated preset text, or None on failure or when the
+        image ships no presets.
         """
-        if not self._check_registry_auth(base_image):
-            return None
-        if not self.pull_image(base_image):
+        bundle = self.query_bundle(base_image)
+        if bundle is None:
             return None
-        cmd = [
-            "podman", "run", "--rm", "--cgroups=disabled", base_image,
-            "bash", "-c",
-            "cat /usr/lib/systemd/system-preset/*.preset 2>/dev/null || true",
-        ]
-        _debug(f"querying base image presets: {' '.join(cmd)}")
-        result = self._run_on_host(cmd)
-        if result is None:
-            return None
-        if result.returncode != 0:
-            _debug(f"preset query failed (rc={result.returncode}): "
-                   f"{result.stderr.strip()[:200]}")
-            return None
-        text = result.stdout.strip()
-        if not text:
+        text = bundle.preset_text
+        if not text.strip():
             _debug("base image returned no preset data")
             return None
         _debug(f"base image presets: {len(text.splitlines())} lines")
-        return result.stdout
+        return text
 
     # ------------------------------------------------------------------
     # Top-level entry points
     # ------------------------------------------------------------------
 
+    def check_auth(
+        self,
+        os_id: str,
+        version_id: str,
+        baseline_packages_file: Optional[Path] = None,
+        target_version: Optional[str] = None,
+        target_image: Optional[str] = None,
+    ) -> bool:
+        """Run the registry auth check ``resolve`` would run, and nothing else.
+
+        Returns False only when the image ``resolve`` would query needs
+        credentials that are missing, so callers can fail fast before
+        handing ``resolve`` (pull and query) to a background thread.
+        """
+        if self._bundle is not None or self._executor is None or baseline_packages_file:
+            return True
+        image = target_image or select_base_image(os_id, version_id, target_version)[0]
+        return image is None or self._check_registry_auth(image)
+
     def resolve(
         self,
         host_root: Path,
@@ -369,7 +784,16 @@ class BaselineResolver:
         """Resolve the full baseline, handling both ``--target-image`` and auto-detection.
 
         Returns ``(package_names, base_image_ref, no_baseline)``.
+        A pre-exported bundle takes precedence over everything else; its
+        image is the base image unless *target_image* names another.
         """
+        if self._bundle is not None:
+            image = target_image or self._bundle.image
+            if image is None:
+                image, _ = select_base_image(os_id, version_id, target_version)
+            if target_image and self._bundle.image and target_image != self._bundle.image:
+                _debug(f"--target-image {target_image} differs from the bundle's image {self._bundle.image}")
+            return (self._bundle.package_names, image, False)
         if target_image:
             if baseline_packages_file:
                 names = load_baseline_packages_file(baseline_packages_file)
@@ -0,0 +1,136 @@
+"""
+Concurrent, adaptively sized batches of command-line arguments.
+
+Queries that accept many names at once (``dnf repoquery``, ``rpm -qi``,
+``rpm -q --whatprovides``) are split into batches.  ``BatchRunner`` packs
+each batch up to a byte limit derived from the system's ARG_MAX, keeps a
+bounded number of batches in flight, and sizes the next batch from the
+latency observed so far: commands with a high fixed start-up cost (dnf
+loads its metadata every time) grow towards ``target_seconds`` of work per
+call, cheap ones stay small enough to spread over every worker.
+
+Batches are cut only when a slot is free, so later batches benefit from
+what earlier ones measured.  Results come back in item order whatever
+order the batches finish in, so merging them is deterministic.
+"""
+
+import asyncio
+import math
+import os
+import time
+from typing import Awaitable, Callable, List, Sequence, Tuple, TypeVar
+
+from ._util import debug as _debug_fn
+from .executor import DEFAULT_CONCURRENCY
+
+
+def _debug(msg: str) -> None:
+    _debug_fn("batch", msg)
+
+
+T = TypeVar("T")
+
+
+def _arg_max() -> int:
+    try:
+        value = os.sysconf("SC_ARG_MAX")
+    except (AttributeError, ValueError, OSError):
+        value = -1
+    return value if value > 0 else 131072
+
+
+# Bytes of argv a batch may use: half of ARG_MAX, leaving the rest for the
+# environment and for wrappers (nsenter, rpm --root ...) added later.
+ARG_LIMIT = _arg_max() // 2
+
+# Aim for this much wall time per batch once latency has been observed.
+TARGET_SECONDS = 2.0
+
+
+def arg_bytes(args: Sequence[str]) -> int:
+    """Return what *args* cost against ARG_MAX (string, NUL and pointer)."""
+    return sum(len(a.encode()) + 1 + 8 for a in args)
+
+
+class BatchRunner:
+    """Runs a per-batch coroutine over a list of arguments.
+
+    *initial* is the first batch size; later sizes stay between
+    *min_items* and *max_items*.  At most *concurrency* batches run at once.
+    """
+
+    def __init__(
+        self,
+        initial: int = 50,
+        min_items: int = 1,
+        max_items: int = 1000,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        target_seconds: float = TARGET_SECONDS,
+        arg_limit: int = ARG_LIMIT,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        self.min_items = max(1, min_items)
+        self.max_items = max(self.min_items, max_items)
+        self.size = min(max(initial, self.min_items), self.max_items)
+        self.concurrency = concurrency
+        self.target_seconds = target_seconds
+        self.arg_limit = arg_limit
+
+    def _pack(self, items: Sequence[str], start: int, limit: int, budget: int) -> List[str]:
+        """Take up to *limit* items from *start* fitting in *budget* bytes (at least one)."""
+        chunk = [items[start]]
+        used = arg_bytes(chunk)
+        for item in items[start + 1:start + limit]:
+            cost = arg_bytes([item])
+            if used + cost > budget:
+                break
+            chunk.append(item)
+            used += cost
+        return chunk
+
+    def _observe(self, n: int, elapsed: float) -> None:
+        """Move the batch size toward what would take ``target_seconds``."""
+        if n <= 0 or elapsed <= 0:
+            return
+        ideal = self.target_seconds * n / elapsed
+        # Halfway there, and at most double, per observation.
+        new = min((self.size + ideal) / 2, self.size * 2)
+        self.size = int(min(max(new, self.min_items), self.max_items))
+
+    async def run(
+        self,
+        fn: Callable[[List[str]], Awaitable[T]],
+        items: Sequence[str],
+        fixed_args: Sequence[str] = (),
+    ) -> List[Tuple[List[str], T]]:
+        """Call ``fn(batch)`` over *items*; return (batch, result) pairs in item order.
+
+        *fixed_args* is the part of the command every batch repeats, counted
+        against the ARG_MAX budget.
+        """
+        if not items:
+            return []
+        budget = self.arg_limit - arg_bytes(fixed_args)
+        # Never cut so large that some workers would sit idle.
+        spread = max(self.min_items, math.ceil(len(items) / self.concurrency))
+        slots = asyncio.Semaphore(self.concurrency)
+
+        async def _one(chunk: List[str]) -> T:
+            start = time.perf_counter()
+            try:
+                return await fn(chunk)
+            finally:
+                self._observe(len(chunk), time.perf_counter() - start)
+                slots.release()
+
+        tasks: List[Tuple[List[str], "asyncio.Task[T]"]] = []
+        pos = 0
+        while pos < len(items):
+            await slots.acquire()
+            chunk = self._pack(items, pos, min(self.size, spread), budget)
+            tasks.append((chunk, asyncio.ensure_future(_one(chunk))))
+            pos += len(chunk)
+        results = await asyncio.gather(*(t for _, t in tasks))
+        _debug(f"{len(items)} items in {len(tasks)} batches (next size {self.size})")
+        return [(chunk, result) for (chunk, _), result in zip(tasks, results)]
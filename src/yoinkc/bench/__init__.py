@@ -0,0 +1,14 @@
+"""Synthetic hosts and an end-to-end scaling benchmark for yoinkc."""
+
+from .harness import run_benchmark, run_scale
+from .synthetic import SCALES, HostShape, SyntheticExecutor, SyntheticHost, build_host
+
+__all__ = [
+    "SCALES",
+    "HostShape",
+    "SyntheticExecutor",
+    "SyntheticHost",
+    "build_host",
+    "run_benchmark",
+    "run_scale",
+]
@@ -0,0 +1,27 @@
+"""Entry point for yoinkc-bench CLI."""
+
+import sys
+from typing import Optional
+
+from .cli import parse_args
+from .harness import run_benchmark, write_report
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+
+    report = run_benchmark(
+        args.scales,
+        repeat=args.repeat,
+        jobs=args.jobs,
+        latency_ms=args.latency_ms,
+        workdir=args.workdir,
+        isolate=not args.no_isolate,
+    )
+    write_report(report, args.output)
+    print(f"Benchmark results written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""CLI for yoinkc-bench."""
+
+import argparse
+from pathlib import Path
+from typing import Optional
+
+from .synthetic import SCALES
+
+
+def _scale_list(value: str) -> list[str]:
+    """argparse type for a comma-separated list of scale names."""
+    names = [v.strip() for v in value.split(",") if v.strip()]
+    unknown = [n for n in names if n not in SCALES]
+    if unknown or not names:
+        raise argparse.ArgumentTypeError(
+            f"unknown scale(s): {', '.join(unknown) or value!r} (valid: {', '.join(SCALES)})"
+        )
+    return names
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="yoinkc-bench",
+        description="Benchmark yoinkc inspection and rendering on synthetic hosts.",
+    )
+    parser.add_argument(
+        "--scales",
+        type=_scale_list,
+        default=["small", "medium", "large"],
+        metavar="NAMES",
+        help=f"Comma-separated host scales to run (default: small,medium,large; "
+             f"valid: {', '.join(SCALES)})",
+    )
+    parser.add_argument(
+        "-n", "--repeat",
+        type=int,
+        default=3,
+        metavar="N",
+        help="Runs per scale; the fastest is reported as best (default: 3)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Inspector concurrency passed to run_all (default: yoinkc's default)",
+    )
+    parser.add_argument(
+        "--latency-ms",
+        type=float,
+        default=None,
+        metavar="MS",
+        help="Simulated cost of every command, overriding each scale's setting",
+    )
+    parser.add_argument(
+        "--workdir",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Generate hosts and outputs under DIR and keep them (default: a temp dir)",
+    )
+    parser.add_argument(
+        "--no-isolate",
+        action="store_true",
+        help="Run every scale in this process (peak RSS becomes cumulative)",
+    )
+    parser.add_argument(
+        "-o", "--output",
+        type=Path,
+        default=Path("bench-results.json"),
+        metavar="FILE",
+        help="Write results as JSON to FILE (default: bench-results.json)",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+    if args.jobs is not None and args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.latency_ms is not None and args.latency_ms < 0:
+        parser.error("--latency-ms cannot be negative")
+
+    return args
@@ -0,0 +1,132 @@
+"""
+End-to-end scaling benchmark: run_all plus the renderers on synthetic hosts.
+
+Each scale runs in a fresh interpreter so its peak RSS is not inflated by
+earlier (larger) runs.  Within a scale the host is generated once and the
+pipeline — inspect, redact, serialize, render — is timed *repeat* times;
+the fastest run is reported alongside every run's timings and the
+per-inspector perf table of the fastest run.
+"""
+
+import json
+import multiprocessing
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .. import __version__
+from ..perf import _peak_rss_kb
+from .synthetic import SCALES, HostShape, build_host
+
+
+_PHASES = ("inspect_s", "redact_s", "serialize_s", "render_s", "total_s")
+
+
+def run_scale(
+    name: str,
+    shape: HostShape,
+    repeat: int = 3,
+    jobs: Optional[int] = None,
+    workdir: Optional[Path] = None,
+) -> dict:
+    """Benchmark one host shape in this process and return its result dict."""
+    from ..inspectors import DEFAULT_JOBS, run_all
+    from ..pipeline import save_snapshot
+    from ..redact import redact_snapshot
+    from ..renderers import run_all as render_all
+
+    with tempfile.TemporaryDirectory(prefix=f"yoinkc-bench-{name}-") as tmp:
+        base = Path(workdir) / name if workdir else Path(tmp)
+        t0 = time.perf_counter()
+        host = build_host(base / "host", shape, hostname=f"bench-{name}")
+        generate_s = time.perf_counter() - t0
+
+        runs: List[dict] = []
+        best_perf: dict = {}
+        calls = 0
+        for i in range(repeat):
+            executor = host.executor()
+            t0 = time.perf_counter()
+            snapshot = run_all(
+                host.root, executor=executor,
+                baseline_packages_file=host.baseline_file,
+                jobs=DEFAULT_JOBS if jobs is None else jobs,
+            )
+            t1 = time.perf_counter()
+            snapshot = redact_snapshot(snapshot)
+            t2 = time.perf_counter()
+            out = base / f"out-{i}"
+            save_snapshot(snapshot, out / "inspection-snapshot.json")
+            t3 = time.perf_counter()
+            render_all(snapshot, out)
+            t4 = time.perf_counter()
+            run = {k: round(v, 4) for k, v in
+                   zip(_PHASES, (t1 - t0, t2 - t1, t3 - t2, t4 - t3, t4 - t0))}
+            runs.append(run)
+            if run["total_s"] <= min(r["total_s"] for r in runs):
+                best_perf = {k: v for k, v in snapshot.meta.get("perf", {}).items()
+                             if k in ("inspectors", "renderers", "commands")}
+                calls = executor.calls
+
+    return {
+        "scale": name,
+        "shape": shape.to_dict(),
+        "generate_s": round(generate_s, 4),
+        "runs": runs,
+        "best": min(runs, key=lambda r: r["total_s"]),
+        "median_total_s": round(statistics.median(r["total_s"] for r in runs), 4),
+        "peak_rss_kb": _peak_rss_kb(),
+        "commands": calls,
+        "perf": best_perf,
+    }
+
+
+def run_benchmark(
+    scales: Iterable[str],
+    repeat: int = 3,
+    jobs: Optional[int] = None,
+    latency_ms: Optional[float] = None,
+    workdir: Optional[Path] = None,
+    isolate: bool = True,
+) -> dict:
+    """Benchmark each named scale and return the full report.
+
+    With *isolate* (the default) every scale runs in a fresh child process;
+    otherwise all run in this one and ``peak_rss_kb`` is cumulative.
+    """
+    results: List[dict] = []
+    for name in scales:
+        shape = SCALES[name]
+        if latency_ms is not None:
+            shape = replace(shape, command_latency_ms=latency_ms)
+        print(f"bench: {name} ...", file=sys.stderr)
+        if isolate:
+            ctx = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+                result = pool.submit(run_scale, name, shape, repeat, jobs, workdir).result()
+        else:
+            result = run_scale(name, shape, repeat, jobs, workdir)
+        print(f"bench: {name}: best {result['best']['total_s']:.3f}s, "
+              f"peak RSS {result['peak_rss_kb'] // 1024} MiB", file=sys.stderr)
+        results.append(result)
+    return {
+        "yoinkc": __version__,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def write_report(report: Dict, path: Path) -> None:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2) + "\n")
@@ -0,0 +1,414 @@
+"""
+Synthetic host roots with a parameterized shape, plus a matching executor.
+
+``build_host`` lays out a fake RHEL 9 filesystem under a directory: package
+config files (some "modified"), unowned /etc files, deep /opt application
+trees with fake ELF binaries, venvs, lockfiles, cron jobs and systemd
+units.  ``SyntheticExecutor`` answers the commands the inspectors run
+(the bulk rpmdb query, rpm -qa/-qR/-Va/--whatprovides, dnf repoquery,
+systemctl, readelf, file, pip) consistently with that layout, so
+``run_all`` sees a coherent host of any size without touching the real
+system.
+
+Packages form a DAG: package *i* requires ``deps_per_package`` packages
+with lower indices, so dependency walks have realistic fan-out.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from ..executor import RunResult, strip_wrappers
+
+
+@dataclass(frozen=True)
+class HostShape:
+    """Size parameters for a synthetic host."""
+
+    packages: int = 500
+    # Fraction of packages that are also in the base image (not "added").
+    base_fraction: float = 0.6
+    deps_per_package: int = 3
+    # Package config files reported as modified by rpm -Va.
+    modified_configs: int = 50
+    unowned_files: int = 200
+    unowned_file_bytes: int = 512
+    opt_apps: int = 10
+    opt_depth: int = 4
+    binaries_per_app: int = 5
+    usr_local_binaries: int = 20
+    venvs: int = 3
+    venv_packages: int = 20
+    lockfiles: int = 5
+    cron_jobs: int = 20
+    systemd_units: int = 100
+    # Simulated cost of every command, in milliseconds.
+    command_latency_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# Named shapes used by the benchmark harness.
+SCALES: Dict[str, HostShape] = {
+    "small": HostShape(packages=300, modified_configs=20, unowned_files=100, opt_apps=5,
+                       usr_local_binaries=10, venvs=2, lockfiles=2, cron_jobs=10,
+                       systemd_units=50),
+    "medium": HostShape(),
+    "large": HostShape(packages=2000, modified_configs=200, unowned_files=2000, opt_apps=40,
+                       opt_depth=6, usr_local_binaries=100, venvs=10, venv_packages=50,
+                       lockfiles=20, cron_jobs=100, systemd_units=500),
+    "xlarge": HostShape(packages=5000, modified_configs=500, unowned_files=10000,
+                        unowned_file_bytes=2048, opt_apps=100, opt_depth=8,
+                        usr_local_binaries=300, venvs=25, venv_packages=80, lockfiles=50,
+                        cron_jobs=300, systemd_units=1500),
+}
+
+_OS_RELEASE = """NAME="Red Hat Enterprise Linux"
+VERSION="9.6 (Plow)"
+ID="rhel"
+ID_LIKE="fedora"
+VERSION_ID="9.6"
+PRETTY_NAME="Red Hat Enterprise Linux 9.6 (Plow)"
+"""
+
+# Enough of an ELF header for `file`-style sniffing; readelf output comes
+# from the executor.
+_ELF_STUB = b"\x7fELF\x02\x01\x01" + b"\x00" * 57
+
+
+def _pkg(i: int) -> str:
+    return f"synth-pkg{i:05d}"
+
+
+@dataclass
+class SyntheticHost:
+    """A generated host: its root, baseline file and shape."""
+
+    root: Path
+    baseline_file: Path
+    shape: HostShape
+
+    def executor(self) -> "SyntheticExecutor":
+        return SyntheticExecutor(self)
+
+
+def build_host(workdir: Path, shape: HostShape, hostname: str = "synthetic") -> SyntheticHost:
+    """Create a synthetic host root under *workdir* and return it.
+
+    The host root is ``workdir/root``; the base image package list (for
+    ``--baseline-packages``) is ``workdir/base-packages.txt``.
+    """
+    workdir = Path(workdir)
+    root = workdir / "root"
+    etc = root / "etc"
+    _write(etc / "os-release", _OS_RELEASE)
+    _write(etc / "hostname", f"{hostname}\n")
+    (root / "var/lib/rpm").mkdir(parents=True, exist_ok=True)
+
+    n_base = int(shape.packages * shape.base_fraction)
+    baseline_file = workdir / "base-packages.txt"
+    baseline_file.write_text("".join(f"{_pkg(i)}\n" for i in range(n_base)))
+
+    # Files every package ships, plus its config file for the first
+    # modified_configs packages — all of which are edited.
+    uid = os.getuid()
+    _write(etc / "passwd", "root:x:0:0:root:/root:/bin/bash\n"
+           + (f"bench:x:{uid}:{os.getgid()}::/:/sbin/nologin\n" if uid else ""))
+    _write(etc / "group", "root:x:0:\n" + (f"bench:x:{os.getgid()}:\n" if uid else ""))
+    for i in range(shape.packages):
+        _write(root / "usr/bin" / _pkg(i), f"#!/bin/sh\necho {_pkg(i)}\n")
+        _write(root / "usr/share/doc" / _pkg(i) / "README", f"{_pkg(i)}\n")
+    for i in range(min(shape.modified_configs, shape.packages)):
+        _write(etc / _pkg(i) / f"{_pkg(i)}.conf", f"# modified config for {_pkg(i)}\nkey = {i}\n")
+
+    filler = ("x" * 63 + "\n") * max(1, shape.unowned_file_bytes // 64)
+    for i in range(shape.unowned_files):
+        _write(etc / "synthetic" / f"app{i % 50:02d}" / f"file{i:05d}.conf",
+               f"# unowned {i}\n" + filler)
+
+    for i in range(shape.opt_apps):
+        d = root / "opt" / f"app{i:03d}"
+        for level in range(shape.opt_depth):
+            d = d / f"lvl{level}"
+            _write(d / "README", f"level {level}\n")
+        for b in range(shape.binaries_per_app):
+            _write_bytes(d / "bin" / f"svc{b:03d}", _ELF_STUB)
+
+    for b in range(shape.usr_local_binaries):
+        _write_bytes(root / "usr/local/bin" / f"tool{b:04d}", _ELF_STUB)
+
+    for v in range(shape.venvs):
+        venv = root / "opt" / f"venv{v:03d}"
+        _write(venv / "pyvenv.cfg", "home = /usr/bin\ninclude-system-site-packages = false\n")
+        sp = venv / "lib/python3.9/site-packages"
+        for p in range(shape.venv_packages):
+            _write(sp / f"synthpy{p:03d}-1.{p}.0.dist-info" / "METADATA",
+                   f"Name: synthpy{p:03d}\nVersion: 1.{p}.0\n")
+
+    for n in range(shape.lockfiles):
+        d = root / "srv" / f"node{n:03d}"
+        _write(d / "package.json", json.dumps({"name": f"node{n}", "version": "1.0.0"}))
+        _write(d / "package-lock.json", json.dumps({
+            "name": f"node{n}", "lockfileVersion": 3,
+            "packages": {f"node_modules/dep{k}": {"version": f"1.{k}.0"} for k in range(20)},
+        }))
+
+    for c in range(shape.cron_jobs):
+        _write(etc / "cron.d" / f"synth-job{c:04d}",
+               f"*/{c % 30 + 1} * * * * root /usr/local/bin/tool{c % max(1, shape.usr_local_binaries):04d}\n")
+
+    units = etc / "systemd/system"
+    wants = units / "multi-user.target.wants"
+    wants.mkdir(parents=True, exist_ok=True)
+    for u in range(shape.systemd_units):
+        name = f"synth-unit{u:04d}.service"
+        _write(units / name, (
+            f"[Unit]\nDescription=Synthetic unit {u}\n\n"
+            f"[Service]\nExecStart=/usr/local/bin/tool{u:04d}\n\n"
+            "[Install]\nWantedBy=multi-user.target\n"
+        ))
+        if u % 2 == 0:
+            link = wants / name
+            if not link.is_symlink():
+                os.symlink(f"../{name}", link)
+
+    return SyntheticHost(root=root, baseline_file=baseline_file, shape=shape)
+
+
+def _write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+
+
+def _ok(stdout: str = "") -> RunResult:
+    return RunResult(stdout=stdout, stderr="", returncode=0)
+
+
+def _fail(stderr: str = "unknown command", rc: int = 1) -> RunResult:
+    return RunResult(stdout="", stderr=stderr, returncode=rc)
+
+
+class SyntheticExecutor:
+    """Answers inspector commands consistently with a ``SyntheticHost``.
+
+    ``calls`` counts every command received, for the benchmark report.
+    """
+
+    def __init__(self, host: SyntheticHost) -> None:
+        self.host = host
+        shape = host.shape
+        self._latency = shape.command_latency_ms / 1000.0
+        self._names = [_pkg(i) for i in range(shape.packages)]
+        self._index = {n: i for i, n in enumerate(self._names)}
+        self._closure: Dict[int, Set[int]] = {}
+        self._handlers = {
+            "rpm": self._rpm,
+            "dnf": self._dnf,
+            "systemctl": self._systemctl,
+            "readelf": self._readelf,
+            "file": self._file,
+            "pip": self._pip,
+        }
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    # -- package graph -------------------------------------------------
+
+    def _requires(self, i: int) -> List[int]:
+        k = self.host.shape.deps_per_package
+        return sorted({(i * 7919 + j * 104729) % i for j in range(k)}) if i else []
+
+    def _transitive(self, i: int) -> Set[int]:
+        if i not in self._closure:
+            # Dependencies always have lower indices, so an ascending fill
+            # never recurses deeply.
+            for j in range(len(self._closure), i + 1):
+                if j in self._closure:
+                    continue
+                out: Set[int] = set()
+                for d in self._requires(j):
+                    out.add(d)
+                    out |= self._closure[d]
+                self._closure[j] = out
+        return self._closure[i]
+
+    def _owned_files(self) -> str:
+        lines = []
+        for i, name in enumerate(self._names):
+            lines.append(f"/usr/bin/{name}")
+            lines.append(f"/usr/share/doc/{name}/README")
+            if i < self.host.shape.modified_configs:
+                lines.append(f"/etc/{name}")
+                lines.append(f"/etc/{name}/{name}.conf")
+        return "\n".join(lines) + "\n"
+
+    def _database(self) -> str:
+        """Output of the bulk query behind ``yoinkc.rpmdb.RpmDatabase``.
+
+        File metadata is read from the generated tree, so native
+        verification finds exactly the edited configs modified.
+        """
+        root = self.host.root
+        lines = []
+        for i, name in enumerate(self._names):
+            lines.append(f"P\t(none)\t{name}\t1.0\t1.el9\tx86_64\t8")
+            files = [(0, f"/usr/bin/{name}"), (2, f"/usr/share/doc/{name}/README")]
+            if i < self.host.shape.modified_configs:
+                files += [(0, f"/etc/{name}"), (17, f"/etc/{name}/{name}.conf")]
+            for flags, path in files:
+                full = root / path.lstrip("/")
+                st = full.lstat()
+                size, mtime = st.st_size, int(st.st_mtime)
+                digest = ""
+                if full.is_file():
+                    data = full.read_bytes()
+                    if flags & 1:
+                        # The packaged default the edited copy replaced.
+                        data = f"# default config for {name}\nkey = 0\n".encode()
+                        size, mtime = len(data), mtime - 3600
+                    digest = hashlib.sha256(data).hexdigest()
+                owner = "root" if st.st_uid == 0 else "bench"
+                group = "root" if st.st_gid == 0 else "bench"
+                lines.append(f"F\t{flags}\t-1\t0\t{size}\t{st.st_mode}\t{mtime}\t{digest}"
+                             f"\t{owner}\t{group}\t\t{path}")
+            lines += [f"R\t{self._names[d]}" for d in self._requires(i)]
+            lines += ["R\trpmlib(CompressedFileNames)", "R\t/bin/sh", f"V\t{name}"]
+        return "\n".join(lines) + "\n"
+
+    # -- dispatch --------------------------------------------------------
+
+    def __call__(self, cmd: List[str], *, cwd: Optional[str] = None) -> RunResult:
+        with self._lock:
+            self.calls += 1
+        if self._latency:
+            time.sleep(self._latency)
+        args = strip_wrappers(cmd)
+        if not args:
+            return _fail()
+        handler = self._handlers.get(os.path.basename(args[0]))
+        if handler is None:
+            return _fail()
+        return handler(args)
+
+    @staticmethod
+    def _queryformat(args: List[str]) -> str:
+        if "--queryformat" in args:
+            return args[args.index("--queryformat") + 1]
+        return ""
+
+    @staticmethod
+    def _operands(args: List[str]) -> List[str]:
+        """Positional arguments after rpm/dnf options and their values."""
+        takes_value = {"--dbpath", "--root", "--define", "--queryformat", "--installroot"}
+        out, skip = [], False
+        for a in args[1:]:
+            if skip:
+                skip = False
+                continue
+            if a in takes_value:
+                skip = True
+                continue
+            if a.startswith("-"):
+                continue
+            out.append(a)
+        return out
+
+    def _rpm(self, args: List[str]) -> RunResult:
+        qf = self._queryformat(args)
+        if "-Va" in args:
+            return _ok("".join(
+                f"S.5....T.  c /etc/{n}/{n}.conf\n"
+                for n in self._names[:self.host.shape.modified_configs]
+            ))
+        if "-qa" in args:
+            if qf.startswith("P\\t"):
+                return _ok(self._database())
+            if "FILENAMES" in qf:
+                return _ok(self._owned_files())
+            if "SHA1HEADER" in qf:
+                return _ok("".join(hashlib.sha1(n.encode()).hexdigest() + "\n" for n in self._names))
+            if "EPOCH" in qf:
+                return _ok("".join(f"0:{n}-1.0-1.el9.x86_64\n" for n in self._names))
+            return _ok("".join(f"{n}\n" for n in self._names))
+        if "-qR" in args:
+            out = ["rpmlib(CompressedFileNames) <= 3.0.4-1", "/bin/sh"]
+            for name in self._operands(args):
+                i = self._index.get(name)
+                if i is None:
+                    return _fail(f"package {name} is not installed")
+                out += [self._names[d] for d in self._requires(i)]
+            return _ok("\n".join(out) + "\n")
+        if "--whatprovides" in args:
+            caps = self._operands(args)
+            return _ok("".join(
+                f"{c}-1.0-1.el9.x86_64\n" if c in self._index else f"no package provides {c}\n"
+                for c in caps
+            ))
+        if "-qf" in args:
+            return _fail("file is not owned by any package")
+        if "-qi" in args:
+            return _ok("".join(f"Name        : {n}\nFrom repo   : appstream\n"
+                               for n in self._operands(args)))
+        return _fail()
+
+    def _dnf(self, args: List[str]) -> RunResult:
+        if "repoquery" not in args:
+            return _fail()
+        if "--userinstalled" in args:
+            n_base = int(len(self._names) * self.host.shape.base_fraction)
+            return _ok("".join(f"{n}\n" for n in self._names[n_base::4]))
+        names = [a for a in self._operands(args) if a in self._index]
+        if "--requires" in args:
+            out = set()
+            for name in names:
+                out |= self._transitive(self._index[name])
+            return _ok("".join(f"{self._names[d]}\n" for d in sorted(out)))
+        if "--installed" in args:
+            return _ok("".join(f"{n} appstream\n" for n in names))
+        return _fail()
+
+    def _systemctl(self, args: List[str]) -> RunResult:
+        if "list-unit-files" not in args:
+            return _fail()
+        return _ok("".join(
+            f"synth-unit{u:04d}.service {'enabled' if u % 2 == 0 else 'disabled'} enabled\n"
+            for u in range(self.host.shape.systemd_units)
+        ))
+
+    def _readelf(self, args: List[str]) -> RunResult:
+        if "--version" in args:
+            return _ok("GNU readelf (GNU Binutils) 2.35.2\n")
+        path = args[-1]
+        go = path.endswith("0")
+        if "-S" in args:
+            sections = ".text .data .bss" + (" .note.go.buildid .gopclntab" if go else "")
+            return _ok("Section Headers:\n" + "".join(f"  [ 1] {s} PROGBITS\n" for s in sections.split()))
+        if "-d" in args:
+            if go:
+                return _ok("There is no dynamic section in this file.\n")
+            return _ok(" 0x0000000000000001 (NEEDED)  Shared library: [libc.so.6]\n")
+        return _fail()
+
+    def _file(self, args: List[str]) -> RunResult:
+        if "--version" in args:
+            return _ok("file-5.39\n")
+        return _ok("ELF 64-bit LSB executable, x86-64\n")
+
+    def _pip(self, args: List[str]) -> RunResult:
+        if "list" not in args:
+            return _fail()
+        n = self.host.shape.venv_packages
+        return _ok("Package    Version\n---------- -------\n" + "".join(
+            f"synthpy{p:03d} 1.{p}.0\n" for p in range(n)
+        ))
@@ -0,0 +1,261 @@
+"""
+On-disk cache of inspector results for incremental re-inspection.
+
+Each cacheable inspector declares its inputs as ``CACHE_INPUTS``: paths
+relative to host_root (files or directory trees) plus the ``RPMDB`` marker
+for the installed-package database.  A section's cache key combines a cheap
+fingerprint of those inputs — (path, inode, size, mtime) for every file and
+directory under each input, and the rpmdb cookie — with the inspector's
+options and the results it consumed from other inspectors.  Nothing is
+read or hashed beyond stat() and one rpm header query, so fingerprinting an
+unchanged host is far cheaper than re-running the inspectors.
+
+Entries are gzip'd JSON files.  The directory is bounded by total size;
+when it grows past the limit the least recently used entries are evicted.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+
+from . import __version__, deadline as _deadline
+from ._util import debug as _debug_fn, run_rpm_query
+from .executor import Executor
+from .schema import SCHEMA_VERSION
+
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+
+def _debug(msg: str) -> None:
+    _debug_fn("cache", msg)
+
+
+# Marker in CACHE_INPUTS for the installed-package database.
+RPMDB = "@rpmdb"
+
+# dnf (4) and libdnf5 history/state locations; shared by inspectors that
+# read transaction history or install reasons.
+DNF_HISTORY = ("var/lib/dnf", "usr/lib/sysimage/libdnf5")
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class Fingerprinter:
+    """Computes and memoizes input fingerprints for one inspection run."""
+
+    def __init__(self, host_root: Path, executor: Optional[Executor]) -> None:
+        self._host_root = Path(host_root)
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._memo: Dict[str, str] = {}
+
+    def _rpmdb_cookie(self) -> str:
+        """Digest of every installed header's SHA1, like dnf's rpmdb version.
+
+        Changes whenever a package is installed, removed or updated.
+        """
+        if self._executor is None:
+            return "no-executor"
+        result = run_rpm_query(self._executor, self._host_root,
+                               ["-qa", "--queryformat", r"%{SHA1HEADER}\n"])
+        if result.returncode != 0:
+            # Unreadable rpmdb: make the key unique so nothing is reused.
+            return f"unavailable-{os.urandom(8).hex()}"
+        return hashlib.sha256("\n".join(sorted(result.stdout.split())).encode()).hexdigest()
+
+    def _tree(self, rel: str) -> str:
+        """Digest of (path, mode, inode, size, mtime) for *rel* and everything below it."""
+        digest = hashlib.sha256()
+        root = str(self._host_root / rel)
+        try:
+            st = os.lstat(root)
+        except OSError:
+            return "missing"
+        digest.update(f"{root}:{st.st_mode}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}\n".encode())
+        stack = [root]
+        while stack:
+            d = stack.pop()
+            try:
+                with os.scandir(d) as it:
+                    entries = sorted(it, key=lambda e: e.name)
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    st = entry.stat(follow_symlinks=False)
+                except OSError:
+                    continue
+                digest.update(
+                    f"{entry.path}:{st.st_mode}:{st.st_ino}:{st.st_size}:{st.st_mtime_ns}\n".encode()
+                )
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+        return digest.hexdigest()
+
+    def fingerprint(self, inputs: Iterable[str]) -> str:
+        parts = []
+        for item in inputs:
+            with self._lock:
+                cached = self._memo.get(item)
+            if cached is None:
+                cached = self._rpmdb_cookie() if item == RPMDB else self._tree(item)
+                with self._lock:
+                    self._memo[item] = cached
+            parts.append(f"{item}={cached}")
+        return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class ResultCache:
+    """Size-bounded LRU store of JSON payloads keyed by hex digest."""
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json.gz"
+
+    def get(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as fh:
+                payload = json.load(fh)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            _debug(f"discarding unreadable entry {path.name}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return payload
+
+    def discard(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    def put(self, key: str, payload: dict) -> None:
+        path = self._path(key)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}")
+        try:
+            with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+                json.dump(payload, fh, separators=(",", ":"))
+            os.replace(tmp, path)
+        except OSError as exc:
+            _debug(f"cannot write {path.name}: {exc}")
+            tmp.unlink(missing_ok=True)
+            return
+        self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the store fits max_bytes."""
+        with self._lock:
+            entries = []
+            for p in self.root.glob("*.json.gz"):
+                try:
+                    st = p.stat()
+                except OSError:
+                    continue
+                entries.append((st.st_mtime_ns, st.st_size, p))
+            total = sum(size for _, size, _ in entries)
+            for _, size, p in sorted(entries, key=lambda e: e[0]):
+                if total <= self.max_bytes:
+                    break
+                _debug(f"evicting {p.name} ({size} bytes)")
+                p.unlink(missing_ok=True)
+                total -= size
+
+
+def cache_key(section: str, fingerprint: str, extra: object) -> str:
+    """Build the cache key for *section* from its input fingerprint and options."""
+    material = json.dumps(
+        {
+            "section": section,
+            "yoinkc": __version__,
+            "schema": SCHEMA_VERSION,
+            "inputs": fingerprint,
+            "extra": extra,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode()).hexdigest()
+
+
+class SectionCache:
+    """Fingerprint-keyed cache of inspector sections for one run.
+
+    ``lookup`` returns a cached section when the inputs and options are
+    unchanged, otherwise runs *compute* and stores its result (unless the
+    time budget ran out).  Hits and misses are recorded for
+    ``snapshot.meta["cache"]``.
+    """
+
+    def __init__(self, store: ResultCache, fingerprinter: Fingerprinter) -> None:
+        self._store = store
+        self._fingerprinter = fingerprinter
+        self._lock = threading.Lock()
+        self.hits: List[str] = []
+        self.misses: List[str] = []
+
+    def lookup(
+        self,
+        section: str,
+        inputs: Iterable[str],
+        extra: object,
+        compute: Callable[[], T],
+        warnings: list,
+        dump: Callable[[T], object],
+        load: Callable[[object], T],
+    ) -> T:
+        key = cache_key(section, self._fingerprinter.fingerprint(inputs), extra)
+        payload = self._store.get(key)
+        if payload is not None:
+            try:
+                result = load(payload["result"])
+            except (KeyError, TypeError, ValueError) as exc:
+                _debug(f"{section}: stale entry ignored: {exc}")
+            else:
+                warnings.extend(payload.get("warnings", []))
+                self._record(self.hits, section)
+                _debug(f"{section}: hit")
+                return result
+        start = len(warnings)
+        result = compute()
+        self._record(self.misses, section)
+        _debug(f"{section}: miss")
+        # None means the inspector failed outright; retry next run.  Nothing
+        # computed after --time-budget ran out is stored, since it (or an
+        # input it consumed) may be partial.
+        if result is not None and not _deadline.exhausted():
+            self._store.put(key, {"result": dump(result), "warnings": warnings[start:]})
+        return result
+
+    def _record(self, bucket: List[str], section: str) -> None:
+        with self._lock:
+            bucket.append(section)
+
+    def to_dict(self) -> dict:
+        """Return hit/miss data in the shape stored in ``meta["cache"]``."""
+        with self._lock:
+            return {
+                "dir": str(self._store.root),
+                "hits": sorted(self.hits),
+                "misses": sorted(self.misses),
+            }
+
+
+def model_section(model: Type[M]) -> Tuple[Callable[[M], object], Callable[[object], M]]:
+    """Return (dump, load) callables for a pydantic section model."""
+    return (lambda section: section.model_dump(mode="json")), model.model_validate
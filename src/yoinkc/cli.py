@@ -6,6 +6,50 @@ import argparse
 from pathlib import Path
 from typing import Optional
 
+from .cache import DEFAULT_MAX_BYTES as _DEFAULT_CACHE_MAX_BYTES
+from .inspectors import DEFAULT_JOBS, SECTIONS
+from .verify import DEFAULT_SCOPE as _DEFAULT_VERIFY_SCOPE, SCOPES as _VERIFY_SCOPES
+
+DEFAULT_CACHE_MAX_MB = _DEFAULT_CACHE_MAX_BYTES // (1024 * 1024)
+
+
+def _section_list(value: str) -> list[str]:
+    """argparse type for a comma-separated list of snapshot section names."""
+    names = [v.strip() for v in value.split(",") if v.strip()]
+    unknown = [n for n in names if n not in SECTIONS]
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown section(s): {', '.join(unknown)} (valid: {', '.join(SECTIONS)})"
+        )
+    return names
+
+
+def parse_baseline_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    """Parse ``yoinkc baseline ...`` (everything after ``baseline``)."""
+    parser = argparse.ArgumentParser(
+        prog="yoinkc baseline",
+        description="Manage pre-exported base image baselines for air-gapped hosts.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export = sub.add_parser(
+        "export",
+        help="Write a baseline bundle for IMAGE, for use with --baseline-bundle",
+    )
+    export.add_argument("image", metavar="IMAGE", help="bootc base image reference")
+    export.add_argument(
+        "-o", "--output",
+        type=Path,
+        metavar="FILE",
+        help="Output path (default: IMAGE-NAME.baseline.json.gz in cwd)",
+    )
+    export.add_argument(
+        "--mount",
+        action="store_true",
+        help="Read the image through 'podman image mount' instead of running it",
+    )
+    return parser.parse_args(argv)
+
 
 def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -78,6 +122,13 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         help="Path to a newline-separated list of package names for air-gapped "
              "environments where the base image cannot be queried via podman.",
     )
+    parser.add_argument(
+        "--baseline-bundle",
+        type=Path,
+        metavar="FILE",
+        help="Use a bundle written by 'yoinkc baseline export' (packages, presets, "
+             "sysctl defaults, config file digests); no podman or network access needed",
+    )
     parser.add_argument(
         "--no-baseline",
         action="store_true",
@@ -102,6 +153,127 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
         help="Connect to podman socket to enumerate running containers",
     )
 
+    parser.add_argument(
+        "--verify-scope",
+        choices=_VERIFY_SCOPES,
+        default=_DEFAULT_VERIFY_SCOPE,
+        metavar="SCOPE",
+        help="Packaged files to check for modifications: etc (files under /etc), "
+             "config (%%config files) or all (default, like rpm -Va)",
+    )
+
+    parser.add_argument(
+        "--verify-jobs",
+        type=int,
+        metavar="N",
+        help="Verify packaged files with N parallel workers (default: one per "
+             "CPU, up to 8). Without a readable rpmdb, also splits rpm -V into "
+             "N concurrent shards instead of one rpm -Va",
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        default=DEFAULT_JOBS,
+        help="Run up to N independent inspectors concurrently "
+             f"(default: {DEFAULT_JOBS}; 1 runs them sequentially)",
+    )
+
+    parser.add_argument(
+        "--only",
+        type=_section_list,
+        metavar="SECTIONS",
+        help="Inspect only these comma-separated sections (plus anything they "
+             f"depend on). Valid: {', '.join(SECTIONS)}",
+    )
+    parser.add_argument(
+        "--skip",
+        type=_section_list,
+        metavar="SECTIONS",
+        help="Do not inspect these comma-separated sections",
+    )
+
+    parser.add_argument(
+        "--time-budget",
+        type=float,
+        metavar="SECONDS",
+        help="Stop inspecting after SECONDS and keep partial results; "
+             "truncated sections are flagged in the reports and Containerfile",
+    )
+
+    # Machine-readable progress for orchestration
+    progress = parser.add_mutually_exclusive_group()
+    progress.add_argument(
+        "--progress-fd",
+        type=int,
+        metavar="FD",
+        help="Write JSONL progress events (inspector start/finish, batch "
+             "counts, command durations) to file descriptor FD",
+    )
+    progress.add_argument(
+        "--progress-file",
+        type=Path,
+        metavar="FILE",
+        help="Write JSONL progress events to FILE",
+    )
+
+    # Incremental re-inspection
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        metavar="DIR",
+        help="Cache inspector results in DIR and reuse sections whose inputs "
+             "(files, rpmdb) are unchanged since a previous run",
+    )
+    parser.add_argument(
+        "--cache-max-size",
+        type=int,
+        metavar="MB",
+        default=DEFAULT_CACHE_MAX_MB,
+        help="Evict least recently used cache entries beyond MB megabytes "
+             f"(default: {DEFAULT_CACHE_MAX_MB})",
+    )
+
+    parser.add_argument(
+        "--baseline-cache",
+        type=Path,
+        metavar="DIR",
+        help="Keep base image package lists and presets in DIR, keyed by image "
+             "digest, and skip running the base image when DIR already has them "
+             "(default: DIR/baseline under --cache-dir, if given). DIR can be "
+             "shared by hosts that target the same image",
+    )
+
+    parser.add_argument(
+        "--baseline-mount",
+        action="store_true",
+        help="Read base image facts from 'podman image mount' instead of "
+             "running the image (falls back to podman run if the mount is not "
+             "visible from yoinkc)",
+    )
+
+    # Record / replay of executed commands
+    parser.add_argument(
+        "--record",
+        type=Path,
+        metavar="FILE",
+        help="Record every command run during inspection (with output and "
+             "timing) to a compressed cassette FILE",
+    )
+    parser.add_argument(
+        "--replay",
+        type=Path,
+        metavar="FILE",
+        help="Serve command results from a cassette recorded with --record "
+             "instead of running commands. Files are still read from --host-root.",
+    )
+    parser.add_argument(
+        "--replay-latency",
+        action="store_true",
+        help="With --replay, sleep for each command's recorded duration",
+    )
+
     _VALID_STRATEGIES = ("sysusers", "blueprint", "useradd", "kickstart")
     parser.add_argument(
         "--user-strategy",
@@ -159,6 +331,58 @@ def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
     if args.no_baseline and args.baseline_packages:
         parser.error("--no-baseline and --baseline-packages cannot be used together")
 
+    if args.baseline_bundle and (args.no_baseline or args.baseline_packages):
+        parser.error("--baseline-bundle cannot be used with --no-baseline or --baseline-packages")
+
+    if args.baseline_bundle and not args.baseline_bundle.is_file():
+        parser.error(f"--baseline-bundle: {args.baseline_bundle} does not exist")
+
+    if args.record and args.replay:
+        parser.error("--record and --replay cannot be used together")
+
+    if args.replay_latency and not args.replay:
+        parser.error("--replay-latency requires --replay")
+
+    if args.from_snapshot and (args.record or args.replay):
+        parser.error("--record and --replay cannot be used with --from-snapshot")
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    if args.verify_jobs is not None and args.verify_jobs < 1:
+        parser.error("--verify-jobs must be at least 1")
+
+    if args.time_budget is not None and args.time_budget <= 0:
+        parser.error("--time-budget must be greater than 0")
+
+    if args.from_snapshot and args.time_budget is not None:
+        parser.error("--time-budget cannot be used with --from-snapshot")
+
+    if args.from_snapshot and (args.progress_fd is not None or args.progress_file):
+        parser.error("--progress-fd and --progress-file cannot be used with --from-snapshot")
+
+    if args.progress_fd is not None and args.progress_fd < 0:
+        parser.error("--progress-fd must be a file descriptor number")
+
+    if args.from_snapshot and (args.only or args.skip):
+        parser.error("--only and --skip cannot be used with --from-snapshot")
+
+    # Resolved section selection handed to run_all (None = everything).
+    args.sections = None
+    if args.only is not None or args.skip is not None:
+        args.sections = [s for s in (args.only or SECTIONS) if s not in (args.skip or [])]
+        if not args.sections:
+            parser.error("--only/--skip leave no sections to inspect")
+
+    if args.cache_max_size < 1:
+        parser.error("--cache-max-size must be at least 1")
+
+    if args.from_snapshot and args.cache_dir:
+        parser.error("--cache-dir cannot be used with --from-snapshot")
+
+    if args.from_snapshot and (args.baseline_cache or args.baseline_mount):
+        parser.error("--baseline-cache and --baseline-mount cannot be used with --from-snapshot")
+
     if (args.validate or args.push_to_github) and args.output_dir is None:
         parser.error(
             "--validate and --push-to-github require --output-dir "
@@ -0,0 +1,107 @@
+"""
+Run-wide time budget for inspection (``--time-budget``).
+
+A ``Deadline`` is activated for the duration of a run.  Inspectors call
+``expired()`` between batches of work (per package, per file, per rpm query
+batch); once the budget is spent it returns True, the inspector stops
+early and keeps what it has, and the section being inspected is recorded
+as incomplete.  Commands are also given no more than the remaining budget
+(``command_timeout``), so a single slow ``rpm -Va`` cannot overrun it.
+
+The current section comes from ``section()``, which the scheduler enters
+around each inspector task.  Everything is a cheap no-op when no deadline
+is active.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional
+
+
+# Commands started after the budget is spent still get this long, so quick
+# queries complete and only long-running ones are cut short.
+MIN_COMMAND_TIMEOUT = 1.0
+
+_active: Optional["Deadline"] = None
+_section: ContextVar[Optional[str]] = ContextVar("yoinkc_deadline_section", default=None)
+
+
+class Deadline:
+    """A time budget in seconds, counted from construction."""
+
+    def __init__(self, seconds: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.seconds = seconds
+        self._clock = clock
+        self._end = clock() + seconds
+        self._lock = threading.Lock()
+        self._incomplete: Dict[str, List[str]] = {}
+
+    @contextmanager
+    def activate(self) -> Iterator["Deadline"]:
+        """Make this the deadline used by the module-level helpers."""
+        global _active
+        previous = _active
+        _active = self
+        try:
+            yield self
+        finally:
+            _active = previous
+
+    def remaining(self) -> float:
+        return max(0.0, self._end - self._clock())
+
+    def expired(self) -> bool:
+        return self._clock() >= self._end
+
+    def mark(self, section: str, detail: str = "") -> None:
+        """Record *section* as cut short, with an optional note on what was skipped."""
+        with self._lock:
+            details = self._incomplete.setdefault(section, [])
+            if detail and detail not in details:
+                details.append(detail)
+
+    def incomplete(self) -> Dict[str, List[str]]:
+        """Return {section: [details]} for every section cut short."""
+        with self._lock:
+            return {k: list(v) for k, v in sorted(self._incomplete.items())}
+
+
+@contextmanager
+def section(name: str) -> Iterator[None]:
+    """Attribute deadline hits inside the block to section *name*."""
+    token = _section.set(name)
+    try:
+        yield
+    finally:
+        _section.reset(token)
+
+
+def expired(detail: str = "") -> bool:
+    """Return True once the active budget is spent.
+
+    The current section is marked incomplete, with *detail* describing the
+    work being abandoned.  Always False when no deadline is active.
+    """
+    deadline = _active
+    if deadline is None or not deadline.expired():
+        return False
+    name = _section.get()
+    if name is not None:
+        deadline.mark(name, detail)
+    return True
+
+
+def exhausted() -> bool:
+    """Return True once the active budget is spent, without marking anything."""
+    deadline = _active
+    return deadline is not None and deadline.expired()
+
+
+def command_timeout(default: float) -> float:
+    """Clamp a command timeout of *default* seconds to the remaining budget."""
+    deadline = _active
+    if deadline is None:
+        return default
+    return min(default, max(MIN_COMMAND_TIMEOUT, deadline.remaining()))
@@ -0,0 +1,132 @@
+"""
+Transitive closure of a package dependency graph, computed once.
+
+Walking the graph separately from every leaf costs O(leaves × edges) and
+degrades badly when dependency cycles make every walk revisit the same
+component.  ``DependencyClosure`` instead condenses the graph into its
+strongly connected components (Tarjan), then computes each component's
+reachable set once, in reverse topological order, as an integer bitset:
+a component reaches its own members plus everything its successors reach.
+
+Nodes are numbered in sorted name order, so turning a bitset back into a
+sorted name list is a walk over its set bits.  ``reverse_tree`` inverts
+the per-leaf result for "what pulls in X" questions.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional
+
+
+class DependencyClosure:
+    """Reachability over ``graph`` (name -> names it depends on)."""
+
+    def __init__(self, graph: Mapping[str, Iterable[str]]) -> None:
+        nodes = set(graph)
+        for deps in graph.values():
+            nodes.update(deps)
+        self.names: List[str] = sorted(nodes)
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        edges: List[List[int]] = [[] for _ in self.names]
+        for name, deps in graph.items():
+            edges[self._index[name]] = [self._index[d] for d in deps]
+        self._reach: List[int] = self._close(edges)
+
+    def _close(self, edges: List[List[int]]) -> List[int]:
+        """Return each node's reachable set (itself included) as a bitset."""
+        n = len(edges)
+        index = [-1] * n
+        low = [0] * n
+        comp = [-1] * n
+        on_stack = [False] * n
+        stack: List[int] = []
+        comp_reach: List[int] = []
+        counter = 0
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            # Iterative Tarjan: (node, position in its edge list).
+            work = [(root, 0)]
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = True
+            while work:
+                v, i = work[-1]
+                if i < len(edges[v]):
+                    work[-1] = (v, i + 1)
+                    w = edges[v][i]
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = True
+                        work.append((w, 0))
+                    elif on_stack[w]:
+                        low[v] = min(low[v], index[w])
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[v])
+                if low[v] != index[v]:
+                    continue
+                # v roots a component.  Tarjan emits components sinks
+                # first, so every component it points to is already closed.
+                members = []
+                while True:
+                    w = stack.pop()
+                    on_stack[w] = False
+                    comp[w] = len(comp_reach)
+                    members.append(w)
+                    if w == v:
+                        break
+                bits = 0
+                for w in members:
+                    bits |= 1 << w
+                reach = bits
+                for w in members:
+                    for x in edges[w]:
+                        if comp[x] != len(comp_reach):
+                            reach |= comp_reach[comp[x]]
+                comp_reach.append(reach)
+        return [comp_reach[comp[v]] for v in range(n)]
+
+    def mask(self, names: Iterable[str]) -> int:
+        """Return the bitset of *names* (unknown names are ignored)."""
+        bits = 0
+        for name in names:
+            i = self._index.get(name)
+            if i is not None:
+                bits |= 1 << i
+        return bits
+
+    def names_of(self, bits: int) -> List[str]:
+        """Return the names in bitset *bits*, sorted."""
+        out: List[str] = []
+        while bits:
+            low = bits & -bits
+            out.append(self.names[low.bit_length() - 1])
+            bits ^= low
+        return out
+
+    def reach(self, name: str) -> int:
+        """Return the bitset of everything *name* depends on, excluding itself."""
+        i = self._index.get(name)
+        if i is None:
+            return 0
+        return self._reach[i] & ~(1 << i)
+
+    def descendants(self, name: str, within: Optional[int] = None) -> List[str]:
+        """Return the sorted names *name* pulls in, optionally limited to bitset *within*."""
+        bits = self.reach(name)
+        if within is not None:
+            bits &= within
+        return self.names_of(bits)
+
+
+def reverse_tree(tree: Mapping[str, Iterable[str]]) -> Dict[str, List[str]]:
+    """Invert a ``{leaf: [deps]}`` tree into ``{dep: [leaves pulling it in]}``."""
+    out: Dict[str, List[str]] = {}
+    for leaf in sorted(tree):
+        for dep in tree[leaf]:
+            out.setdefault(dep, []).append(leaf)
+    return out
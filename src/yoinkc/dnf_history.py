@@ -0,0 +1,158 @@
+"""
+In-process reader for dnf's transaction history database.
+
+Removed packages, install reasons and the repository each package came
+from all live in dnf's history database on the host — ``history.sqlite``
+for dnf 4, ``transaction_history.sqlite`` for dnf 5.  ``DnfHistory.load``
+reads every package transaction item from it in one query, instead of
+``dnf history list`` plus one ``dnf history info`` per Remove transaction,
+``dnf repoquery --userinstalled`` and batched ``repoquery --installed``
+calls.  The database is opened read-only; when it is missing or its
+schema is not recognised, ``load`` returns None and the inspectors fall
+back to the dnf commands.  It does the same while a cassette is recorded
+or replayed (``rpmdb_sqlite.suspend_native_reads``), so the history is
+captured as those commands.
+
+Reasons and repos are resolved the way dnf resolves them: from the latest
+item for a package in a completed transaction, ignoring the outgoing side
+of upgrades, downgrades, obsoletes and reinstalls.
+"""
+
+import sqlite3
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from ._util import debug as _debug_fn
+from .rpmdb_sqlite import connect_readonly, native_reads_suspended
+
+
+def _debug(msg: str) -> None:
+    _debug_fn("dnf_history", msg)
+
+
+# Newest layout first.
+DB_LOCATIONS = (
+    "usr/lib/sysimage/libdnf5/transaction_history.sqlite",
+    "var/lib/dnf/history.sqlite",
+)
+
+# dnf 4 stores action, reason and state as libdnf enum values.
+_DNF4_ACTIONS = {
+    1: "install", 2: "downgrade", 3: "downgraded", 4: "obsolete", 5: "obsoleted",
+    6: "upgrade", 7: "upgraded", 8: "remove", 9: "reinstall", 10: "reinstalled",
+    11: "reason change",
+}
+_DNF4_REASONS = {0: "unknown", 1: "dependency", 2: "user", 3: "clean", 4: "weak dependency", 5: "group"}
+_DNF4_DONE = 1
+
+_DNF4_QUERY = """
+    SELECT ti.trans_id, ti.action, ti.reason, t.state, r.repoid,
+           i.name, i.epoch, i.version, i.release, i.arch
+    FROM trans_item ti
+    JOIN trans t ON t.id = ti.trans_id
+    JOIN rpm i ON i.item_id = ti.item_id
+    LEFT JOIN repo r ON r.id = ti.repo_id
+    ORDER BY ti.trans_id, ti.id
+"""
+
+# dnf 5 keeps the names in lookup tables.
+_DNF5_QUERY = """
+    SELECT ti.trans_id, a.name, rs.name, ts.name, r.repoid,
+           i.name, i.epoch, i.version, i.release, i.arch
+    FROM trans_item ti
+    JOIN trans t ON t.id = ti.trans_id
+    JOIN rpm i ON i.item_id = ti.item_id
+    JOIN trans_item_action a ON a.id = ti.action_id
+    JOIN trans_item_reason rs ON rs.id = ti.reason_id
+    JOIN trans_state ts ON ts.id = t.state_id
+    LEFT JOIN repo r ON r.id = ti.repo_id
+    ORDER BY ti.trans_id, ti.id
+"""
+
+# The outgoing half of a replacement says nothing about what is installed.
+_OUTGOING = {"downgraded", "obsoleted", "upgraded", "reinstalled", "replaced"}
+
+# Reasons dnf counts as user-installed; "unknown" means installed outside
+# dnf (rpm, kickstart %packages before dnf recorded it).
+USER_REASONS = frozenset({"user", "unknown", "none", "external user"})
+
+Nevra = Tuple[str, str, str, str, str]
+
+
+class DnfHistory:
+    """Removed packages, install reasons and source repos from dnf's history."""
+
+    def __init__(self) -> None:
+        self.removed: List[str] = []
+        self._reasons: Dict[str, str] = {}
+        self._repos: Dict[Nevra, str] = {}
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[tuple]) -> "DnfHistory":
+        """Build from (trans_id, action, reason, trans_state, repoid, name,
+        epoch, version, release, arch) rows in transaction order, with
+        action and reason names lower-cased.
+        """
+        history = cls()
+        removed_at: Dict[str, int] = {}
+        for trans_id, action, reason, done, repoid, name, epoch, version, release, arch in rows:
+            if not done or action in _OUTGOING:
+                continue
+            if action == "remove":
+                removed_at[name] = trans_id
+                # Removal forgets the reason, as in dnf.
+                history._reasons[name] = "unknown"
+                continue
+            history._reasons[name] = reason
+            if repoid:
+                history._repos[(name, str(epoch or 0), version, release, arch)] = repoid
+        # Newest removal first, as dnf history list orders them.
+        history.removed = sorted(removed_at, key=lambda n: (-removed_at[n], n))
+        return history
+
+    @classmethod
+    def load(cls, host_root: Path) -> Optional["DnfHistory"]:
+        """Read the host's history database; None when there is none we can read."""
+        if native_reads_suspended():
+            return None
+        for rel in DB_LOCATIONS:
+            path = Path(host_root) / rel
+            if not path.is_file():
+                continue
+            try:
+                conn = connect_readonly(path, table="trans_item")
+                try:
+                    if rel.endswith("transaction_history.sqlite"):
+                        rows = [
+                            (tid, (a or "").lower(), (r or "").lower(), (s or "").lower() == "ok",
+                             repo, n, e, v, rel_, arch)
+                            for tid, a, r, s, repo, n, e, v, rel_, arch in conn.execute(_DNF5_QUERY)
+                        ]
+                    else:
+                        rows = [
+                            (tid, _DNF4_ACTIONS.get(a, ""), _DNF4_REASONS.get(r, "unknown"), s == _DNF4_DONE,
+                             repo, n, e, v, rel_, arch)
+                            for tid, a, r, s, repo, n, e, v, rel_, arch in conn.execute(_DNF4_QUERY)
+                        ]
+                finally:
+                    conn.close()
+            except (sqlite3.Error, OSError) as exc:
+                _debug(f"cannot read {path}: {exc}")
+                return None
+            history = cls.from_rows(rows)
+            _debug(f"read {len(rows)} transaction items from {path}: "
+                   f"{len(history._reasons)} packages, {len(history.removed)} removed")
+            return history
+        return None
+
+    def reason(self, name: str) -> str:
+        """Return why *name* is installed; "unknown" if dnf has no record."""
+        return self._reasons.get(name, "unknown")
+
+    def user_installed(self, names: Iterable[str]) -> Set[str]:
+        """Return the packages among *names* dnf counts as user-installed."""
+        return {n for n in names if self.reason(n) in USER_REASONS}
+
+    def from_repo(self, name: str, epoch: str, version: str, release: str, arch: str) -> Optional[str]:
+        """Return the repo id the exact package NEVRA was installed from, or None."""
+        return self._repos.get((name, str(epoch or 0), version, release, arch))
@@ -2,11 +2,36 @@
 Command execution abstraction.
 
 Inspectors never call subprocess directly. They use the provided executor
-so that tests can inject fixture file reads instead of running real commands.
+so that tests can inject fixture file reads instead of running real commands,
+and so a run can be recorded to a cassette and replayed elsewhere.
+
+Helpers that issue many independent commands (per-package rpm queries,
+rpm -V shards, per-directory readelf) fan them out over a bounded number of
+threads.  ``to_async`` wraps any executor so each call runs on a worker
+thread, at most a fixed number at a time, and ``run_sync`` drives one such
+batch from synchronous code in a short-lived event loop.  The commands
+themselves are still run by the wrapped executor, so timeouts, the time
+budget, memoization, perf counters and cassettes apply to them unchanged;
+asyncio only schedules the fan-out.
 """
 
+import asyncio
+import gzip
+import json
+import os
+import threading
+import time
+import weakref
 from dataclasses import dataclass
-from typing import List, Optional, Protocol
+from pathlib import Path
+from typing import Any, Coroutine, Dict, List, Optional, Protocol, TypeVar
+
+from . import deadline as _deadline
+from ._util import debug as _debug_fn
+
+
+def _debug(msg: str) -> None:
+    _debug_fn("executor", msg)
 
 
 @dataclass
@@ -18,6 +43,10 @@ class RunResult:
     returncode: int
 
 
+# Per-command timeout in seconds.
+DEFAULT_TIMEOUT = 300.0
+
+
 class Executor(Protocol):
     """Protocol for command execution. Implementations may run commands or read fixtures."""
 
@@ -26,8 +55,23 @@ class Executor(Protocol):
         ...
 
 
+class AsyncExecutor(Protocol):
+    """Async counterpart of ``Executor``, as returned by ``to_async``."""
+
+    async def __call__(self, cmd: List[str], *, cwd: Optional[str] = None) -> RunResult:
+        ...
+
+
+def _timed_out(cmd: List[str]) -> None:
+    """Flag the current section when a command was cut short by --time-budget."""
+    _deadline.expired(f"{' '.join(strip_wrappers(cmd)[:2])} timed out")
+
+
 def subprocess_executor(cmd: List[str], *, cwd: Optional[str] = None) -> RunResult:
-    """Default implementation: run the command via subprocess."""
+    """Default implementation: run the command via subprocess.
+
+    The timeout is clamped to what is left of an active ``--time-budget``.
+    """
     import subprocess
     try:
         result = subprocess.run(
@@ -35,7 +79,7 @@ def subprocess_executor(cmd: List[str], *, cwd: Optional[str] = None) -> RunResu
             capture_output=True,
             text=True,
             cwd=cwd,
-            timeout=300,
+            timeout=_deadline.command_timeout(DEFAULT_TIMEOUT),
         )
         return RunResult(
             stdout=result.stdout or "",
@@ -43,8 +87,10 @@ def subprocess_executor(cmd: List[str], *, cwd: Optional[str] = None) -> RunResu
             returncode=result.returncode,
         )
     except subprocess.TimeoutExpired as e:
+        _timed_out(cmd)
+        stdout = e.stdout or ""
         return RunResult(
-            stdout=e.stdout.decode() if e.stdout else "",
+            stdout=stdout.decode(errors="replace") if isinstance(stdout, bytes) else stdout,
             stderr=f"Command timed out after {e.timeout}s",
             returncode=-1,
         )
@@ -57,3 +103,307 @@ def make_executor(host_root: str) -> Executor:
     def run(cmd: List[str], *, cwd: Optional[str] = None) -> RunResult:
         return subprocess_executor(cmd, cwd=cwd or host_root)
     return run
+
+
+def strip_wrappers(cmd: List[str]) -> List[str]:
+    """Return *cmd* without leading nsenter/chroot/env/timeout wrappers."""
+    args = list(cmd)
+    while args:
+        prog = os.path.basename(args[0])
+        if prog == "nsenter":
+            args = args[args.index("--") + 1:] if "--" in args else args[1:]
+        elif prog == "chroot":
+            args = args[2:]
+        elif prog in ("env", "timeout"):
+            args = args[1:]
+        else:
+            break
+    return args
+
+
+# ---------------------------------------------------------------------------
+# Bounded fan-out
+# ---------------------------------------------------------------------------
+
+# Worker threads running commands at once per ``to_async`` executor.
+DEFAULT_CONCURRENCY = 8
+
+
+T = TypeVar("T")
+
+
+class _Bounded:
+    """Per-event-loop semaphore; asyncio primitives cannot cross loops."""
+
+    def __init__(self, limit: int) -> None:
+        if limit < 1:
+            raise ValueError("concurrency limit must be at least 1")
+        self.limit = limit
+        self._lock = threading.Lock()
+        self._sems: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            sem = self._sems.get(loop)
+            if sem is None:
+                sem = self._sems[loop] = asyncio.Semaphore(self.limit)
+            return sem
+
+
+class _ThreadedAsyncExecutor:
+    """Async view of a synchronous executor; calls run on worker threads.
+
+    Each call keeps the wrapped executor's own per-command timeout.
+    """
+
+    def __init__(self, inner: Executor, concurrency: int) -> None:
+        self._inner = inner
+        self._bounded = _Bounded(concurrency)
+
+    async def __call__(self, cmd: List[str], *, cwd: Optional[str] = None) -> RunResult:
+        async with self._bounded.semaphore():
+            if cwd is None:
+                return await asyncio.to_thread(self._inner, cmd)
+            return await asyncio.to_thread(self._inner, cmd, cwd=cwd)
+
+
+def to_async(executor: Executor, concurrency: int = DEFAULT_CONCURRENCY) -> AsyncExecutor:
+    """Return an async executor that runs *executor* on worker threads.
+
+    At most *concurrency* calls run at once.  An executor this function
+    already returned is passed back as is.
+    """
+    if isinstance(executor, _ThreadedAsyncExecutor):
+        return executor  # type: ignore[return-value]
+    return _ThreadedAsyncExecutor(executor, concurrency)
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """Run *coro* to completion from synchronous code in a new event loop.
+
+    Meant for one batch of fanned-out calls, not for single commands.
+    """
+    return asyncio.run(coro)
+
+
+# ---------------------------------------------------------------------------
+# In-run memoization
+# ---------------------------------------------------------------------------
+
+# Programs whose output depends only on their arguments and on host state
+# that does not change during an inspection run.
+_IDEMPOTENT_PROGRAMS = frozenset({"readelf", "file", "strings", "true"})
+
+
+def is_idempotent(cmd: List[str]) -> bool:
+    """Return True if *cmd* is a read-only query safe to reuse within a run.
+
+    Covers rpm query/verify modes, readelf/file/strings, dnf repoquery and
+    history, semanage listings, systemctl list-unit-files and podman's
+    credential lookup.  ``podman image exists`` is excluded because a pull
+    later in the run changes its answer.
+    """
+    args = strip_wrappers(cmd)
+    if not args:
+        return False
+    prog, rest = os.path.basename(args[0]), args[1:]
+    if prog in _IDEMPOTENT_PROGRAMS:
+        return True
+    if prog == "rpm":
+        return any(a.startswith(("-q", "-V")) for a in rest)
+    if prog == "dnf":
+        return bool(rest) and rest[0] in ("repoquery", "history")
+    if prog == "semanage":
+        return "-l" in rest
+    if prog == "systemctl":
+        return "list-unit-files" in rest
+    if prog == "podman":
+        return rest[:2] == ["login", "--get-login"]
+    return False
+
+
+class _Flight:
+    """One memoized call; followers wait on ``done`` for the leader's result."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Optional[RunResult] = None
+        self.error: Optional[BaseException] = None
+
+
+class MemoizingExecutor:
+    """Executor wrapper that runs each idempotent (cmd, cwd) at most once.
+
+    Calls for which *idempotent* returns False pass straight through.
+    Concurrent identical calls share one execution (single-flight): the first
+    caller runs the command and the others wait for its result.  A call that
+    raises is not memoized.  Safe to call from several threads.
+    """
+
+    def __init__(self, inner: Executor, idempotent=is_idempotent) -> None:
+        self._inner = inner
+        self._idempotent = idempotent
+        self._lock = threading.Lock()
+        self._flights: Dict[tuple, _Flight] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __call__(self, cmd: List[str], *, cwd: Optional[str] = None) -> RunResult:
+        if not self._idempotent(cmd):
+            return self._run(cmd, cwd)
+        key = (tuple(cmd), cwd)
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+                self.misses += 1
+            else:
+                self.hits += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result  # type: ignore[return-value]
+        try:
+            flight.result = self._run(cmd, cwd)
+        except BaseException as exc:
+            flight.error = exc
+            with self._lock:
+                del self._flights[key]
+            raise
+        finally:
+            flight.done.set()
+        return flight.result
+
+    def _run(self, cmd: List[str], cwd: Optional[str]) -> RunResult:
+        return self._inner(cmd, cwd=cwd) if cwd is not None else self._inner(cmd)
+
+    def report(self) -> None:
+        """Log hit/miss counts (YOINKC_DEBUG)."""
+        _debug(f"memoized commands: {self.hits} hits, {self.misses} misses")
+
+
+# ---------------------------------------------------------------------------
+# Record / replay
+# ---------------------------------------------------------------------------
+
+CASSETTE_FORMAT = "yoinkc-cassette"
+CASSETTE_VERSION = 1
+
+
+class RecordingExecutor:
+    """Executor wrapper that appends every call to a gzip'd JSONL cassette.
+
+    The first line is a header carrying the host root the commands were
+    recorded against; each following line holds one call: ``cmd``, ``cwd``,
+    ``stdout``, ``stderr``, ``returncode`` and ``duration`` (seconds).
+    Entries are written as calls complete, so a run that dies part-way still
+    leaves a usable cassette.  Safe to call from several threads.
+    """
+
+    def __init__(self, inner: Executor, path: Path, host_root: str = "/") -> None:
+        self._inner = inner
+        self._lock = threading.Lock()
+        self._fh = gzip.open(path, "wt", encoding="utf-8")
+        self._write({"format": CASSETTE_FORMAT, "version": CASSETTE_VERSION, "host_root": host_root})
+
+    def _write(self, record: dict) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        with self._lock:
+            if self._fh is not None:
+                self._fh.write(line)
+
+    def __call__(self, cmd: List[str], *, cwd: Optional[str] = None) -> RunResult:
+        start = time.monotonic()
+        result = self._inner(cmd, cwd=cwd)
+        self._write({
+            "cmd": list(cmd),
+            "cwd": cwd,
+            "stdout": result.stdout,
+            "stderr": result.stderr,
+            "returncode": result.returncode,
+            "duration": round(time.monotonic() - start, 6),
+        })
+        return result
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fh is not None:
+                self._fh.close()
+                self._fh = None
+
+    def __enter__(self) -> "RecordingExecutor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ReplayExecutor:
+    """Executor that serves results from a cassette written by RecordingExecutor.
+
+    Calls are matched on ``(cmd, cwd)``.  Repeated identical calls are served
+    in recorded order; once a call's recordings are used up the last one is
+    repeated.  Unknown commands return rc 127 so inspectors take their normal
+    "tool missing" path.  When *host_root* differs from the recorded host
+    root, arguments under it are mapped back before lookup, so a cassette can
+    be replayed against a copy of the host tree at another path.  With
+    *replay_latency* each call sleeps for its recorded duration.
+    """
+
+    def __init__(self, path: Path, host_root: Optional[str] = None, replay_latency: bool = False) -> None:
+        self._lock = threading.Lock()
+        self._replay_latency = replay_latency
+        self._entries: Dict[str, List[dict]] = {}
+        self._served: Dict[str, int] = {}
+        with gzip.open(path, "rt", encoding="utf-8") as fh:
+            header = json.loads(fh.readline() or "{}")
+            if header.get("format") != CASSETTE_FORMAT:
+                raise ValueError(f"{path} is not a yoinkc cassette")
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(
+                    f"Cassette version mismatch: file has {header.get('version')}, "
+                    f"this yoinkc expects {CASSETTE_VERSION}."
+                )
+            for line in fh:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                self._entries.setdefault(self._key(entry["cmd"], entry.get("cwd")), []).append(entry)
+        self._recorded_root = header.get("host_root") or "/"
+        self._host_root = host_root or self._recorded_root
+
+    @staticmethod
+    def _key(cmd: List[str], cwd: Optional[str]) -> str:
+        return json.dumps([list(cmd), cwd])
+
+    def _map_root(self, arg: str) -> str:
+        new, old = self._host_root.rstrip("/"), self._recorded_root.rstrip("/")
+        if new == old or not new:
+            return arg
+        if arg == new:
+            return old or "/"
+        if arg.startswith(new + "/"):
+            return old + arg[len(new):]
+        return arg
+
+    def __call__(self, cmd: List[str], *, cwd: Optional[str] = None) -> RunResult:
+        key = self._key([self._map_root(a) for a in cmd], self._map_root(cwd) if cwd else cwd)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                entry = None
+            else:
+                idx = self._served.get(key, 0)
+                self._served[key] = idx + 1
+                entry = entries[min(idx, len(entries) - 1)]
+        if entry is None:
+            return RunResult(stdout="", stderr=f"yoinkc replay: command not in cassette: {' '.join(cmd)}",
+                             returncode=127)
+        if self._replay_latency and entry.get("duration"):
+            time.sleep(entry["duration"])
+        return RunResult(stdout=entry["stdout"], stderr=entry["stderr"], returncode=entry["returncode"])
@@ -147,6 +147,19 @@ def _collect_section_lists(snapshots, section_attr, list_attr):
     return result
 
 
+def _inspected_by(snapshots, host_names, section):
+    """Return (snapshots, host_names) of the hosts that inspected *section*.
+
+    Hosts that skipped a section (``--only`` / ``--skip``) are left out of its
+    prevalence totals instead of counting as hosts where nothing was found.
+    """
+    pairs = [
+        (s, h) for s, h in zip(snapshots, host_names)
+        if section not in (s.meta.get("skipped_sections") or [])
+    ]
+    return [s for s, _ in pairs], [h for _, h in pairs]
+
+
 def merge_snapshots(
     snapshots: list[InspectionSnapshot],
     min_prevalence: int = 100,
@@ -158,34 +171,36 @@ def merge_snapshots(
     host_names = [s.meta.get("hostname", f"host-{i}") for i, s in enumerate(snapshots)]
 
     # --- RPM ---
+    snaps, hosts = _inspected_by(snapshots, host_names, "rpm")
+    n = len(snaps)
     rpm_section = None
-    has_rpm = any(s.rpm for s in snapshots)
+    has_rpm = any(s.rpm for s in snaps)
     if has_rpm:
         packages_added = _merge_identity_items(
-            _collect_section_lists(snapshots, "rpm", "packages_added"),
+            _collect_section_lists(snaps, "rpm", "packages_added"),
             key_fn=lambda p: p.name,
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         base_image_only = _merge_identity_items(
-            _collect_section_lists(snapshots, "rpm", "base_image_only"),
+            _collect_section_lists(snaps, "rpm", "base_image_only"),
             key_fn=lambda p: p.name,
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         repo_files = _merge_identity_items(
-            _collect_section_lists(snapshots, "rpm", "repo_files"),
+            _collect_section_lists(snaps, "rpm", "repo_files"),
             key_fn=lambda r: r.path,
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         gpg_keys = _merge_identity_items(
-            _collect_section_lists(snapshots, "rpm", "gpg_keys"),
+            _collect_section_lists(snaps, "rpm", "gpg_keys"),
             key_fn=lambda r: r.path,
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         dnf_removed = _deduplicate_strings(
-            _collect_section_lists(snapshots, "rpm", "dnf_history_removed")
+            _collect_section_lists(snaps, "rpm", "dnf_history_removed")
         )
         # Pass-through fields from first snapshot with rpm
-        first_rpm = next(s.rpm for s in snapshots if s.rpm)
+        first_rpm = next(s.rpm for s in snaps if s.rpm)
         rpm_section = RpmSection(
             packages_added=packages_added,
             base_image_only=base_image_only,
@@ -198,37 +213,41 @@ def merge_snapshots(
         )
 
     # --- Config ---
+    snaps, hosts = _inspected_by(snapshots, host_names, "config")
+    n = len(snaps)
     config_section = None
-    has_config = any(s.config for s in snapshots)
+    has_config = any(s.config for s in snaps)
     if has_config:
         files = _merge_content_items(
-            _collect_section_lists(snapshots, "config", "files"),
+            _collect_section_lists(snaps, "config", "files"),
             identity_fn=lambda f: f.path,
             variant_fn=lambda f: _content_hash(f.content),
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         config_section = ConfigSection(files=files)
 
     # --- Services ---
+    snaps, hosts = _inspected_by(snapshots, host_names, "services")
+    n = len(snaps)
     services_section = None
-    has_services = any(s.services for s in snapshots)
+    has_services = any(s.services for s in snaps)
     if has_services:
         state_changes = _merge_identity_items(
-            _collect_section_lists(snapshots, "services", "state_changes"),
+            _collect_section_lists(snaps, "services", "state_changes"),
             key_fn=lambda sc: f"{sc.unit}:{sc.action}",
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         drop_ins = _merge_content_items(
-            _collect_section_lists(snapshots, "services", "drop_ins"),
+            _collect_section_lists(snaps, "services", "drop_ins"),
             identity_fn=lambda d: d.path,
             variant_fn=lambda d: _content_hash(d.content),
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         enabled_units = _deduplicate_strings(
-            _collect_section_lists(snapshots, "services", "enabled_units")
+            _collect_section_lists(snaps, "services", "enabled_units")
         )
         disabled_units = _deduplicate_strings(
-            _collect_section_lists(snapshots, "services", "disabled_units")
+            _collect_section_lists(snaps, "services", "disabled_units")
         )
         services_section = ServiceSection(
             state_changes=state_changes,
@@ -238,31 +257,35 @@ def merge_snapshots(
         )
 
     # --- Network (firewall zones only) ---
+    snaps, hosts = _inspected_by(snapshots, host_names, "network")
+    n = len(snaps)
     network_section = None
-    has_network = any(s.network for s in snapshots)
+    has_network = any(s.network for s in snaps)
     if has_network:
         firewall_zones = _merge_identity_items(
-            _collect_section_lists(snapshots, "network", "firewall_zones"),
+            _collect_section_lists(snaps, "network", "firewall_zones"),
             key_fn=lambda z: z.name,
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         network_section = NetworkSection(firewall_zones=firewall_zones)
 
     # --- Scheduled Tasks ---
+    snaps, hosts = _inspected_by(snapshots, host_names, "scheduled_tasks")
+    n = len(snaps)
     sched_section = None
-    has_sched = any(s.scheduled_tasks for s in snapshots)
+    has_sched = any(s.scheduled_tasks for s in snaps)
     if has_sched:
         gen_timers = _merge_identity_items(
-            _collect_section_lists(snapshots, "scheduled_tasks", "generated_timer_units"),
+            _collect_section_lists(snaps, "scheduled_tasks", "generated_timer_units"),
             key_fn=lambda t: t.name,
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         cron_jobs = _merge_identity_items(
-            _collect_section_lists(snapshots, "scheduled_tasks", "cron_jobs"),
+            _collect_section_lists(snaps, "scheduled_tasks", "cron_jobs"),
             key_fn=lambda c: c.path,
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
-        systemd_timers_all = _collect_section_lists(snapshots, "scheduled_tasks", "systemd_timers")
+        systemd_timers_all = _collect_section_lists(snaps, "scheduled_tasks", "systemd_timers")
         timer_seen: dict[str, object] = {}
         for items in systemd_timers_all:
             for t in items:
@@ -275,22 +298,24 @@ def merge_snapshots(
         )
 
     # --- Containers ---
+    snaps, hosts = _inspected_by(snapshots, host_names, "containers")
+    n = len(snaps)
     containers_section = None
-    has_containers = any(s.containers for s in snapshots)
+    has_containers = any(s.containers for s in snaps)
     if has_containers:
         quadlet_units = _merge_content_items(
-            _collect_section_lists(snapshots, "containers", "quadlet_units"),
+            _collect_section_lists(snaps, "containers", "quadlet_units"),
             identity_fn=lambda q: q.path,
             variant_fn=lambda q: _content_hash(q.content),
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         compose_files = _merge_content_items(
-            _collect_section_lists(snapshots, "containers", "compose_files"),
+            _collect_section_lists(snaps, "containers", "compose_files"),
             identity_fn=lambda c: c.path,
             variant_fn=lambda c: _content_hash(
                 str(sorted((img.service, img.image) for img in c.images))
             ),
-            total=total, min_prevalence=min_prevalence, host_names=host_names,
+            total=n, min_prevalence=min_prevalence, host_names=hosts,
         )
         containers_section = ContainerSection(
             quadlet_units=quadlet_units,
@@ -298,19 +323,21 @@ def merge_snapshots(
         )
 
     # --- Users/Groups ---
+    snaps, hosts = _inspected_by(snapshots, host_names, "users_groups")
+    n = len(snaps)
     ug_section = None
-    has_ug = any(s.users_groups for s in snapshots)
+    has_ug = any(s.users_groups for s in snaps)
     if has_ug:
         users = _deduplicate_dicts(
-            _collect_section_lists(snapshots, "users_groups", "users"),
-            key_field="name", total=total, host_names=host_names,
+            _collect_section_lists(snaps, "users_groups", "users"),
+            key_field="name", total=n, host_names=hosts,
         )
         groups = _deduplicate_dicts(
-            _collect_section_lists(snapshots, "users_groups", "groups"),
-            key_field="name", total=total, host_names=host_names,
+            _collect_section_lists(snaps, "users_groups", "groups"),
+            key_field="name", total=n, host_names=hosts,
         )
         sudoers = _deduplicate_strings(
-            _collect_section_lists(snapshots, "users_groups", "sudoers_rules")
+            _collect_section_lists(snaps, "users_groups", "sudoers_rules")
         )
         ug_section = UserGroupSection(
             users=users,
@@ -335,12 +362,26 @@ def merge_snapshots(
 
     # --- Build merged snapshot ---
     first = snapshots[0]
+    merged_meta = {
+        "hostname": fleet_name,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "fleet": fleet_meta.model_dump(),
+    }
+    # A section skipped on every host stays marked as not inspected.
+    skipped_everywhere = [
+        name for name in (first.meta.get("skipped_sections") or [])
+        if all(name in (s.meta.get("skipped_sections") or []) for s in snapshots)
+    ]
+    if skipped_everywhere:
+        merged_meta["skipped_sections"] = skipped_everywhere
+    # A section cut short by --time-budget on any host is partial fleet-wide.
+    incomplete_anywhere = sorted({
+        name for s in snapshots for name in (s.meta.get("incomplete_sections") or [])
+    })
+    if incomplete_anywhere:
+        merged_meta["incomplete_sections"] = incomplete_anywhere
     merged = InspectionSnapshot(
-        meta={
-            "hostname": fleet_name,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "fleet": fleet_meta.model_dump(),
-        },
+        meta=merged_meta,
         os_release=first.os_release,
         rpm=rpm_section,
         config=config_section,
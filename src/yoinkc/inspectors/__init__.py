@@ -3,15 +3,30 @@ Inspectors produce structured data that is merged into the inspection snapshot.
 Each inspector receives host_root and an executor; returns a section for the snapshot.
 """
 
+import contextvars
 import os
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, List, Optional, TypeVar
-
-from ..executor import Executor, make_executor
-from ..schema import InspectionSnapshot, OsRelease
-from .._util import make_warning, section_banner as _section_banner, status as _status_fn
+from typing import Callable, Dict, Iterable, List, Optional, TypeVar
+
+from .. import baseline as _baseline, cache as _cache, deadline as _deadline, perf as _perf, progress as _progress, rpmdb_sqlite as _rpmdb_sqlite, verify as _verify
+from ..executor import Executor, MemoizingExecutor, RecordingExecutor, ReplayExecutor, make_executor
+from ..rpmdb import SharedRpmDatabase
+from ..schema import (
+    ConfigSection,
+    InspectionSnapshot,
+    NonRpmSoftwareSection,
+    OsRelease,
+    RpmSection,
+    SelinuxSection,
+    ServiceSection,
+)
+from .._util import make_warning, status as _status_fn
 
 T = TypeVar("T")
 
@@ -86,14 +101,19 @@ def filtered_rglob(root: Path, pattern: str) -> List[Path]:
 
 
 def _safe_run(name: str, fn: Callable[[], T], default: T, warnings: list) -> T:
-    """Run an inspector; on PermissionError/OSError log a warning and return *default*."""
+    """Run an inspector; on PermissionError/OSError log a warning and return *default*.
+
+    The call is timed under *name* when a perf recorder is active.
+    """
     try:
-        return fn()
+        with _perf.measure("inspectors", name):
+            return fn()
     except (PermissionError, OSError) as exc:
         warnings.append(make_warning(name, f"{name} inspector: {exc}"))
         print(f"WARNING: {name} inspector skipped: {exc}", file=sys.stderr)
         return default
 
+from . import config as _config_mod, non_rpm_software as _non_rpm_mod, selinux as _selinux_mod, service as _service_mod
 from .rpm import run as run_rpm
 from .config import run as run_config
 from .service import run as run_service
@@ -105,6 +125,18 @@ from .non_rpm_software import run as run_non_rpm_software
 from .kernel_boot import run as run_kernel_boot
 from .selinux import run as run_selinux
 from .users_groups import run as run_users_groups
+from ._scheduler import InspectorTask, prune_tasks, run_tasks
+
+# Default number of inspectors allowed to run at once.  Most inspectors spend
+# their time waiting on rpm/dnf/systemctl subprocesses, so a small pool
+# overlaps that latency without flooding the host.
+DEFAULT_JOBS = 4
+
+# Snapshot sections that --only / --skip select from, in inspection order.
+SECTIONS = (
+    "rpm", "config", "services", "network", "storage", "scheduled_tasks",
+    "containers", "non_rpm_software", "kernel_boot", "selinux", "users_groups",
+)
 
 
 def _read_os_release(host_root: Path) -> Optional[OsRelease]:
@@ -188,6 +220,39 @@ def _baseline_fail_fast(base_image: Optional[str]) -> None:
     sys.exit(1)
 
 
+def _flag_incomplete(
+    snapshot: InspectionSnapshot,
+    tasks: List[InspectorTask],
+    deadline: _deadline.Deadline,
+) -> None:
+    """Record the sections cut short by *deadline* in meta and warnings.
+
+    A section is also partial when a task it consumed was cut short (e.g.
+    config after a truncated ``rpm -Va``, or anything using rpm_owned).
+    """
+    incomplete = deadline.incomplete()
+    if not incomplete:
+        return
+    partial: Dict[str, List[str]] = {}
+    for task in tasks:  # declaration order is a topological order
+        details = list(incomplete.get(task.name, []))
+        details += [f"uses partial {dep} results" for dep in task.deps if dep in partial]
+        if task.name in incomplete or details:
+            partial[task.name] = details
+    flagged = [name for name in SECTIONS if name in partial]
+    if not flagged:
+        return
+    snapshot.meta["incomplete_sections"] = flagged
+    for name in flagged:
+        detail = f" ({'; '.join(partial[name])})" if partial[name] else ""
+        snapshot.warnings.append(make_warning(
+            name,
+            f"{name}: --time-budget of {deadline.seconds:g}s ran out before inspection "
+            f"finished{detail}; results are partial.",
+        ))
+    _status_fn(f"Time budget exhausted; partial sections: {', '.join(flagged)}")
+
+
 def run_all(
     host_root: Path,
     executor: Optional[Executor] = None,
@@ -199,12 +264,138 @@ def run_all(
     target_image: Optional[str] = None,
     user_strategy: Optional[str] = None,
     no_baseline_opt_in: bool = False,
+    jobs: int = DEFAULT_JOBS,
+    cache_dir: Optional[Path] = None,
+    cache_max_bytes: int = _cache.DEFAULT_MAX_BYTES,
+    baseline_cache_dir: Optional[Path] = None,
+    baseline_mount: bool = False,
+    baseline_bundle_file: Optional[Path] = None,
+    sections: Optional[Iterable[str]] = None,
+    time_budget: Optional[float] = None,
+    verify_scope: str = _verify.DEFAULT_SCOPE,
+    verify_jobs: Optional[int] = None,
 ) -> InspectionSnapshot:
-    """Run all inspectors and return a merged snapshot."""
+    """Run all inspectors and return a merged snapshot.
+
+    Independent inspectors run concurrently on up to *jobs* threads (see
+    ``_scheduler``); ``jobs=1`` runs them one after another.  With
+    *cache_dir*, sections whose inputs are unchanged since a previous run
+    are loaded from the result cache instead of being recomputed, and
+    package file digests already checked in a previous run are not
+    re-hashed (``yoinkc.verify.VerifyCache``).  Base image query results
+    are cached by image digest in *baseline_cache_dir* (default:
+    ``baseline`` under *cache_dir*); both stores are bounded by
+    *cache_max_bytes*.  *baseline_mount* reads the base image through
+    ``podman image mount`` instead of running it; *baseline_bundle_file*
+    (from ``yoinkc baseline export``) replaces querying it altogether.
+
+    *sections* limits the run to those snapshot sections (default: all of
+    ``SECTIONS``) plus whatever they depend on; the rest are listed in
+    ``meta["skipped_sections"]``.
+
+    With *time_budget* (seconds), inspectors stop starting new work once it
+    is spent and return what they have; the affected sections are listed in
+    ``meta["incomplete_sections"]`` with a warning each.
+
+    *verify_scope* (``etc``, ``config`` or ``all``) limits which packaged
+    files are checked for modifications; anything narrower than ``all`` is
+    recorded in ``meta["verify_scope"]``.  *verify_jobs* sets the number of
+    parallel verification workers (see ``yoinkc.inspectors.rpm.run``).
+    """
     host_root = Path(host_root)
     if executor is None:
         executor = make_executor(str(host_root))
+    # A cassette holds only what goes through the executor, so while one is
+    # recorded or replayed host databases are queried with commands rather
+    # than read in-process.
+    cassette = isinstance(executor, (RecordingExecutor, ReplayExecutor))
+    # Peak RSS growth is process-wide, so it is only attributed per inspector
+    # when inspectors run one at a time.
+    recorder = _perf.PerfRecorder(track_rss=jobs <= 1)
+    # Memoize outside the perf and progress wrappers so only real executions
+    # are counted.
+    memo = MemoizingExecutor(_progress.instrument(_perf.instrument(executor, recorder)))
+    executor = memo
+    section_cache = None
+    verify_cache = None
+    if cache_dir is not None:
+        section_cache = _cache.SectionCache(
+            _cache.ResultCache(Path(cache_dir), cache_max_bytes),
+            _cache.Fingerprinter(host_root, executor),
+        )
+        verify_cache = _verify.VerifyCache(Path(cache_dir) / _verify.VerifyCache.FILENAME)
+        if baseline_cache_dir is None:
+            baseline_cache_dir = Path(cache_dir) / "baseline"
+    baseline_bundle = None
+    if baseline_bundle_file is not None:
+        baseline_bundle = _baseline.load_baseline_bundle_file(baseline_bundle_file)
+    baseline_cache = None
+    if baseline_cache_dir is not None:
+        baseline_cache = _baseline.BaselineCache(Path(baseline_cache_dir), cache_max_bytes)
+    deadline = _deadline.Deadline(time_budget) if time_budget is not None else None
+    started = time.perf_counter()
+    _progress.emit("run_start", host_root=str(host_root), jobs=jobs,
+                   sections=list(SECTIONS if sections is None else sections))
+    with (
+        recorder.activate(),
+        deadline.activate() if deadline else nullcontext(),
+        _rpmdb_sqlite.suspend_native_reads() if cassette else nullcontext(),
+    ):
+        snapshot = _run_all(
+            host_root, executor,
+            config_diffs=config_diffs,
+            deep_binary_scan=deep_binary_scan,
+            query_podman=query_podman,
+            baseline_packages_file=baseline_packages_file,
+            target_version=target_version,
+            target_image=target_image,
+            user_strategy=user_strategy,
+            no_baseline_opt_in=no_baseline_opt_in,
+            jobs=jobs,
+            section_cache=section_cache,
+            sections=sections,
+            deadline=deadline,
+            verify_scope=verify_scope,
+            verify_jobs=verify_jobs,
+            verify_cache=verify_cache,
+            baseline_cache=baseline_cache,
+            baseline_mount=baseline_mount,
+            baseline_bundle=baseline_bundle,
+        )
+    if section_cache is not None:
+        snapshot.meta["cache"] = section_cache.to_dict()
+        snapshot.meta["cache"]["verify"] = verify_cache.to_dict()
+    memo.report()
+    _perf.merge_into(snapshot.meta, recorder)
+    snapshot.meta["perf"]["total_wall_s"] = round(time.perf_counter() - started, 4)
+    _progress.emit("run_finish", wall_s=snapshot.meta["perf"]["total_wall_s"],
+                   incomplete_sections=snapshot.meta.get("incomplete_sections", []))
+    return snapshot
+
 
+def _run_all(
+    host_root: Path,
+    executor: Executor,
+    config_diffs: bool,
+    deep_binary_scan: bool,
+    query_podman: bool,
+    baseline_packages_file: Optional[Path],
+    target_version: Optional[str],
+    target_image: Optional[str],
+    user_strategy: Optional[str],
+    no_baseline_opt_in: bool,
+    jobs: int,
+    section_cache: Optional[_cache.SectionCache] = None,
+    sections: Optional[Iterable[str]] = None,
+    deadline: Optional[_deadline.Deadline] = None,
+    verify_scope: str = _verify.DEFAULT_SCOPE,
+    verify_jobs: Optional[int] = None,
+    verify_cache: Optional[_verify.VerifyCache] = None,
+    baseline_cache: Optional[_baseline.BaselineCache] = None,
+    baseline_mount: bool = False,
+    baseline_bundle: Optional[_baseline.BaselineBundle] = None,
+) -> InspectionSnapshot:
+    """Body of run_all, executed with the perf recorder active."""
     meta = {"host_root": str(host_root), "timestamp": datetime.now(timezone.utc).isoformat()}
     # Hostname priority: YOINKC_HOSTNAME env var (set by wrapper on host)
     #                  → /etc/hostname (may be empty on systemd hosts)
@@ -245,97 +436,221 @@ def run_all(
             print(f"WARNING: {msg}", file=sys.stderr)
             w.append(make_warning("pipeline", msg, "error"))
 
-    # Create one BaselineResolver per run — shares the nsenter probe cache
-    # across the package query (rpm inspector) and the presets query (service baseline).
+    # Create one BaselineResolver per run — shares the nsenter probe cache and
+    # the base image bundle across the package query (rpm inspector) and the
+    # presets (service baseline).
     from ..baseline import BaselineResolver
-    resolver = BaselineResolver(executor)
-
-    # Preflight: resolve baseline before inspectors start so the user gets a
-    # clear error in seconds rather than after a long inspection run.
-    preflight_baseline = None
-    host_os_id = os_release.id if os_release else ""
-    host_version_id = os_release.version_id if os_release else ""
-    if host_os_id and host_version_id:
-        preflight_baseline = resolver.resolve(
-            host_root, host_os_id, host_version_id,
-            baseline_packages_file=baseline_packages_file,
-            target_version=target_version,
-            target_image=target_image,
-        )
-        _, resolved_image, no_baseline = preflight_baseline
-        if no_baseline:
-            if not no_baseline_opt_in:
-                _baseline_fail_fast(resolved_image)
-            w.append(make_warning(
-                "rpm",
-                "Running without baseline (--no-baseline). All installed packages "
-                "will be included in the Containerfile.",
-            ))
-
-    _TOTAL_STEPS = 11
-    _status_fn("Starting inspection…")
-
-    _section_banner("Packages", 1, _TOTAL_STEPS)
-    def _run_rpm_inspector():
-        return run_rpm(
+    resolver = BaselineResolver(executor, cache=baseline_cache,
+                                mount_root=host_root if baseline_mount else None,
+                                bundle=baseline_bundle)
+
+    # One RPM database index per run, loaded by whichever inspector needs it
+    # first and shared by rpm, rpm_owned, config and services.
+    rpmdb = SharedRpmDatabase(executor, host_root)
+
+    def _cached(name, inputs, extra, model, compute, tw):
+        """Run *compute*, or load its section from the result cache.
+
+        ``extra`` holds the options and upstream results the section depends
+        on; ``None`` marks the section as uncacheable for this run.
+        """
+        if section_cache is None or extra is None:
+            return compute()
+        dump, load = _cache.model_section(model)
+        return section_cache.lookup(name, inputs, extra, compute, tw, dump, load)
+
+    def _rpm_task(results, tw):
+        # The inspector looks up its cached classification itself, after
+        # joining the background baseline query.
+        section = _safe_run("rpm", lambda: run_rpm(
             host_root, executor,
             baseline_packages_file=baseline_packages_file,
-            warnings=w, resolver=resolver,
+            warnings=tw, resolver=resolver,
             target_version=target_version,
             target_image=target_image,
             preflight_baseline=preflight_baseline,
-        )
-    snapshot.rpm = _safe_run("rpm", _run_rpm_inspector, None, w)
+            join_baseline=_join_baseline if baseline_job is not None else None,
+            rpmdb=rpmdb.get(),
+            verify_scope=verify_scope,
+            verify_jobs=verify_jobs,
+            verify_cache=verify_cache,
+            section_cache=section_cache,
+        ), None, tw)
+        # Post-inspector fallback: if the preflight was skipped (e.g. os-release
+        # missing or incomplete) but the RPM inspector still ended up without a
+        # baseline, apply the same fail-fast / warn logic.
+        if preflight_baseline is None and baseline_job is None and section and section.no_baseline:
+            tw.extend(_no_baseline_notes(None))
+        return section
+
+    def _baseline_task(results, tw):
+        # Without the rpm section (--skip rpm), use the preflight base image.
+        rpm_section = results.get("rpm")
+        if rpm_section is not None:
+            base_image = rpm_section.base_image
+        elif baseline_job is not None:
+            base_image = _join_baseline()[1]
+        else:
+            base_image = preflight_baseline[1] if preflight_baseline else None
+        if base_image and executor is not None:
+            with _perf.measure("inspectors", "baseline_bundle"):
+                return resolver.query_bundle(base_image)
+        return None
 
-    # Post-inspector fallback: if the preflight was skipped (e.g. os-release
-    # missing or incomplete) but the RPM inspector still ended up without a
-    # baseline, apply the same fail-fast / warn logic.
-    if preflight_baseline is None and snapshot.rpm and snapshot.rpm.no_baseline:
-        if not no_baseline_opt_in:
-            _baseline_fail_fast(None)
-        w.append(make_warning(
-            "rpm",
-            "Running without baseline (--no-baseline). All installed packages "
-            "will be included in the Containerfile.",
-        ))
+    def _presets(results):
+        bundle = results["baseline"]
+        if bundle is None or not bundle.preset_text.strip():
+            return None
+        return bundle.preset_text
 
-    # Build RPM-owned path set once; shared by config and scheduled_tasks inspectors
-    # to avoid issuing two separate rpm -qa queries.
+    # The RPM-owned path set is built once and shared by config,
+    # scheduled_tasks and selinux to avoid repeated rpm -qa queries.
     from .config import _rpm_owned_paths as _build_rpm_owned_paths
-    rpm_owned = _build_rpm_owned_paths(executor, host_root, warnings=w)
-
-    _section_banner("Config files", 2, _TOTAL_STEPS)
-    snapshot.config = _safe_run("config", lambda: run_config(host_root, executor, rpm_section=snapshot.rpm, rpm_owned_paths_override=rpm_owned, config_diffs=config_diffs, warnings=w), None, w)
-
-    _section_banner("Services", 3, _TOTAL_STEPS)
-    base_image_preset_text = None
-    if snapshot.rpm and snapshot.rpm.base_image and executor is not None:
-        base_image_preset_text = resolver.query_presets(snapshot.rpm.base_image)
-    snapshot.services = _safe_run("service", lambda: run_service(host_root, executor, base_image_preset_text=base_image_preset_text, warnings=w), None, w)
 
-    _section_banner("Network", 4, _TOTAL_STEPS)
-    snapshot.network = _safe_run("network", lambda: run_network(host_root, executor, warnings=w), None, w)
-
-    _section_banner("Storage", 5, _TOTAL_STEPS)
-    snapshot.storage = _safe_run("storage", lambda: run_storage(host_root, executor), None, w)
+    def _rpm_owned_task(results, tw):
+        def compute():
+            return _build_rpm_owned_paths(executor, host_root, warnings=tw, rpmdb=rpmdb.get())
+
+        with _perf.measure("inspectors", "rpm_owned"):
+            if section_cache is None:
+                return compute()
+            return section_cache.lookup("rpm_owned", (_cache.RPMDB,), {}, compute, tw, sorted, set)
+
+    tasks = [
+        InspectorTask("rpm", _rpm_task, title="Packages"),
+        InspectorTask("rpm_owned", _rpm_owned_task),
+        InspectorTask("baseline", _baseline_task),
+        InspectorTask("config", lambda r, tw: _safe_run("config", lambda: _cached("config", _config_mod.CACHE_INPUTS, {"rpm": r["rpm"].model_dump(mode="json") if r["rpm"] else None, "config_diffs": config_diffs}, ConfigSection, lambda: run_config(host_root, executor, rpm_section=r["rpm"], rpm_owned_paths_override=r["rpm_owned"], config_diffs=config_diffs, warnings=tw, rpmdb=rpmdb.get() if config_diffs else None), tw), None, tw),
+                      deps=("rpm", "rpm_owned"), title="Config files"),
+        InspectorTask("services", lambda r, tw: _safe_run("service", lambda: _cached("services", _service_mod.CACHE_INPUTS, {"presets": _presets(r)}, ServiceSection, lambda: run_service(host_root, executor, base_image_preset_text=_presets(r), warnings=tw, rpmdb=rpmdb.get()), tw), None, tw),
+                      deps=("baseline",), title="Services"),
+        InspectorTask("network", lambda r, tw: _safe_run("network", lambda: run_network(host_root, executor, warnings=tw), None, tw),
+                      title="Network"),
+        InspectorTask("storage", lambda r, tw: _safe_run("storage", lambda: run_storage(host_root, executor), None, tw),
+                      title="Storage"),
+        InspectorTask("scheduled_tasks", lambda r, tw: _safe_run("scheduled_tasks", lambda: run_scheduled_tasks(host_root, executor, rpm_owned_paths=r["rpm_owned"]), None, tw),
+                      deps=("rpm_owned",), title="Scheduled tasks"),
+        InspectorTask("containers", lambda r, tw: _safe_run("containers", lambda: run_container(host_root, executor, query_podman=query_podman, warnings=tw), None, tw),
+                      title="Containers"),
+        InspectorTask("non_rpm_software", lambda r, tw: _safe_run("non_rpm_software", lambda: _cached("non_rpm_software", _non_rpm_mod.CACHE_INPUTS, {"deep_binary_scan": deep_binary_scan}, NonRpmSoftwareSection, lambda: run_non_rpm_software(host_root, executor, deep_binary_scan=deep_binary_scan, warnings=tw), tw), None, tw),
+                      title="Non-RPM software"),
+        InspectorTask("kernel_boot", lambda r, tw: _safe_run("kernel_boot", lambda: run_kernel_boot(host_root, executor, warnings=tw), None, tw),
+                      title="Kernel / boot"),
+        InspectorTask("selinux", lambda r, tw: _safe_run("selinux", lambda: _cached("selinux", _selinux_mod.CACHE_INPUTS, {}, SelinuxSection, lambda: run_selinux(host_root, executor, warnings=tw, rpm_owned_paths=r["rpm_owned"]), tw), None, tw),
+                      deps=("rpm_owned",), title="SELinux / security"),
+        InspectorTask("users_groups", lambda r, tw: _safe_run("users_groups", lambda: run_users_groups(host_root, executor, user_strategy_override=user_strategy), None, tw),
+                      title="Users / groups"),
+    ]
+    # Drop the tasks no selected section needs (e.g. rpm_owned when config,
+    # scheduled_tasks and selinux are all skipped).
+    tasks = prune_tasks(tasks, SECTIONS if sections is None else sections)
+    names = {t.name for t in tasks}
+    if "rpm" in names:
+        # The bundle follows the rpm section's base image when it is inspected.
+        for t in tasks:
+            if t.name == "baseline":
+                t.deps = ("rpm",)
+    if "rpm" in names and verify_scope != "all":
+        snapshot.meta["verify_scope"] = verify_scope
+    skipped = [name for name in SECTIONS if name not in names]
+    if skipped:
+        snapshot.meta["skipped_sections"] = skipped
+        _status_fn(f"Skipping sections: {', '.join(skipped)}")
+
+    # Preflight: check registry credentials before inspectors start so the
+    # user gets a clear error in seconds rather than after a long inspection
+    # run.  The pull and base image query then run in the background while
+    # host-only work (rpm -qa, file verification, filesystem scans) proceeds;
+    # the rpm inspector joins just before package subtraction.
+    preflight_baseline = None
+    baseline_job: Optional[Future] = None
+    baseline_lock = threading.Lock()
+    joined: list = []
+    background_errors: list = []
+    # Where the no-baseline warning goes, whenever the join happens.
+    warning_pos = len(w)
+    host_os_id = os_release.id if os_release else ""
+    host_version_id = os_release.version_id if os_release else ""
 
-    _section_banner("Scheduled tasks", 6, _TOTAL_STEPS)
-    snapshot.scheduled_tasks = _safe_run("scheduled_tasks", lambda: run_scheduled_tasks(host_root, executor, rpm_owned_paths=rpm_owned), None, w)
+    def _resolve_baseline():
+        with _perf.measure("inspectors", "baseline"):
+            return resolver.resolve(
+                host_root, host_os_id, host_version_id,
+                baseline_packages_file=baseline_packages_file,
+                target_version=target_version,
+                target_image=target_image,
+            )
 
-    _section_banner("Containers", 7, _TOTAL_STEPS)
-    snapshot.containers = _safe_run("containers", lambda: run_container(host_root, executor, query_podman=query_podman, warnings=w), None, w)
+    def _resolve_baseline_in_background():
+        # An error here must not resurface at every join: settle it as "no
+        # baseline" with a warning, as a failed query would be.
+        try:
+            return _resolve_baseline()
+        except Exception as exc:
+            image = target_image or _baseline.select_base_image(host_os_id, host_version_id, target_version)[0]
+            background_errors.append(make_warning("rpm", f"Base image query failed: {exc}"))
+            return None, image, True
+
+    def _no_baseline_notes(resolved_image):
+        """Fail fast without a baseline, or return the warnings to record."""
+        if deadline is not None and deadline.expired():
+            # Queries started after the budget ran out are cut short, so the
+            # missing baseline is a partial result, not a setup error.
+            for name in ("rpm", "baseline"):
+                deadline.mark(name, "base image query did not finish")
+            return [make_warning(
+                "rpm",
+                "Base image query did not finish within --time-budget. All "
+                "installed packages will be included in the Containerfile.",
+            )]
+        if not no_baseline_opt_in:
+            _baseline_fail_fast(resolved_image)
+        return [make_warning(
+            "rpm",
+            "Running without baseline (--no-baseline). All installed packages "
+            "will be included in the Containerfile.",
+        )]
 
-    _section_banner("Non-RPM software", 8, _TOTAL_STEPS)
-    snapshot.non_rpm_software = _safe_run("non_rpm_software", lambda: run_non_rpm_software(host_root, executor, deep_binary_scan=deep_binary_scan, warnings=w), None, w)
+    def _check_baseline(result):
+        _, resolved_image, no_baseline = result
+        notes = list(background_errors)
+        if no_baseline:
+            notes += _no_baseline_notes(resolved_image)
+        w[warning_pos:warning_pos] = notes
+        return result
+
+    def _join_baseline():
+        """Wait for the background baseline query; fail fast or warn once."""
+        with baseline_lock:
+            if not joined:
+                joined.append(_check_baseline(baseline_job.result()))
+            return joined[0]
+
+    if host_os_id and host_version_id and names & {"rpm", "baseline"}:
+        if resolver.check_auth(host_os_id, host_version_id,
+                               baseline_packages_file=baseline_packages_file,
+                               target_version=target_version, target_image=target_image):
+            # Podman's pull progress would interleave with the section
+            # banners; report the pull as status lines instead.
+            resolver.stream_pull = False
+            pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yoinkc-baseline")
+            baseline_job = pool.submit(contextvars.copy_context().run, _resolve_baseline_in_background)
+            pool.shutdown(wait=False)
+        else:
+            # Missing credentials: resolving is now instant (and may still
+            # succeed from the baseline cache), so settle it here.
+            preflight_baseline = _check_baseline(_resolve_baseline())
 
-    _section_banner("Kernel / boot", 9, _TOTAL_STEPS)
-    snapshot.kernel_boot = _safe_run("kernel_boot", lambda: run_kernel_boot(host_root, executor, warnings=w), None, w)
+    _status_fn("Starting inspection…")
+    results = run_tasks(tasks, w, jobs=jobs)
+    if baseline_job is not None:
+        _join_baseline()
 
-    _section_banner("SELinux / security", 10, _TOTAL_STEPS)
-    snapshot.selinux = _safe_run("selinux", lambda: run_selinux(host_root, executor, warnings=w, rpm_owned_paths=rpm_owned), None, w)
+    for name in SECTIONS:
+        setattr(snapshot, name, results.get(name))
 
-    _section_banner("Users / groups", 11, _TOTAL_STEPS)
-    snapshot.users_groups = _safe_run("users_groups", lambda: run_users_groups(host_root, executor, user_strategy_override=user_strategy), None, w)
+    if deadline is not None:
+        _flag_incomplete(snapshot, tasks, deadline)
 
     _status_fn("Inspection complete.")
 
@@ -0,0 +1,153 @@
+"""
+Dependency-aware scheduler for the inspector run.
+
+Inspectors are independent of one another except for a handful of shared
+inputs: the rpm section (consumed by config and used to pick the base image),
+the RPM-owned /etc path set (config, scheduled_tasks, selinux) and the base
+image bundle (presets for service).  Each unit of work is
+declared as an ``InspectorTask`` with the names of the tasks whose results it
+needs; everything else runs concurrently on a bounded set of threads.
+
+Output stays deterministic regardless of completion order: every task writes
+warnings to a private list, and the lists are merged in declaration order
+once all tasks have finished.
+"""
+
+import contextvars
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .. import deadline as _deadline, progress as _progress
+from .._util import debug as _debug_fn, section_banner as _section_banner
+
+
+def _debug(msg: str) -> None:
+    _debug_fn("scheduler", msg)
+
+
+@dataclass
+class InspectorTask:
+    """One node in the inspector dependency graph.
+
+    ``fn`` receives the results of completed tasks (keyed by task name) and
+    the task's private warnings list.  Tasks with a ``title`` print a progress
+    banner when they start; untitled tasks are internal prerequisites.
+    """
+    name: str
+    fn: Callable[[Dict[str, Any], list], Any]
+    deps: Tuple[str, ...] = ()
+    title: Optional[str] = None
+
+
+def _validate(tasks: List[InspectorTask]) -> None:
+    """Reject unknown or forward dependencies.
+
+    Requiring every dependency to be declared earlier keeps the declaration
+    order a valid topological order, which is what the serial path and the
+    warning merge both rely on.
+    """
+    seen: set = set()
+    for task in tasks:
+        if task.name in seen:
+            raise ValueError(f"duplicate inspector task: {task.name}")
+        for dep in task.deps:
+            if dep not in seen:
+                raise ValueError(
+                    f"inspector task {task.name!r} depends on {dep!r}, "
+                    "which is not declared before it"
+                )
+        seen.add(task.name)
+
+
+def prune_tasks(tasks: List[InspectorTask], wanted: Iterable[str]) -> List[InspectorTask]:
+    """Return the tasks named in *wanted* plus everything they depend on.
+
+    Declaration order is preserved.  Unknown names raise ``ValueError``.
+    """
+    by_name = {t.name: t for t in tasks}
+    keep: set = set()
+    stack = list(wanted)
+    while stack:
+        name = stack.pop()
+        if name in keep:
+            continue
+        if name not in by_name:
+            raise ValueError(f"unknown inspector task: {name}")
+        keep.add(name)
+        stack.extend(by_name[name].deps)
+    return [t for t in tasks if t.name in keep]
+
+
+def _spawn(fn: Callable[[InspectorTask], Any], task: InspectorTask) -> Future:
+    """Run ``fn(task)`` on a new daemon thread; return a future for its result.
+
+    The thread runs in a copy of the caller's context, so run-wide context
+    variables (the perf recorder) are visible to the task.
+    """
+    fut: Future = Future()
+
+    def _run() -> None:
+        fut.set_running_or_notify_cancel()
+        try:
+            fut.set_result(fn(task))
+        except BaseException as exc:
+            fut.set_exception(exc)
+
+    ctx = contextvars.copy_context()
+    threading.Thread(target=ctx.run, args=(_run,), name=f"yoinkc-inspect-{task.name}",
+                     daemon=True).start()
+    return fut
+
+
+def run_tasks(tasks: List[InspectorTask], warnings: list, jobs: int = 1) -> Dict[str, Any]:
+    """Run *tasks* respecting their dependencies; return results by task name.
+
+    With ``jobs <= 1`` tasks run inline in declaration order.  Otherwise up to
+    *jobs* tasks run at once, each starting as soon as its dependencies have
+    finished.  Warnings from all tasks are appended to *warnings* in
+    declaration order.  An exception from any task (including SystemExit from
+    a fail-fast path) cancels tasks that have not started and is re-raised
+    at once; tasks already running are abandoned on daemon threads, so a
+    fail-fast exit does not wait for a slow sibling such as ``rpm -Va``.
+    """
+    _validate(tasks)
+    task_warnings: Dict[str, list] = {t.name: [] for t in tasks}
+    titled = [t for t in tasks if t.title]
+    step_of = {t.name: i for i, t in enumerate(titled, 1)}
+    total = len(titled)
+    results: Dict[str, Any] = {}
+
+    def _start(task: InspectorTask) -> Any:
+        step = {}
+        if task.title:
+            _section_banner(task.title, step_of[task.name], total)
+            step = {"step": step_of[task.name], "total": total}
+        _debug(f"start {task.name}")
+        # Deadline hits and progress events inside the task are attributed to it.
+        with _deadline.section(task.name), _progress.task(task.name, **step):
+            return task.fn(results, task_warnings[task.name])
+
+    try:
+        if jobs <= 1:
+            for task in tasks:
+                results[task.name] = _start(task)
+            return results
+
+        pending = list(tasks)
+        running: Dict[Future, InspectorTask] = {}
+        while pending or running:
+            ready = [t for t in pending if all(d in results for d in t.deps)]
+            for task in ready[:jobs - len(running)]:
+                pending.remove(task)
+                running[_spawn(_start, task)] = task
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for fut in done:
+                task = running.pop(fut)
+                results[task.name] = fut.result()
+                _debug(f"finished {task.name}")
+        return results
+    finally:
+        for task in tasks:
+            warnings.extend(task_warnings[task.name])
@@ -11,7 +11,10 @@ import tempfile
 from pathlib import Path
 from typing import List, Optional, Set
 
+from .. import deadline as _deadline, progress as _progress
+from ..cache import RPMDB
 from ..executor import Executor
+from ..rpmdb import RpmDatabase
 from ..schema import ConfigFileEntry, ConfigFileKind, ConfigSection, RpmSection
 from .._util import debug as _debug_fn, make_warning, run_rpm_query as _run_rpm_query
 
@@ -19,6 +22,11 @@ from .._util import debug as _debug_fn, make_warning, run_rpm_query as _run_rpm_
 def _debug(msg: str) -> None:
     _debug_fn("config", msg)
 
+
+# Inputs fingerprinted for the result cache (see yoinkc.cache).
+CACHE_INPUTS = (RPMDB, "etc")
+
+
 # ---------------------------------------------------------------------------
 # System-generated files to exclude from the "unowned" list.
 # These are created by systemd, package managers, or subsystem daemons —
@@ -220,13 +228,20 @@ def _is_excluded_unowned(path: str) -> bool:
     return False
 
 
-def _rpm_owned_paths(executor: Optional[Executor], host_root: Path, warnings: Optional[list] = None) -> Set[str]:
+def _rpm_owned_paths(
+    executor: Optional[Executor],
+    host_root: Path,
+    warnings: Optional[list] = None,
+    rpmdb: Optional[RpmDatabase] = None,
+) -> Set[str]:
     """Build set of all RPM-owned paths under /etc in a single bulk query.
 
     Uses `rpm -qa --queryformat '[%{FILENAMES}\\n]'` to list every file owned by every
     installed package in one pass, then filters to /etc. This is O(1) RPM queries instead
-    of O(n) per-package queries.
+    of O(n) per-package queries.  With *rpmdb* no query is needed at all.
     """
+    if rpmdb is not None:
+        return set(rpmdb.owned_paths("/etc"))
     if executor is None:
         return set()
     result = _run_rpm_query(executor, host_root, ["-qa", "--queryformat", "[%{FILENAMES}\n]"])
@@ -257,8 +272,15 @@ def _list_etc_recursive(host_root: Path, etc_dir: Path) -> List[Path]:
     return out
 
 
-def _get_owning_package(executor: Executor, host_root: Path, path: str) -> Optional[str]:
+def _get_owning_package(
+    executor: Executor,
+    host_root: Path,
+    path: str,
+    rpmdb: Optional[RpmDatabase] = None,
+) -> Optional[str]:
     """Return package name owning path, or None."""
+    if rpmdb is not None:
+        return rpmdb.owner(path)
     if not executor:
         return None
     r = _run_rpm_query(executor, host_root, ["-qf", path])
@@ -347,10 +369,12 @@ def run(
     rpm_owned_paths_override: Optional[Set[str]] = None,
     config_diffs: bool = False,
     warnings: Optional[list] = None,
+    rpmdb: Optional[RpmDatabase] = None,
 ) -> ConfigSection:
     """
     Run Config inspection. Requires rpm_section for rpm_va and dnf_history_removed.
-    If rpm_owned_paths_override is provided (e.g. from tests), use it; else compute via executor.
+    If rpm_owned_paths_override is provided (e.g. from tests), use it; else compute via
+    *rpmdb* when given, or via executor.
     """
     host_root = Path(host_root)
     section = ConfigSection()
@@ -369,6 +393,7 @@ def run(
 
     # 1) RPM-owned modified files (from rpm_va)
     config_diff_failures = 0
+    counter = _progress.Counter("config diffs", len(rpm_va_by_path)) if config_diffs else None
     for path, entry in rpm_va_by_path.items():
         full = host_root / path.lstrip("/")
         if not full.exists():
@@ -378,8 +403,9 @@ def run(
         except Exception:
             content = ""
         diff_against_rpm = None
-        if config_diffs and executor:
-            pkg = _get_owning_package(executor, host_root, path) or entry.package
+        # Past the time budget the file is kept, undiffed.
+        if config_diffs and executor and not _deadline.expired("config diffs"):
+            pkg = _get_owning_package(executor, host_root, path, rpmdb=rpmdb) or entry.package
             path_in_rpm = path.lstrip("/")
             original = None
 
@@ -393,6 +419,7 @@ def run(
             if original is None and pkg:
                 original = _download_rpm_from_repo(executor, host_root, pkg, path_in_rpm)
 
+            counter.advance()
             if original is not None:
                 diff_against_rpm = _unified_diff(original, content, path)
             else:
@@ -419,9 +446,11 @@ def run(
     if rpm_owned_paths_override is not None:
         rpm_owned = rpm_owned_paths_override
     else:
-        rpm_owned = _rpm_owned_paths(executor, host_root, warnings=warnings)
+        rpm_owned = _rpm_owned_paths(executor, host_root, warnings=warnings, rpmdb=rpmdb)
     all_etc_files = _list_etc_recursive(host_root, etc)
     for f in all_etc_files:
+        if _deadline.expired("unowned file scan"):
+            break
         try:
             rel = f.relative_to(host_root)
             path_str = "/" + str(rel)
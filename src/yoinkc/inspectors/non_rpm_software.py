@@ -12,11 +12,13 @@ User home directories (/home) are intentionally excluded — artifacts found
 there are overwhelmingly development checkouts, not deployed services.
 """
 
+import asyncio
 import re
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-from ..executor import Executor
+from .. import deadline as _deadline, progress as _progress
+from ..executor import AsyncExecutor, Executor, run_sync, to_async
 from ..schema import NonRpmSoftwareSection, NonRpmItem, PipPackage, ConfigFileEntry, ConfigFileKind
 from .._util import debug as _debug_fn, safe_iterdir as _safe_iterdir, safe_read as _safe_read, make_warning, parse_dist_info_name as _parse_dist_info_name
 from . import is_dev_artifact, filtered_rglob
@@ -26,6 +28,10 @@ def _debug(msg: str) -> None:
     _debug_fn("non-rpm", msg)
 
 
+# Inputs fingerprinted for the result cache (see yoinkc.cache).
+CACHE_INPUTS = ("opt", "srv", "usr/local", "usr/lib/python3", "usr/lib64/python3")
+
+
 # Quick patterns for the default (4KB head) scan
 VERSION_PATTERNS = [
     re.compile(rb"version\s*[=:]\s*[\"']?([0-9]+\.[0-9]+(?:\.[0-9]+)?)", re.I),
@@ -82,20 +88,35 @@ def _classify_binary(executor: Optional[Executor], path: Path) -> Optional[dict]
     """Use readelf to classify a binary. Returns classification dict or None."""
     if not executor:
         return None
-
+    if _deadline.expired("binary classification"):
+        return None
     _debug(f"readelf -S {path}")
     r = executor(["readelf", "-S", str(path)])
     if r.returncode != 0:
         _debug(f"readelf -S failed (rc={r.returncode}): {r.stderr.strip()[:200]}")
         return None
+    rd = executor(["readelf", "-d", str(path)])
+    return _binary_info(path, r.stdout, rd.stdout if rd.returncode == 0 else "")
 
-    sections_output = r.stdout
 
+async def _classify_binary_async(executor: AsyncExecutor, path: Path) -> Optional[dict]:
+    """Async variant of _classify_binary."""
+    if _deadline.expired("binary classification"):
+        return None
+    _debug(f"readelf -S {path}")
+    r = await executor(["readelf", "-S", str(path)])
+    if r.returncode != 0:
+        _debug(f"readelf -S failed (rc={r.returncode}): {r.stderr.strip()[:200]}")
+        return None
+    rd = await executor(["readelf", "-d", str(path)])
+    return _binary_info(path, r.stdout, rd.stdout if rd.returncode == 0 else "")
+
+
+def _binary_info(path: Path, sections_output: str, dynamic_output: str) -> dict:
+    """Build the classification dict from ``readelf -S`` and ``readelf -d`` output."""
     is_go = ".note.go.buildid" in sections_output or ".gopclntab" in sections_output
     is_rust = ".rustc" in sections_output
 
-    rd = executor(["readelf", "-d", str(path)])
-    dynamic_output = rd.stdout if rd.returncode == 0 else ""
     is_static = "no dynamic section" in dynamic_output.lower() or not dynamic_output.strip()
     shared_libs: List[str] = []
     for line in dynamic_output.splitlines():
@@ -113,6 +134,27 @@ def _classify_binary(executor: Optional[Executor], path: Path) -> Optional[dict]
     }
 
 
+def _classify_binaries(executor: Optional[Executor], paths: List[Path]) -> List[Optional[dict]]:
+    """Classify *paths* with readelf, many files in flight at once.
+
+    Returns one result per path, in order.
+    """
+    if not executor or not paths:
+        return [None] * len(paths)
+    aexec = to_async(executor)
+    counter = _progress.Counter("readelf", len(paths))
+
+    async def _one(path: Path) -> Optional[dict]:
+        try:
+            return await _classify_binary_async(aexec, path)
+        finally:
+            counter.advance()
+
+    async def _all() -> List[Optional[dict]]:
+        return list(await asyncio.gather(*(_one(p) for p in paths)))
+    return run_sync(_all())
+
+
 def _is_binary(executor: Optional[Executor], host_root: Path, path: Path) -> bool:
     if not executor:
         return False
@@ -249,7 +291,7 @@ def _scan_venv_packages(
             pass
 
         # Try pip list --path for a richer package list
-        if executor:
+        if executor and not _deadline.expired("pip list"):
             try:
                 sp_paths = list(venv_path.rglob("site-packages"))
                 pip_ok = False
@@ -310,8 +352,13 @@ def _classify_file(
     f: Path,
     executor: Optional[Executor],
     deep: bool,
+    binary_info: Optional[dict] = None,
 ) -> NonRpmItem:
-    """Classify a single file and return a NonRpmItem."""
+    """Classify a single file and return a NonRpmItem.
+
+    *binary_info* is a readelf classification already obtained for *f*
+    (see _classify_binaries); when omitted readelf is run here.
+    """
     item = NonRpmItem(
         path=str(f.relative_to(host_root)),
         name=f.name,
@@ -322,7 +369,8 @@ def _classify_file(
         _debug(f"classify {f.name}: no executor, returning low confidence")
         return item
 
-    binary_info = _classify_binary(executor, f)
+    if binary_info is None:
+        binary_info = _classify_binary(executor, f)
     if binary_info:
         item.lang = binary_info["lang"]
         item.static = binary_info["static"]
@@ -356,13 +404,25 @@ def _scan_fhs_dir_files(
     except (PermissionError, OSError):
         return
 
+    files = [
+        f for f in entries
+        if not f.name.startswith(".")
+        and (f.is_file() or f.is_symlink())
+        and not (f.is_symlink() and not f.exists())
+    ]
+    # readelf every file concurrently; the rest of classification is cheap
+    # and stays in directory order.
+    binary_infos = dict(zip(files, _classify_binaries(executor, files)))
+
     for f in entries:
         if f.name.startswith("."):
             continue
-        if f.is_file() or f.is_symlink():
-            if f.is_symlink() and not f.exists():
-                continue
-            item = _classify_file(host_root, f, executor, deep)
+        if f in binary_infos:
+            # Past the time budget, keep listing files without running tools.
+            if executor and _deadline.expired("file classification"):
+                executor = None
+            # {} marks "readelf already ran and found nothing".
+            item = _classify_file(host_root, f, executor, deep, binary_info=binary_infos[f] or {})
             section.items.append(item)
         elif f.is_dir():
             # Recurse one level for lib subdirs (e.g. lib/python3.x/)
@@ -416,6 +476,8 @@ def _scan_dirs(
                     for f in filtered_rglob(entry, "*"):
                         if not f.is_file():
                             continue
+                        if _deadline.expired("directory scan"):
+                            break
                         binary_info = _classify_binary(executor, f)
                         if binary_info:
                             item.lang = binary_info["lang"]
@@ -1,22 +1,31 @@
 """
-RPM inspector: package list, rpm -Va, repo files, dnf history removed.
+RPM inspector: package list, file verification (rpm -Va), repo files, dnf history removed.
 Baseline is the target bootc base image package list (or --baseline-packages file).
 """
 
+import asyncio
+import hashlib
 import os
 import re
 from pathlib import Path
-from typing import List, Optional, Set, Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
-from .._util import debug as _debug_fn, make_warning, run_rpm_query as _util_run_rpm_query, _RPM_LOCK_DEFINE as _UTIL_RPM_LOCK_DEFINE
+from .._util import debug as _debug_fn, make_warning, run_rpm_query as _util_run_rpm_query, run_rpm_query_async, _RPM_LOCK_DEFINE as _UTIL_RPM_LOCK_DEFINE
 
 
 def _debug(msg: str) -> None:
     _debug_fn("rpm", msg)
 
 
+from .. import deadline as _deadline, progress as _progress
 from ..baseline import BaselineResolver, load_baseline_packages_file
-from ..executor import Executor
+from ..batch import BatchRunner
+from ..cache import DNF_HISTORY, RPMDB, SectionCache, model_section
+from ..depgraph import DependencyClosure
+from ..dnf_history import DnfHistory
+from ..executor import AsyncExecutor, Executor, run_sync, to_async
+from ..rpmdb import DEPS_QUERYFORMAT, RpmDatabase
+from ..verify import DEFAULT_JOBS as DEFAULT_VERIFY_JOBS, DEFAULT_SCOPE, VerifyCache, verify_files
 from ..schema import (
     PackageEntry,
     PackageState,
@@ -26,6 +35,14 @@ from ..schema import (
 )
 
 
+# Inputs fingerprinted for the result cache (see yoinkc.cache): what the
+# package classification reads after the baseline is known.  File
+# verification is not cached here: it covers packaged files anywhere on the
+# host, and the native verifier has its own per-file cache.
+CACHE_INPUTS = (RPMDB,) + DNF_HISTORY + (
+    "etc/yum.repos.d", "etc/dnf", "etc/pki/rpm-gpg", "etc/os-release",
+)
+
 RPM_QA_QUERYFORMAT = r"%{EPOCH}:%{NAME}-%{VERSION}-%{RELEASE}.%{ARCH}"
 
 _RPM_LOCK_DEFINE = _UTIL_RPM_LOCK_DEFINE
@@ -140,20 +157,38 @@ def _populate_source_repos(
     executor: Executor,
     host_root: Path,
     packages: List["PackageEntry"],
+    history: Optional[DnfHistory] = None,
 ) -> None:
     """Set source_repo on each PackageEntry.
 
-    Primary: dnf repoquery --installed (reliable across RHEL 9/10).
-    Fallback: rpm -qi (checking both "From repo" and "Repository").
+    From dnf's history database when *history* is given.  Otherwise
+    dnf repoquery --installed (reliable across RHEL 9/10), falling back
+    to rpm -qi (checking both "From repo" and "Repository").
     """
+    if history is not None:
+        for p in packages:
+            p.source_repo = history.from_repo(p.name, p.epoch, p.version, p.release, p.arch) or ""
+        _debug(f"source_repo from dnf history for "
+               f"{sum(1 for p in packages if p.source_repo)}/{len(packages)} packages")
+        return
+    run_sync(_populate_source_repos_async(to_async(executor), host_root, packages))
+
+
+async def _populate_source_repos_async(
+    executor: AsyncExecutor,
+    host_root: Path,
+    packages: List["PackageEntry"],
+) -> None:
+    """Async variant of _populate_source_repos; batches run concurrently."""
     if not packages:
         return
     name_set = {p.name for p in packages}
     names = sorted(name_set)
     repo_map: dict = {}
+    counter = _progress.Counter("source repos", len(names))
 
     # --- Primary: dnf repoquery ---
-    def _try_dnf() -> bool:
+    async def _try_dnf() -> bool:
         # from_repo is stored in dnf's own database on the host, not in the raw
         # RPM DB that --installroot accesses.  Run on the host via nsenter when
         # inside a container; plain dnf when already on the host.
@@ -163,7 +198,7 @@ def _populate_source_repos(
             cmd_base = ["nsenter", "-t", "1", "-m", "-u", "-i", "-n", "--",
                         "dnf", "repoquery", "--installed", "--queryformat", "%{name} %{from_repo}\n"]
         # Probe with the first package
-        probe = executor(cmd_base + [names[0]])
+        probe = await executor(cmd_base + [names[0]])
         if probe.returncode != 0:
             _debug(f"dnf repoquery probe failed (rc={probe.returncode}), falling back to rpm -qi")
             return False
@@ -172,13 +207,17 @@ def _populate_source_repos(
             parts = line.strip().split(None, 1)
             if len(parts) == 2 and parts[0] in name_set:
                 repo_map[parts[0]] = parts[1]
-        # Process remaining in batches
-        batch_size = 100
-        remaining = names[1:]
-        for i in range(0, len(remaining), batch_size):
-            batch = remaining[i:i + batch_size]
-            result = executor(cmd_base + batch)
-            if result.returncode != 0:
+        # Process remaining in batches; results are merged in batch order
+        async def _batch(chunk: List[str]):
+            if _deadline.expired("source repo lookup"):
+                return None
+            result = await executor(cmd_base + chunk)
+            counter.advance(len(chunk))
+            return result
+
+        batches = await BatchRunner(initial=100).run(_batch, names[1:], fixed_args=cmd_base)
+        for _, result in batches:
+            if result is None or result.returncode != 0:
                 continue
             for line in result.stdout.strip().splitlines():
                 parts = line.strip().split(None, 1)
@@ -187,12 +226,17 @@ def _populate_source_repos(
         return True
 
     # --- Fallback: rpm -qi ---
-    def _try_rpm() -> None:
-        batch_size = 100
-        for i in range(0, len(names), batch_size):
-            batch = names[i:i + batch_size]
-            result = _run_rpm_query(executor, host_root, ["-qi"] + batch)
-            if result.returncode != 0:
+    async def _try_rpm() -> None:
+        async def _batch(chunk: List[str]):
+            if _deadline.expired("source repo lookup"):
+                return None
+            result = await run_rpm_query_async(executor, host_root, ["-qi"] + chunk)
+            counter.advance(len(chunk))
+            return result
+
+        batches = await BatchRunner(initial=100).run(_batch, names, fixed_args=["rpm", "-qi"])
+        for _, result in batches:
+            if result is None or result.returncode != 0:
                 continue
             cur_name = ""
             for line in result.stdout.splitlines():
@@ -205,8 +249,8 @@ def _populate_source_repos(
                     if len(parts) == 2 and cur_name and cur_name not in repo_map:
                         repo_map[cur_name] = parts[1].strip()
 
-    if not _try_dnf():
-        _try_rpm()
+    if not await _try_dnf():
+        await _try_rpm()
 
     for p in packages:
         p.source_repo = repo_map.get(p.name, "")
@@ -361,8 +405,19 @@ def _collect_gpg_keys(host_root: Path, repo_files: List[RepoFile]) -> List[RepoF
     return [RepoFile(path=p, content=c) for p, c in sorted(seen.items())]
 
 
-def _dnf_history_removed(executor: Executor, host_root: Path, warnings: Optional[list] = None) -> List[str]:
-    """Run dnf history and collect package names from Remove transactions."""
+def _dnf_history_removed(
+    executor: Executor,
+    host_root: Path,
+    warnings: Optional[list] = None,
+    history: Optional[DnfHistory] = None,
+) -> List[str]:
+    """Collect package names from Remove transactions.
+
+    Read from dnf's history database when *history* is given, otherwise
+    from ``dnf history list`` and ``dnf history info`` per transaction.
+    """
+    if history is not None:
+        return list(history.removed)
     result = executor(["dnf", "history", "list", "-q"], cwd=str(host_root))
     if result.returncode != 0:
         if warnings is not None:
@@ -400,53 +455,217 @@ def _run_rpm_query(executor: Executor, host_root: Path, args: List[str]):
     return _util_run_rpm_query(executor, host_root, args)
 
 
+def _rpm_verify_commands(host_root: Path, args: List[str]) -> Tuple[List[str], Optional[List[str]]]:
+    """Return the ``rpm -V`` command for *args* and its --root-only retry (None on /)."""
+    if str(host_root) == "/":
+        return ["rpm"] + args, None
+    return (["rpm", "--root", str(host_root), "--dbpath", "/var/lib/rpm"] + _RPM_LOCK_DEFINE + args,
+            ["rpm", "--root", str(host_root)] + _RPM_LOCK_DEFINE + args)
+
+
+def _run_rpm_verify(executor: Executor, host_root: Path, args: List[str]):
+    """Run ``rpm -V``/``-Va`` against *host_root*.
+
+    rc != 0 is normal — it means files were modified.  --root tells rpm
+    where to verify files; --dbpath tells it where the database lives.
+    Both are needed when the container's rpm binary uses a different
+    default dbpath than the host (Fedora uses /usr/lib/sysimage/rpm,
+    RHEL 9 uses /var/lib/rpm).
+    """
+    primary, fallback = _rpm_verify_commands(host_root, args)
+    _debug(f"running: {' '.join(primary[:8])}{' ...' if len(primary) > 8 else ''}")
+    result = executor(primary)
+    if fallback is not None and result.stderr and "cannot open Packages database" in result.stderr:
+        _debug("rpm -V --dbpath failed, retrying with --root only")
+        result = executor(fallback)
+    return result
+
+
+def _rpm_verify_sharded(
+    executor: Executor,
+    host_root: Path,
+    names: List[str],
+    flags: List[str],
+    jobs: int,
+) -> Optional[List[RpmVaEntry]]:
+    """Verify *names* with *jobs* concurrent ``rpm -V`` shards.
+
+    Each modified file is attributed to the package that owns it within
+    its shard.  Returns None if any shard fails, so the caller can fall
+    back to a single ``rpm -Va``.
+    """
+    return run_sync(_rpm_verify_sharded_async(to_async(executor, concurrency=jobs),
+                                              host_root, names, flags, jobs))
+
+
+async def _rpm_verify_sharded_async(
+    executor: AsyncExecutor,
+    host_root: Path,
+    names: List[str],
+    flags: List[str],
+    jobs: int,
+) -> Optional[List[RpmVaEntry]]:
+    """Async variant of _rpm_verify_sharded."""
+    # Round-robin keeps shards of similar size even when related (and
+    # similarly large) packages sort next to each other.
+    shards = [names[i::jobs] for i in range(min(jobs, len(names)))]
+    counter = _progress.Counter("rpm -V", len(names))
+
+    async def _verify(shard: List[str]) -> Optional[List[RpmVaEntry]]:
+        primary, fallback = _rpm_verify_commands(host_root, ["-V"] + flags + shard)
+        result = await executor(primary)
+        if fallback is not None and result.stderr and "cannot open Packages database" in result.stderr:
+            result = await executor(fallback)
+        counter.advance(len(shard))
+        if result.returncode in (-1, 127) or (result.returncode != 0 and not result.stdout.strip()):
+            _debug(f"rpm -V shard failed (rc={result.returncode}): {result.stderr[:200]}")
+            return None
+        entries = [e for e in _parse_rpm_va(result.stdout) if e.path.startswith("/")]
+        if entries:
+            owners = await run_rpm_query_async(
+                executor, host_root, ["-q", "--queryformat", "[%{=NAME}\t%{FILENAMES}\n]"] + shard)
+            if owners.returncode == 0:
+                owner_of: dict = {}
+                for line in owners.stdout.splitlines():
+                    name, _, path = line.partition("\t")
+                    owner_of.setdefault(path, name)
+                for e in entries:
+                    e.package = owner_of.get(e.path)
+        return entries
+
+    results = await asyncio.gather(*(_verify(shard) for shard in shards))
+    if any(r is None for r in results):
+        _debug("sharded rpm -V failed, falling back to a single rpm -Va")
+        return None
+    entries = sorted((e for shard in results for e in shard), key=lambda e: e.path)
+    _debug(f"rpm -V in {len(shards)} shards: {len(entries)} modified files")
+    return entries
+
+
 def _classify_deps_via_rpm(
     executor: Executor,
     host_root: Path,
     added_names: Set[str],
 ) -> dict:
-    """Build dependency graph using rpm -qR + --whatprovides.
+    """Build the direct dependency graph from rpm's requires and provides.
 
     Returns ``depends_on`` where ``depends_on[A] = {B, C}`` means A directly
-    requires B and C (within *added_names*).
+    requires B and C (within *added_names*).  One ``rpm -qa`` query
+    (``DEPS_QUERYFORMAT``) returns every package's requires and provides,
+    and each requirement is resolved in memory against that capability
+    index.  If the bulk query fails, falls back to ``rpm -qR`` +
+    ``--whatprovides`` per package.
     """
+    index = RpmDatabase.query(executor, host_root, DEPS_QUERYFORMAT)
+    if index is not None:
+        _debug(f"resolving dependencies from a capability index of {len(index)} packages")
+        return _direct_deps(index, added_names)
+    return run_sync(_classify_deps_via_rpm_async(to_async(executor), host_root, added_names))
+
+
+async def _classify_deps_via_rpm_async(
+    executor: AsyncExecutor,
+    host_root: Path,
+    added_names: Set[str],
+) -> dict:
+    """Async variant of _classify_deps_via_rpm; packages are queried concurrently."""
     depends_on: dict = {name: set() for name in added_names}
-    name_list = sorted(added_names)
-    batch_size = 50
+    # One runner for every package, so batch sizing learns across them.
+    runner = BatchRunner(initial=50)
+    counter = _progress.Counter("rpm -qR", len(added_names))
 
-    for i in range(0, len(name_list), batch_size):
-        batch = name_list[i:i + batch_size]
+    async def _one(pkg_name: str) -> None:
+        try:
+            await _walk(pkg_name)
+        finally:
+            counter.advance()
+
+    async def _walk(pkg_name: str) -> None:
+        if _deadline.expired("rpm dependency walk"):
+            return
+        result = await run_rpm_query_async(executor, host_root, ["-qR", pkg_name])
+        if result.returncode != 0 or _deadline.expired("rpm dependency walk"):
+            return
+
+        caps = set()
+        for line in result.stdout.splitlines():
+            cap = line.strip()
+            if cap and not cap.startswith("rpmlib(") and not cap.startswith("/"):
+                caps.add(cap.split()[0])
+
+        if not caps:
+            return
+
+        wp_args = ["rpm", "-q", "--whatprovides"]
+        wp_results = await runner.run(
+            lambda chunk: run_rpm_query_async(executor, host_root, wp_args[1:] + chunk),
+            sorted(caps), fixed_args=wp_args,
+        )
+        for _, wp_result in wp_results:
+            # rpm exits non-zero when any capability in the batch has no
+            # provider, but still prints the providers of all the others.
+            for pline in wp_result.stdout.splitlines():
+                pline = pline.strip()
+                if not pline or "no package provides" in pline:
+                    continue
+                match = re.match(r"^(.+?)-\d", pline)
+                provider = match.group(1) if match else pline.split("-")[0]
+                if provider in added_names and provider != pkg_name:
+                    depends_on[pkg_name].add(provider)
 
-        for pkg_name in batch:
-            result = _run_rpm_query(executor, host_root, ["-qR", pkg_name])
-            if result.returncode != 0:
-                continue
+    await asyncio.gather(*(_one(name) for name in sorted(added_names)))
+    return depends_on
 
-            caps = set()
-            for line in result.stdout.splitlines():
-                cap = line.strip()
-                if cap and not cap.startswith("rpmlib(") and not cap.startswith("/"):
-                    caps.add(cap.split()[0])
 
-            if not caps:
+def _direct_deps(index: RpmDatabase, added_names: Set[str]) -> dict:
+    """Resolve each added package's requires against *index*.
+
+    Matches what ``rpm -qR`` + ``--whatprovides`` gives: rpmlib and file
+    requires are skipped and only providers within *added_names* count.
+    """
+    depends_on: dict = {name: set() for name in added_names}
+    for name in added_names:
+        pkg = index.package(name)
+        if pkg is None:
+            continue
+        for cap in pkg.requires:
+            if cap.startswith("rpmlib(") or cap.startswith("/"):
                 continue
+            for provider in index.resolve(cap):
+                if provider in added_names and provider != name:
+                    depends_on[name].add(provider)
+    return depends_on
 
-            cap_list = sorted(caps)
-            for j in range(0, len(cap_list), batch_size):
-                cap_batch = cap_list[j:j + batch_size]
-                wp_result = _run_rpm_query(executor, host_root, ["-q", "--whatprovides"] + cap_batch)
-                if wp_result.returncode != 0:
-                    continue
-                for pline in wp_result.stdout.splitlines():
-                    pline = pline.strip()
-                    if not pline or "no package provides" in pline:
-                        continue
-                    match = re.match(r"^(.+?)-\d", pline)
-                    provider = match.group(1) if match else pline.split("-")[0]
-                    if provider in added_names and provider != pkg_name:
-                        depends_on[pkg_name].add(provider)
 
-    return depends_on
+def _dependency_graph(rpmdb: RpmDatabase) -> Dict[str, Set[str]]:
+    """Map every installed package to the packages it directly depends on.
+
+    Requires and recommends (weak deps dnf installs by default) are both
+    edges; rich dependencies resolve to their installed alternatives and
+    file requires to the owning packages.  Self-edges are dropped.
+    """
+    graph: Dict[str, Set[str]] = {}
+    for pkg in rpmdb.packages:
+        deps = graph.setdefault(pkg.name, set())
+        for cap in pkg.requires + pkg.recommends:
+            if not cap.startswith("rpmlib("):
+                deps.update(rpmdb.resolve(cap))
+        deps.discard(pkg.name)
+    return graph
+
+
+def _classify_deps_via_rpmdb(rpmdb: RpmDatabase, added_names: Set[str]) -> dict:
+    """Build the transitive dependency graph from the shared RPM index.
+
+    Same result as ``_classify_deps_via_dnf`` without a dnf process per
+    package: the closure of the graph of all installed packages is
+    computed in memory, so dependencies reached through baseline
+    packages still count.  ``depends_on[A]`` is restricted to
+    *added_names*.
+    """
+    closure = DependencyClosure(_dependency_graph(rpmdb))
+    added_mask = closure.mask(added_names)
+    return {name: set(closure.descendants(name, added_mask)) for name in added_names}
 
 
 def _classify_deps_via_dnf(
@@ -470,8 +689,10 @@ def _classify_deps_via_dnf(
                  "--queryformat", "%{name}\n"]
 
     name_list = sorted(added_names)
+    counter = _progress.Counter("dnf repoquery", len(name_list))
 
     first_result = executor(cmd_base + [name_list[0]])
+    counter.advance()
     if first_result.returncode != 0:
         _debug(f"dnf repoquery unavailable (rc={first_result.returncode}), "
                "will fall back to rpm")
@@ -485,7 +706,10 @@ def _classify_deps_via_dnf(
             depends_on[name_list[0]].add(dep_name)
 
     for pkg_name in name_list[1:]:
+        if _deadline.expired("dnf dependency walk"):
+            break
         result = executor(cmd_base + [pkg_name])
+        counter.advance()
         if result.returncode != 0:
             continue
         for line in result.stdout.splitlines():
@@ -500,6 +724,8 @@ def _classify_leaf_auto(
     executor: Executor,
     host_root: Path,
     packages_added: List["PackageEntry"],
+    rpmdb: Optional[RpmDatabase] = None,
+    history: Optional[DnfHistory] = None,
 ) -> tuple:
     """Split added packages into leaf vs auto with per-leaf dependency tree.
 
@@ -507,17 +733,25 @@ def _classify_leaf_auto(
     maps each leaf package name to the sorted list of auto packages it
     pulls in (transitively, within the added set).
 
-    Tries ``dnf repoquery --recursive`` first for accurate transitive
-    resolution (handles weak deps, rich boolean deps, etc).  Falls back
-    to ``rpm -qR`` + ``--whatprovides`` if dnf is unavailable.
+    With *rpmdb*, the transitive closure is computed in-process from the
+    index (requires, weak deps and rich deps included).  Otherwise tries
+    ``dnf repoquery --recursive`` per package, falling back to ``rpm -qR``
+    + ``--whatprovides`` if dnf is unavailable.  Install reasons come from
+    *history* when given, else from ``dnf repoquery --userinstalled``.
     """
     added_names = {p.name for p in packages_added}
 
     # Use dnf's user-installed tracking when available — it directly tells us
     # which packages the operator explicitly requested vs pulled in as deps.
-    user_installed = _query_user_installed(executor, host_root)
+    if history is not None:
+        user_installed: Optional[Set[str]] = history.user_installed(added_names)
+    else:
+        user_installed = _query_user_installed(executor, host_root)
 
-    depends_on = _classify_deps_via_dnf(executor, host_root, added_names)
+    if rpmdb is not None:
+        depends_on = _classify_deps_via_rpmdb(rpmdb, added_names)
+    else:
+        depends_on = _classify_deps_via_dnf(executor, host_root, added_names)
     transitive = depends_on is not None
 
     if depends_on is None:
@@ -547,21 +781,15 @@ def _classify_leaf_auto(
     auto_set = set(auto)
     leaf_dep_tree: dict = {}
     if transitive:
-        # dnf repoquery --recursive already gave us the transitive closure
+        # The index walk or dnf repoquery --recursive gave the transitive closure
         for lf in leaf:
             leaf_dep_tree[lf] = sorted(depends_on.get(lf, set()) & auto_set)
     else:
-        # rpm gives only direct deps; walk the graph
+        # rpm gives only direct deps; close the graph once for all leaves
+        closure = DependencyClosure(depends_on)
+        auto_mask = closure.mask(auto_set)
         for lf in leaf:
-            reachable: Set[str] = set()
-            stack = list(depends_on.get(lf, set()))
-            while stack:
-                dep = stack.pop()
-                if dep in reachable:
-                    continue
-                reachable.add(dep)
-                stack.extend(depends_on.get(dep, set()) - reachable)
-            leaf_dep_tree[lf] = sorted(reachable & auto_set)
+            leaf_dep_tree[lf] = closure.descendants(lf, auto_mask)
 
     return leaf, auto, leaf_dep_tree
 
@@ -575,18 +803,49 @@ def run(
     target_version: Optional[str] = None,
     target_image: Optional[str] = None,
     preflight_baseline: Optional[Tuple[Optional[Set[str]], Optional[str], bool]] = None,
+    join_baseline: Optional[Callable[[], Tuple[Optional[Set[str]], Optional[str], bool]]] = None,
+    rpmdb: Optional[RpmDatabase] = None,
+    verify_scope: str = DEFAULT_SCOPE,
+    verify_jobs: Optional[int] = None,
+    verify_cache: Optional[VerifyCache] = None,
+    section_cache: Optional[SectionCache] = None,
 ) -> RpmSection:
     """Run RPM inspection.
 
     Baseline comes from querying the target bootc base image via podman,
     or from ``--baseline-packages`` file.  If neither is available,
     ``no_baseline=True`` and all installed packages are treated as added.
+    When *rpmdb* is given, the package list and the rpm dependency
+    fallback come from it instead of separate rpm queries, and package
+    files are verified in-process instead of with ``rpm -Va``.
+    *verify_scope* (see ``yoinkc.verify``) limits which files are verified.
+    *verify_jobs* sets the native verifier's worker count; without *rpmdb*,
+    a value above 1 splits ``rpm -V`` into that many concurrent shards,
+    falling back to one ``rpm -Va`` if a shard fails.  *verify_cache*
+    lets the native verifier skip re-hashing files unchanged since an
+    earlier run.
+    *join_baseline*, when *preflight_baseline* is not given, returns the
+    baseline once a background query finishes; it is called only after
+    the package list and file verification, just before subtraction.
+    Removed packages, install reasons and source repos are read from dnf's
+    history database when the host has one, else from dnf commands.
+    With *section_cache*, everything after the baseline join (subtraction,
+    source repos, leaf/auto classification, repo files, dnf history) is
+    reused while the rpmdb, dnf history, repo configuration and baseline
+    are unchanged; file verification always runs.
     """
     host_root = Path(host_root)
     section = RpmSection()
-
-    # 1) rpm -qa
-    if executor is not None:
+    history = DnfHistory.load(host_root)
+
+    # 1) rpm -qa (from the shared index when it loaded)
+    if rpmdb is not None:
+        installed = [
+            PackageEntry(name=p.name, epoch=p.epoch, version=p.version,
+                         release=p.release, arch=p.arch)
+            for p in rpmdb.packages if p.name not in _VIRTUAL_PACKAGES
+        ]
+    elif executor is not None:
         dbpath = str(host_root / "var" / "lib" / "rpm")
         cmd_qa = ["rpm", "--dbpath", dbpath, "-qa", "--queryformat", RPM_QA_QUERYFORMAT + "\\n"]
         result_qa = executor(cmd_qa)
@@ -606,10 +865,38 @@ def run(
     else:
         installed = []
 
-    # 2) Baseline from base image (or file, or fallback)
+    # 2) Verify package files: natively against the rpmdb index when it
+    #    loaded, otherwise with rpm — sharded rpm -V with --verify-jobs,
+    #    else (or if a shard fails) a single rpm -Va.  This needs no
+    #    baseline, so it runs before waiting for one.
+    if rpmdb is not None:
+        rpm_va = verify_files(rpmdb, host_root, scope=verify_scope,
+                                      jobs=verify_jobs or DEFAULT_VERIFY_JOBS, cache=verify_cache)
+    elif executor is not None:
+        va_flags = ["--nodeps", "--noscripts"]
+        if verify_scope == "config":
+            va_flags.append("--configfiles")
+        entries = None
+        if verify_jobs and verify_jobs > 1 and installed:
+            entries = _rpm_verify_sharded(executor, host_root, sorted({p.name for p in installed}),
+                                          va_flags, verify_jobs)
+        if entries is None:
+            result_va = _run_rpm_verify(executor, host_root, ["-Va"] + va_flags)
+            _debug(f"rpm -Va: rc={result_va.returncode}, stdout={len(result_va.stdout)} bytes, stderr={result_va.stderr[:200] if result_va.stderr else ''}")
+            entries = _parse_rpm_va(result_va.stdout)
+        rpm_va = entries
+        if verify_scope == "etc":
+            rpm_va = [e for e in rpm_va if e.path.startswith("/etc/")]
+    else:
+        rpm_va = []
+
+    # 3) Baseline from base image (or file, or fallback), joining a
+    #    background query if one was started.
     baseline_names: Optional[Set[str]] = None
     section.no_baseline = False
 
+    if preflight_baseline is None and join_baseline is not None:
+        preflight_baseline = join_baseline()
     if preflight_baseline is not None:
         baseline_set, base_image, no_baseline = preflight_baseline
         section.base_image = base_image
@@ -648,91 +935,90 @@ def run(
             section.no_baseline = True
             baseline_names = set()
 
-    if installed:
-        installed_names = {p.name for p in installed}
-        _debug(f"installed package count: {len(installed_names)}")
-        # Exclude tool prerequisites installed by run-yoinkc.sh so they don't
-        # appear in the migration output or the generated Containerfile.
-        _prereq_exclude: Set[str] = set()
-        _prereq_raw = os.environ.get("YOINKC_EXCLUDE_PREREQS", "").split()
-        if _prereq_raw:
-            _prereq_exclude = set(_prereq_raw)
-            _debug(f"YOINKC_EXCLUDE_PREREQS: will exclude tool prerequisites: {sorted(_prereq_exclude)}")
-        if baseline_names is not None and not section.no_baseline:
-            added_names = installed_names - baseline_names
-            if _prereq_exclude:
-                _excluded = added_names & _prereq_exclude
-                if _excluded:
-                    _debug(f"excluded tool prerequisites from added set: {sorted(_excluded)}")
-                    added_names -= _excluded
-            base_only_names = baseline_names - installed_names
-            matched_names = installed_names & baseline_names
-            _debug(f"baseline has {len(baseline_names)} names, "
-                   f"installed has {len(installed_names)} names")
-            _debug(f"matched={len(matched_names)}, "
-                   f"added (installed-baseline, after prereq exclusion)={len(added_names)}, "
-                   f"base-image-only (baseline-installed)={len(base_only_names)}")
-            section.baseline_package_names = sorted(baseline_names)
-            for p in installed:
-                if p.name in added_names:
-                    p.state = PackageState.ADDED
-                    section.packages_added.append(p)
-            for name in sorted(base_only_names):
-                section.base_image_only.append(
-                    PackageEntry(name=name, epoch="0", version="", release="", arch="noarch", state=PackageState.BASE_IMAGE_ONLY)
-                )
-        else:
-            section.baseline_package_names = None
-            for p in installed:
-                if p.name not in _prereq_exclude:
-                    p.state = PackageState.ADDED
-                    section.packages_added.append(p)
-            if _prereq_exclude:
-                _skipped = [p.name for p in installed if p.name in _prereq_exclude]
-                if _skipped:
-                    _debug(f"(no-baseline) excluded tool prerequisites: {sorted(_skipped)}")
-
-    # 2b) Source repo per added package
-    if executor is not None and section.packages_added:
-        _populate_source_repos(executor, host_root, section.packages_added)
-
-    # 3) rpm -Va (rc != 0 is normal — it means files were modified)
-    #    --root tells rpm where to verify files; --dbpath tells it where the
-    #    database lives.  Both are needed when the container's rpm binary uses
-    #    a different default dbpath than the host (Fedora uses
-    #    /usr/lib/sysimage/rpm, RHEL 9 uses /var/lib/rpm).
-    if executor is not None:
-        if str(host_root) == "/":
-            cmd_va = ["rpm", "-Va", "--nodeps", "--noscripts"]
+    def _classify() -> RpmSection:
+        if installed:
+            installed_names = {p.name for p in installed}
+            _debug(f"installed package count: {len(installed_names)}")
+            # Exclude tool prerequisites installed by run-yoinkc.sh so they don't
+            # appear in the migration output or the generated Containerfile.
+            _prereq_exclude: Set[str] = set()
+            _prereq_raw = os.environ.get("YOINKC_EXCLUDE_PREREQS", "").split()
+            if _prereq_raw:
+                _prereq_exclude = set(_prereq_raw)
+                _debug(f"YOINKC_EXCLUDE_PREREQS: will exclude tool prerequisites: {sorted(_prereq_exclude)}")
+            if baseline_names is not None and not section.no_baseline:
+                added_names = installed_names - baseline_names
+                if _prereq_exclude:
+                    _excluded = added_names & _prereq_exclude
+                    if _excluded:
+                        _debug(f"excluded tool prerequisites from added set: {sorted(_excluded)}")
+                        added_names -= _excluded
+                base_only_names = baseline_names - installed_names
+                matched_names = installed_names & baseline_names
+                _debug(f"baseline has {len(baseline_names)} names, "
+                       f"installed has {len(installed_names)} names")
+                _debug(f"matched={len(matched_names)}, "
+                       f"added (installed-baseline, after prereq exclusion)={len(added_names)}, "
+                       f"base-image-only (baseline-installed)={len(base_only_names)}")
+                section.baseline_package_names = sorted(baseline_names)
+                for p in installed:
+                    if p.name in added_names:
+                        p.state = PackageState.ADDED
+                        section.packages_added.append(p)
+                for name in sorted(base_only_names):
+                    section.base_image_only.append(
+                        PackageEntry(name=name, epoch="0", version="", release="", arch="noarch", state=PackageState.BASE_IMAGE_ONLY)
+                    )
+            else:
+                section.baseline_package_names = None
+                for p in installed:
+                    if p.name not in _prereq_exclude:
+                        p.state = PackageState.ADDED
+                        section.packages_added.append(p)
+                if _prereq_exclude:
+                    _skipped = [p.name for p in installed if p.name in _prereq_exclude]
+                    if _skipped:
+                        _debug(f"(no-baseline) excluded tool prerequisites: {sorted(_skipped)}")
+
+        # 3b) Source repo per added package
+        if executor is not None and section.packages_added:
+            _populate_source_repos(executor, host_root, section.packages_added, history=history)
+
+        # 4) Leaf/auto package classification
+        if executor is not None and section.packages_added and not section.no_baseline:
+            leaf, auto, dep_tree = _classify_leaf_auto(executor, host_root, section.packages_added,
+                                                        rpmdb=rpmdb, history=history)
+            section.leaf_packages = leaf
+            section.auto_packages = auto
+            section.leaf_dep_tree = dep_tree
+            _debug(f"leaf/auto split: {len(leaf)} leaf, {len(auto)} auto")
+
+        # 5) Repo files
+        section.repo_files = _collect_repo_files(host_root)
+        section.gpg_keys = _collect_gpg_keys(host_root, section.repo_files)
+
+        # 6) dnf history removed
+        if executor is not None or history is not None:
+            section.dnf_history_removed = _dnf_history_removed(executor, host_root, warnings=warnings,
+                                                               history=history)
         else:
-            cmd_va = ["rpm", "--root", str(host_root), "--dbpath", "/var/lib/rpm"] + _RPM_LOCK_DEFINE + ["-Va", "--nodeps", "--noscripts"]
-        _debug(f"running: {' '.join(cmd_va)}")
-        result_va = executor(cmd_va)
-        if result_va.stderr and "cannot open Packages database" in result_va.stderr:
-            _debug("rpm -Va --dbpath failed, retrying with --root only")
-            cmd_va = ["rpm", "--root", str(host_root)] + _RPM_LOCK_DEFINE + ["-Va", "--nodeps", "--noscripts"]
-            result_va = executor(cmd_va)
-        _debug(f"rpm -Va: rc={result_va.returncode}, stdout={len(result_va.stdout)} bytes, stderr={result_va.stderr[:200] if result_va.stderr else ''}")
-        section.rpm_va = _parse_rpm_va(result_va.stdout)
+            section.dnf_history_removed = []
+        return section
+
+    if section_cache is not None:
+        # Keyed after the join so the baseline is part of the key without
+        # making the inspector wait for it any earlier.
+        extra = {
+            "image": section.base_image,
+            "no_baseline": section.no_baseline,
+            "baseline": hashlib.sha256(
+                "\n".join(sorted(baseline_names or ())).encode()).hexdigest(),
+            "exclude_prereqs": sorted(os.environ.get("YOINKC_EXCLUDE_PREREQS", "").split()),
+        }
+        section = section_cache.lookup("rpm", CACHE_INPUTS, extra, _classify,
+                                       warnings if warnings is not None else [],
+                                       *model_section(RpmSection))
     else:
-        section.rpm_va = []
-
-    # 4) Leaf/auto package classification
-    if executor is not None and section.packages_added and not section.no_baseline:
-        leaf, auto, dep_tree = _classify_leaf_auto(executor, host_root, section.packages_added)
-        section.leaf_packages = leaf
-        section.auto_packages = auto
-        section.leaf_dep_tree = dep_tree
-        _debug(f"leaf/auto split: {len(leaf)} leaf, {len(auto)} auto")
-
-    # 5) Repo files
-    section.repo_files = _collect_repo_files(host_root)
-    section.gpg_keys = _collect_gpg_keys(host_root, section.repo_files)
-
-    # 6) dnf history removed
-    if executor is not None:
-        section.dnf_history_removed = _dnf_history_removed(executor, host_root, warnings=warnings)
-    else:
-        section.dnf_history_removed = []
-
+        _classify()
+    section.rpm_va = rpm_va
     return section
@@ -4,6 +4,7 @@ import re
 from pathlib import Path
 from typing import List, Optional, Set
 
+from ..cache import RPMDB
 from ..executor import Executor
 from ..schema import SelinuxSection, SelinuxPortLabel
 from .._util import debug as _debug_fn, safe_iterdir as _safe_iterdir, make_warning
@@ -14,6 +15,11 @@ def _debug(msg: str) -> None:
     _debug_fn("selinux", msg)
 
 
+# Inputs fingerprinted for the result cache (see yoinkc.cache).  Runtime-only
+# boolean changes (setsebool without -P) are not captured.
+CACHE_INPUTS = (RPMDB, "etc/selinux", "var/lib/selinux", "etc/audit", "etc/pam.d")
+
+
 def _policy_type(host_root: Path) -> str:
     """Read SELINUXTYPE from /etc/selinux/config, default to 'targeted'."""
     cfg = host_root / "etc/selinux/config"
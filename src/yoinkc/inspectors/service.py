@@ -8,7 +8,9 @@ import os
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 
+from ..cache import RPMDB
 from ..executor import Executor
+from ..rpmdb import RpmDatabase
 from ..schema import ServiceSection, ServiceStateChange, SystemdDropIn
 from .._util import debug as _debug_fn, is_debug as _DEBUG_check, make_warning, run_rpm_query as _run_rpm_query
 
@@ -17,6 +19,10 @@ def _debug(msg: str) -> None:
     _debug_fn("service", msg)
 
 
+# Inputs fingerprinted for the result cache (see yoinkc.cache).
+CACHE_INPUTS = (RPMDB, "etc/systemd", "usr/lib/systemd")
+
+
 def _parse_preset_lines(
     lines: List[str],
 ) -> Tuple[Set[str], Set[str], bool, List[Tuple[str, str]]]:
@@ -196,16 +202,26 @@ def _resolve_owning_packages(
     executor: Executor,
     host_root: Path,
     section: ServiceSection,
+    rpmdb: Optional[RpmDatabase] = None,
 ) -> None:
     """Populate ``owning_package`` for non-unchanged state changes via ``rpm -qf``.
 
     Batches all vendor paths into a single rpm call to minimize subprocess
     overhead, then falls back to /etc/systemd/system/ for any that failed.
+    With *rpmdb* the owners are looked up in the shared index instead.
     """
     changed = [sc for sc in section.state_changes if sc.action != "unchanged"]
     if not changed:
         return
 
+    if rpmdb is not None:
+        for sc in changed:
+            sc.owning_package = (rpmdb.owner(f"/usr/lib/systemd/system/{sc.unit}")
+                                 or rpmdb.owner(f"/etc/systemd/system/{sc.unit}"))
+        resolved = sum(1 for sc in changed if sc.owning_package)
+        _debug(f"owning packages: resolved {resolved}/{len(changed)} changed units from rpmdb")
+        return
+
     def _batch_query(prefix: str, units: List['ServiceStateChange']) -> List['ServiceStateChange']:
         """Query rpm -qf for all units under prefix. Returns units that failed."""
         paths = [f"/{prefix}/{sc.unit}" for sc in units]
@@ -241,6 +257,7 @@ def run(
     executor: Optional[Executor],
     base_image_preset_text: Optional[str] = None,
     warnings: Optional[list] = None,
+    rpmdb: Optional[RpmDatabase] = None,
 ) -> ServiceSection:
     host_root = Path(host_root)
     section = ServiceSection()
@@ -320,8 +337,8 @@ def run(
     # Look up the owning RPM package for units that changed state.
     # This allows the Containerfile renderer to skip enable/disable for units
     # whose package won't be installed in the image.
-    if executor is not None:
-        _resolve_owning_packages(executor, host_root, section)
+    if rpmdb is not None or executor is not None:
+        _resolve_owning_packages(executor, host_root, section, rpmdb=rpmdb)
 
     # Scan for systemd drop-in override directories under /etc/systemd/system/.
     # Only admin overrides — vendor drop-ins under /usr/lib/ ship with the base image.
@@ -0,0 +1,167 @@
+"""
+Lightweight performance telemetry for inspectors and renderers.
+
+A ``PerfRecorder`` collects, per named unit of work (an inspector or a
+renderer): wall time, CPU time of the thread doing the work, growth of the
+process peak RSS, the number of subprocesses spawned and the bytes of stdout
+captured from them.  Peak RSS is process-wide, so its growth is only
+attributable to one unit when units run one at a time; recorders created
+with ``track_rss=False`` (inspection with ``jobs > 1``) leave it out.  Subprocess statistics are also aggregated per command so
+field reports point at the slow tool, not just the slow inspector.
+
+The recorder is activated for the duration of a run in a context variable,
+so threads that copy the caller's context (the inspector scheduler, the
+background baseline query) record into it; ``measure()`` is a cheap no-op
+when none is active.  Results are stored
+under ``snapshot.meta["perf"]``.
+"""
+
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, List, Optional
+
+from .executor import Executor, RunResult, strip_wrappers
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-Unix
+    resource = None  # type: ignore[assignment]
+
+
+_SUBCOMMAND_RE = re.compile(r"^[a-z][a-z-]*$")
+
+_active: ContextVar[Optional["PerfRecorder"]] = ContextVar("yoinkc_perf_recorder", default=None)
+_current: ContextVar[Optional["_Scope"]] = ContextVar("yoinkc_perf_scope", default=None)
+
+
+def _peak_rss_kb() -> int:
+    if resource is None:
+        return 0
+    return int(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+
+def command_label(cmd: List[str]) -> str:
+    """Return a short label for *cmd*, e.g. ``rpm -Va`` or ``podman run``.
+
+    Wrapper programs (nsenter, chroot) and their options are skipped so the
+    label names the tool that actually did the work.
+    """
+    args = strip_wrappers(cmd)
+    if not args:
+        return "?"
+    prog = os.path.basename(args[0])
+    for arg in args[1:]:
+        if arg.startswith("--"):
+            continue
+        if arg.startswith("-") or _SUBCOMMAND_RE.match(arg):
+            return f"{prog} {arg}"
+    return prog
+
+
+class _Scope:
+    """Mutable counters for one measured unit of work."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.lock = threading.Lock()
+        self.subprocesses = 0
+        self.stdout_bytes = 0
+
+
+class PerfRecorder:
+    """Collects timings for inspectors, renderers and subprocess calls."""
+
+    def __init__(self, track_rss: bool = True) -> None:
+        self.track_rss = track_rss
+        self._lock = threading.Lock()
+        self._groups: Dict[str, Dict[str, dict]] = {}
+        self._commands: Dict[str, dict] = {}
+
+    @contextmanager
+    def activate(self) -> Iterator["PerfRecorder"]:
+        """Make this the recorder used by module-level ``measure()``."""
+        token = _active.set(self)
+        try:
+            yield self
+        finally:
+            _active.reset(token)
+
+    @contextmanager
+    def measure(self, group: str, name: str) -> Iterator[None]:
+        """Record the cost of the enclosed block as *name* within *group*."""
+        scope = _Scope(name)
+        token = _current.set(scope)
+        wall0 = time.perf_counter()
+        cpu0 = time.thread_time()
+        rss0 = _peak_rss_kb() if self.track_rss else 0
+        try:
+            yield
+        finally:
+            _current.reset(token)
+            entry = {
+                "wall_s": round(time.perf_counter() - wall0, 4),
+                "cpu_s": round(time.thread_time() - cpu0, 4),
+                "subprocesses": scope.subprocesses,
+                "stdout_bytes": scope.stdout_bytes,
+            }
+            if self.track_rss:
+                entry["rss_delta_kb"] = max(0, _peak_rss_kb() - rss0)
+            with self._lock:
+                self._groups.setdefault(group, {})[name] = entry
+
+    def record_command(self, cmd: List[str], elapsed: float, stdout_len: int) -> None:
+        scope = _current.get()
+        if scope is not None:
+            with scope.lock:
+                scope.subprocesses += 1
+                scope.stdout_bytes += stdout_len
+        label = command_label(cmd)
+        with self._lock:
+            agg = self._commands.setdefault(label, {"count": 0, "wall_s": 0.0, "stdout_bytes": 0})
+            agg["count"] += 1
+            agg["wall_s"] += elapsed
+            agg["stdout_bytes"] += stdout_len
+
+    def to_dict(self) -> dict:
+        """Return the collected data in the shape stored in ``meta["perf"]``."""
+        with self._lock:
+            out: dict = {g: dict(sorted(v.items())) for g, v in self._groups.items()}
+            if self._commands:
+                out["commands"] = {
+                    k: {**v, "wall_s": round(v["wall_s"], 4)}
+                    for k, v in sorted(self._commands.items(),
+                                       key=lambda kv: -kv[1]["wall_s"])
+                }
+        return out
+
+
+@contextmanager
+def measure(group: str, name: str) -> Iterator[None]:
+    """Measure the enclosed block with the active recorder, if any."""
+    recorder = _active.get()
+    if recorder is None:
+        yield
+        return
+    with recorder.measure(group, name):
+        yield
+
+
+def instrument(executor: Executor, recorder: PerfRecorder) -> Executor:
+    """Wrap *executor* so every call is counted by *recorder*."""
+    def run(cmd: List[str], *, cwd: Optional[str] = None) -> RunResult:
+        start = time.perf_counter()
+        result = executor(cmd, cwd=cwd) if cwd is not None else executor(cmd)
+        recorder.record_command(cmd, time.perf_counter() - start, len(result.stdout or ""))
+        return result
+    return run
+
+
+def merge_into(meta: dict, recorder: PerfRecorder) -> None:
+    """Merge *recorder*'s data into ``meta["perf"]``, replacing its groups."""
+    perf = dict(meta.get("perf") or {})
+    perf.update(recorder.to_dict())
+    meta["perf"] = perf
@@ -78,6 +78,8 @@ def run_pipeline(
     try:
         save_snapshot(snapshot, tmp_dir / "inspection-snapshot.json")
         run_renderers(snapshot, tmp_dir)
+        # Save again so meta.perf includes the renderer timings.
+        save_snapshot(snapshot, tmp_dir / "inspection-snapshot.json")
 
         # Bundle entitlement certs (skip in --from-snapshot mode where
         # host filesystem may not be mounted)
@@ -0,0 +1,171 @@
+"""
+Machine-readable progress events (``--progress-fd`` / ``--progress-file``).
+
+While a ``ProgressStream`` is active, inspection emits one JSON object per
+line: run start/finish, inspector start/finish, batch counters for long
+loops (``{"event": "batch", "label": "dnf repoquery", "done": 340,
+"total": 2100}``) and the duration of every executed command.  Every event
+carries ``ts`` (Unix time) and ``elapsed_s`` (seconds since the stream was
+opened).
+
+Events are handed to a writer thread through a bounded queue, so a slow or
+stalled reader never blocks inspection: when the queue is full events are
+dropped and the count is reported in the next ``dropped`` event.  All
+module-level helpers are cheap no-ops when no stream is active.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import IO, Iterator, List, Optional
+
+from .executor import Executor, RunResult
+from .perf import command_label
+
+
+# Events buffered for the writer thread before new ones are dropped.
+QUEUE_SIZE = 10000
+
+# Minimum seconds between two ``batch`` events for the same counter.
+BATCH_INTERVAL = 0.5
+
+_active: Optional["ProgressStream"] = None
+_task: ContextVar[Optional[str]] = ContextVar("yoinkc_progress_task", default=None)
+_STOP = object()
+
+
+class ProgressStream:
+    """Writes JSONL events to *fh* from a background thread."""
+
+    def __init__(self, fh: IO[str], queue_size: int = QUEUE_SIZE) -> None:
+        self._fh = fh
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self._dropped = 0
+        self._thread = threading.Thread(target=self._write_loop, name="yoinkc-progress",
+                                        daemon=True)
+        self._thread.start()
+
+    @classmethod
+    def open(cls, fd: Optional[int] = None, path: Optional[str] = None) -> "ProgressStream":
+        """Open a stream on file descriptor *fd* (left open on close) or *path*."""
+        if fd is not None:
+            return cls(os.fdopen(fd, "w", encoding="utf-8", closefd=False))
+        return cls(open(path, "w", encoding="utf-8"))
+
+    @contextmanager
+    def activate(self) -> Iterator["ProgressStream"]:
+        """Make this the stream used by the module-level helpers."""
+        global _active
+        previous = _active
+        _active = self
+        try:
+            yield self
+        finally:
+            _active = previous
+
+    def emit(self, event: str, **fields) -> None:
+        """Queue *event*; never blocks."""
+        record = {"event": event, "ts": round(time.time(), 3),
+                  "elapsed_s": round(time.monotonic() - self._started, 3), **fields}
+        with self._lock:
+            try:
+                if self._dropped:
+                    self._queue.put_nowait({"event": "dropped", "count": self._dropped,
+                                            "ts": record["ts"], "elapsed_s": record["elapsed_s"]})
+                    self._dropped = 0
+                self._queue.put_nowait(record)
+            except queue.Full:
+                self._dropped += 1
+
+    def close(self) -> None:
+        """Flush queued events and close the output."""
+        with self._lock:
+            if self._dropped:
+                self._queue.put({"event": "dropped", "count": self._dropped,
+                                 "ts": round(time.time(), 3),
+                                 "elapsed_s": round(time.monotonic() - self._started, 3)})
+                self._dropped = 0
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._fh.close()
+
+    def _write_loop(self) -> None:
+        while True:
+            record = self._queue.get()
+            if record is _STOP:
+                break
+            try:
+                self._fh.write(json.dumps(record, default=str) + "\n")
+                # Flush per event so readers see progress as it happens.
+                self._fh.flush()
+            except (OSError, ValueError):
+                # Reader went away; keep draining so producers stay unblocked.
+                continue
+
+
+def emit(event: str, **fields) -> None:
+    """Emit *event* on the active stream, if any."""
+    stream = _active
+    if stream is not None:
+        stream.emit(event, **fields)
+
+
+@contextmanager
+def task(name: str, **fields) -> Iterator[None]:
+    """Emit ``inspector_start``/``inspector_finish`` around the block.
+
+    Command and batch events inside the block are tagged with *name*.
+    """
+    token = _task.set(name)
+    emit("inspector_start", inspector=name, **fields)
+    start = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        _task.reset(token)
+        emit("inspector_finish", inspector=name, ok=ok,
+             wall_s=round(time.perf_counter() - start, 4))
+
+
+class Counter:
+    """Reports progress through *total* items as throttled ``batch`` events."""
+
+    def __init__(self, label: str, total: int) -> None:
+        self.label = label
+        self.total = total
+        self.done = 0
+        self._lock = threading.Lock()
+        self._last = 0.0
+
+    def advance(self, n: int = 1) -> None:
+        if _active is None:
+            return
+        now = time.monotonic()
+        with self._lock:
+            self.done += n
+            done = self.done
+            if done < self.total and now - self._last < BATCH_INTERVAL:
+                return
+            self._last = now
+        emit("batch", inspector=_task.get(), label=self.label, done=done, total=self.total)
+
+
+def instrument(executor: Executor) -> Executor:
+    """Wrap *executor* so each call emits a ``command`` event with its duration."""
+    def run(cmd: List[str], *, cwd: Optional[str] = None) -> RunResult:
+        if _active is None:
+            return executor(cmd, cwd=cwd) if cwd is not None else executor(cmd)
+        start = time.perf_counter()
+        result = executor(cmd, cwd=cwd) if cwd is not None else executor(cmd)
+        emit("command", inspector=_task.get(), command=command_label(cmd),
+             rc=result.returncode, wall_s=round(time.perf_counter() - start, 4))
+        return result
+    return run
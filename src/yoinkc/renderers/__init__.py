@@ -6,6 +6,7 @@ from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
 
+from ..perf import PerfRecorder, merge_into
 from ..schema import InspectionSnapshot
 from .._util import status as _status_fn
 
@@ -27,10 +28,22 @@ def run_all(snapshot: InspectionSnapshot, output_dir: Path) -> None:
         autoescape=True,
     )
     _status_fn("Rendering output…")
-    render_containerfile(snapshot, env, output_dir)
-    render_audit_report(snapshot, env, output_dir)
-    render_html_report(snapshot, env, output_dir)
-    render_readme(snapshot, env, output_dir)
-    render_kickstart(snapshot, env, output_dir)
-    render_secrets_review(snapshot, env, output_dir)
+    # Renderer timings are stored in meta["perf"] only after every renderer
+    # has run: reports must not embed wall-clock data that differs between
+    # a full run and a --from-snapshot re-render of the same snapshot.
+    perf = (snapshot.meta or {}).get("perf")
+    if perf:
+        perf.pop("renderers", None)
+    recorder = PerfRecorder()
+    for name, render in (
+        ("containerfile", render_containerfile),
+        ("audit_report", render_audit_report),
+        ("html_report", render_html_report),
+        ("readme", render_readme),
+        ("kickstart", render_kickstart),
+        ("secrets_review", render_secrets_review),
+    ):
+        with recorder.measure("renderers", name):
+            render(snapshot, env, output_dir)
+    merge_into(snapshot.meta, recorder)
     _status_fn("Done.")
@@ -4,6 +4,7 @@ from pathlib import Path
 
 from jinja2 import Environment
 
+from ..depgraph import reverse_tree
 from ..schema import ConfigFileKind, InspectionSnapshot
 from ._triage import compute_triage, _config_file_count, _QUADLET_PREFIX
 
@@ -77,6 +78,18 @@ def render(
     lines.append(f"- Containers/quadlet found: {n_containers}")
     lines.append(f"- Secrets redacted: {n_redactions}")
     lines.append("")
+    skipped = (snapshot.meta or {}).get("skipped_sections") or []
+    if skipped:
+        lines.append("> **Partial inspection:** these sections were not inspected "
+                     "(`--only` / `--skip`) and are absent from every output: "
+                     + ", ".join(f"`{s}`" for s in skipped))
+        lines.append("")
+    incomplete = (snapshot.meta or {}).get("incomplete_sections") or []
+    if incomplete:
+        lines.append("> **Incomplete inspection:** `--time-budget` ran out before these "
+                     "sections finished; their results are partial: "
+                     + ", ".join(f"`{s}`" for s in incomplete))
+        lines.append("")
 
     if snapshot.rpm:
         lines.append("## RPM / Packages")
@@ -127,8 +140,15 @@ def render(
             lines.append("")
         if snapshot.rpm.rpm_va:
             lines.append("### Modified file details (rpm -Va)")
+            scope = snapshot.meta.get("verify_scope")
+            if scope:
+                lines.append("")
+                lines.append(f"Verification was limited to `--verify-scope {scope}`; "
+                             "modified files outside that scope are not listed.")
+                lines.append("")
             for e in snapshot.rpm.rpm_va:
-                lines.append(f"- `{e.path}` ({e.flags})")
+                owner = f" — {e.package}" if e.package else ""
+                lines.append(f"- `{e.path}` ({e.flags}){owner}")
             lines.append("")
         if snapshot.rpm.dnf_history_removed:
             lines.append("### Previously installed then removed (dnf history)")
@@ -816,9 +836,12 @@ def render(
                              "produces a different dependency set, promote packages from this list to "
                              "the `dnf install` line.")
                 lines.append("")
+                pulled_in_by = reverse_tree(dep_tree)
                 for p in auto_pkgs:
                     prefix = "[EXCLUDED] " if not p.include else ""
-                    lines.append(f"- {prefix}{p.name} {p.version}-{p.release}.{p.arch}")
+                    by = pulled_in_by.get(p.name)
+                    via = f" — pulled in by {', '.join(by)}" if by else ""
+                    lines.append(f"- {prefix}{p.name} {p.version}-{p.release}.{p.arch}{via}")
                 lines.append("")
 
             # Dependency tree view
@@ -852,4 +875,35 @@ def render(
             lines.append(f"- **{r.get('path') or ''}**: {r.get('pattern') or ''} — {r.get('remediation') or ''}")
         lines.append("")
 
+    perf = (snapshot.meta or {}).get("perf") or {}
+    if perf.get("inspectors"):
+        lines.append("## Performance")
+        lines.append("")
+        if perf.get("total_wall_s") is not None:
+            lines.append(f"Inspection wall time: {perf['total_wall_s']:.2f}s")
+            lines.append("")
+        lines.append("| Inspector | Wall (s) | CPU (s) | Peak RSS Δ (KiB) | Subprocesses | Stdout (bytes) |")
+        lines.append("|-----------|----------|---------|------------------|--------------|----------------|")
+        for name, e in perf["inspectors"].items():
+            lines.append(
+                f"| {name} | {e.get('wall_s', 0):.2f} | {e.get('cpu_s', 0):.2f} "
+                f"| {e.get('rss_delta_kb', 'n/a')} | {e.get('subprocesses', 0)} | {e.get('stdout_bytes', 0)} |"
+            )
+        lines.append("")
+        if any("rss_delta_kb" not in e for e in perf["inspectors"].values()):
+            lines.append("Peak RSS Δ is only measured when inspectors run one at a time (`--jobs 1`); "
+                         "with parallel inspectors the process-wide peak cannot be attributed to one of them.")
+            lines.append("")
+        lines.append("Renderer timings are recorded in `inspection-snapshot.json` under `meta.perf.renderers`.")
+        lines.append("")
+        commands = perf.get("commands") or {}
+        if commands:
+            lines.append("### Slowest commands")
+            lines.append("")
+            lines.append("| Command | Calls | Wall (s) | Stdout (bytes) |")
+            lines.append("|---------|-------|----------|----------------|")
+            for label, c in list(commands.items())[:10]:
+                lines.append(f"| `{label}` | {c.get('count', 0)} | {c.get('wall_s', 0):.2f} | {c.get('stdout_bytes', 0)} |")
+            lines.append("")
+
     (output_dir / "audit-report.md").write_text("\n".join(lines))
@@ -592,6 +592,20 @@ def _render_containerfile_content(snapshot: InspectionSnapshot, output_dir: Path
     lines.append(f"# Detected: {os_desc}")
     lines.append(f"FROM {base}")
 
+    skipped = (snapshot.meta or {}).get("skipped_sections") or []
+    if skipped:
+        lines.append("")
+        lines.append("# !! PARTIAL INSPECTION !!")
+        lines.append(f"# Not inspected (--only/--skip): {', '.join(skipped)}")
+        lines.append("# Their content is missing from this Containerfile.")
+
+    incomplete = (snapshot.meta or {}).get("incomplete_sections") or []
+    if incomplete:
+        lines.append("")
+        for name in incomplete:
+            lines.append(f"# FIXME: {name} inspection hit --time-budget; its results below are "
+                         "partial — re-run with a larger budget or review the host manually")
+
     # Cross-major-version migration warning
     if snapshot.os_release and snapshot.os_release.version_id and snapshot.rpm and snapshot.rpm.base_image:
         source_major = snapshot.os_release.version_id.split(".")[0]
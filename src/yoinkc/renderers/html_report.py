@@ -425,6 +425,12 @@ def _prepare_non_rpm(snapshot: InspectionSnapshot) -> dict:
 # Context builder
 # ---------------------------------------------------------------------------
 
+def _prepare_perf(snapshot: InspectionSnapshot) -> List[dict]:
+    """Flatten meta.perf inspector timings into table rows."""
+    perf = (snapshot.meta or {}).get("perf") or {}
+    return [{"name": name, **entry} for name, entry in (perf.get("inspectors") or {}).items()]
+
+
 def _build_context(
     snapshot: InspectionSnapshot,
     output_dir: Path,
@@ -581,6 +587,8 @@ def _build_context(
         "repo_display": repo_display,
         "secrets_data": redactions,
         "secrets_file_count": secrets_files,
+        "perf_rows": _prepare_perf(snapshot),
+        "perf_commands": list(((snapshot.meta or {}).get("perf") or {}).get("commands", {}).items())[:10],
     }
 
 
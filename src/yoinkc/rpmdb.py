@@ -0,0 +1,407 @@
+"""
+In-memory index of the host RPM database, built from one bulk rpm query.
+
+A single ``rpm -qa`` pass with a multi-tag query format returns every
+package's NEVRA, requires, recommends and provides, and per-file name,
+flags, verify flags, state, size, mode, mtime, digest, owner and link target.  ``RpmDatabase``
+indexes that output so the questions inspectors used to answer with one
+rpm process each — who owns this path, which files does this package
+ship, is this a %config file, what provides this capability — become
+dict lookups.
+
+One ``SharedRpmDatabase`` is created per run and handed to every inspector
+that needs RPM data; the query runs the first time one of them asks, so
+runs where those sections are skipped or cached never pay for it.
+"""
+
+import bisect
+import re
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from . import perf as _perf
+from ._util import debug as _debug_fn, run_rpm_query
+
+
+def _debug(msg: str) -> None:
+    _debug_fn("rpmdb", msg)
+
+
+# File flag bits from rpm's rpmfileAttrs (lib/rpmfiles.h).
+RPMFILE_CONFIG = 1 << 0
+RPMFILE_DOC = 1 << 1
+RPMFILE_MISSINGOK = 1 << 3
+RPMFILE_NOREPLACE = 1 << 4
+RPMFILE_GHOST = 1 << 6
+RPMFILE_LICENSE = 1 << 7
+
+# Verify attribute bits from rpm's rpmVerifyAttrs (lib/rpmvf.h); a file
+# packaged with %verify(not ...) has the named bits cleared in
+# FILEVERIFYFLAGS, and rpm -V skips those checks.
+RPMVERIFY_FILEDIGEST = 1 << 0
+RPMVERIFY_FILESIZE = 1 << 1
+RPMVERIFY_LINKTO = 1 << 2
+RPMVERIFY_USER = 1 << 3
+RPMVERIFY_GROUP = 1 << 4
+RPMVERIFY_MTIME = 1 << 5
+RPMVERIFY_MODE = 1 << 6
+RPMVERIFY_ALL = 0xFFFFFFFF
+
+# File states (rpmfileState); only files in the normal state are on disk as
+# packaged — the others were replaced, skipped (nodocs, %lang) or shared.
+RPMFILE_STATE_NORMAL = 0
+
+# One record per line, tab-separated, tagged by its first field.  File names
+# come last so a tab inside a path survives the split.
+QUERYFORMAT = (
+    r"P\t%{EPOCH}\t%{NAME}\t%{VERSION}\t%{RELEASE}\t%{ARCH}\t%{FILEDIGESTALGO}\n"
+    r"[F\t%{FILEFLAGS}\t%{FILEVERIFYFLAGS}\t%{FILESTATES}\t%{FILESIZES}\t%{FILEMODES}\t%{FILEMTIMES}\t%{FILEDIGESTS}"
+    r"\t%{FILEUSERNAME}\t%{FILEGROUPNAME}\t%{FILELINKTOS}\t%{FILENAMES}\n]"
+    r"[R\t%{REQUIRENAME}\n]"
+    r"[W\t%{RECOMMENDNAME}\n]"
+    r"[V\t%{PROVIDENAME}\n]"
+)
+
+# The same records without files or weak deps: just enough to resolve
+# requires against provides when the full index is not available.
+DEPS_QUERYFORMAT = (
+    r"P\t%{EPOCH}\t%{NAME}\t%{VERSION}\t%{RELEASE}\t%{ARCH}\t%{FILEDIGESTALGO}\n"
+    r"[R\t%{REQUIRENAME}\n]"
+    r"[V\t%{PROVIDENAME}\n]"
+)
+
+
+@dataclass
+class RpmPackage:
+    """One installed package and the capabilities it requires and provides.
+
+    *recommends* holds its weak dependencies, which dnf installs by default.
+    """
+    name: str
+    epoch: str
+    version: str
+    release: str
+    arch: str
+    digest_algo: int = 0
+    files: List[str] = field(default_factory=list)
+    requires: List[str] = field(default_factory=list)
+    recommends: List[str] = field(default_factory=list)
+    provides: List[str] = field(default_factory=list)
+
+    @property
+    def nevra(self) -> str:
+        return f"{self.epoch}:{self.name}-{self.version}-{self.release}.{self.arch}"
+
+
+class RpmFile(NamedTuple):
+    """Metadata rpm recorded for one packaged file."""
+    package: RpmPackage
+    flags: int
+    verify_flags: int
+    state: int
+    size: int
+    mode: int
+    mtime: int
+    digest: str
+    user: str
+    group: str
+    linkto: str
+
+    @property
+    def is_config(self) -> bool:
+        return bool(self.flags & RPMFILE_CONFIG)
+
+    @property
+    def is_ghost(self) -> bool:
+        return bool(self.flags & RPMFILE_GHOST)
+
+    @property
+    def is_installed(self) -> bool:
+        return self.state == RPMFILE_STATE_NORMAL
+
+
+_RICH_TOKEN = re.compile(r"[()]|[^\s()]+")
+_RICH_OPS = {"and", "or", "if", "else", "unless", "with", "without"}
+
+
+def parse_rich(expr: str):
+    """Parse an rpm boolean ("rich") dependency such as ``(a or (b and c))``.
+
+    Returns a nested tuple: ``("cap", name)`` for a plain capability
+    (version constraints dropped) or ``(op, [terms])`` for an operator
+    chain.  ``if``/``unless`` become ``(op, [then, cond, else?])``.
+    Raises ValueError on malformed input.
+    """
+    tokens = _RICH_TOKEN.findall(expr)
+    node, pos = _parse_rich_term(tokens, 0)
+    if pos != len(tokens):
+        raise ValueError(f"trailing tokens in rich dependency: {expr!r}")
+    return node
+
+
+def _parse_rich_term(tokens: List[str], pos: int):
+    if pos >= len(tokens):
+        raise ValueError("unexpected end of rich dependency")
+    if tokens[pos] != "(":
+        # name [op version]
+        name = tokens[pos]
+        pos += 1
+        while pos < len(tokens) and tokens[pos] not in _RICH_OPS and tokens[pos] not in "()":
+            pos += 1
+        return ("cap", name), pos
+    terms = []
+    ops = []
+    term, pos = _parse_rich_term(tokens, pos + 1)
+    terms.append(term)
+    while pos < len(tokens) and tokens[pos] != ")":
+        op = tokens[pos]
+        if op not in _RICH_OPS:
+            raise ValueError(f"unknown rich dependency operator {op!r}")
+        ops.append(op)
+        term, pos = _parse_rich_term(tokens, pos + 1)
+        terms.append(term)
+    if pos >= len(tokens):
+        raise ValueError("unbalanced '(' in rich dependency")
+    if not ops:
+        return terms[0], pos + 1
+    if ops[0] in ("if", "unless"):
+        if ops[1:] not in ([], ["else"]):
+            raise ValueError(f"malformed {ops[0]} clause")
+        return (ops[0], terms), pos + 1
+    if any(op != ops[0] for op in ops) or ops[0] == "else":
+        raise ValueError(f"mixed operators in rich dependency: {ops}")
+    return (ops[0], terms), pos + 1
+
+
+def _int(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+def _verify_flags(value: str) -> int:
+    """FILEVERIFYFLAGS as an unsigned mask; everything is checked when it is absent."""
+    try:
+        return int(value) & RPMVERIFY_ALL
+    except ValueError:
+        return RPMVERIFY_ALL
+
+
+class RpmDatabase:
+    """Lookup tables over every installed package and packaged file."""
+
+    def __init__(self, packages: Iterable[RpmPackage], files: Iterable[Tuple[str, RpmFile]]) -> None:
+        self.packages: List[RpmPackage] = list(packages)
+        self._by_name: Dict[str, List[RpmPackage]] = {}
+        for pkg in self.packages:
+            self._by_name.setdefault(pkg.name, []).append(pkg)
+        # First owner of each path; paths shared by several packages
+        # (directories, multilib files) keep every owner in _shared.
+        self._files: Dict[str, RpmFile] = {}
+        self._shared: Dict[str, List[RpmFile]] = {}
+        for path, info in files:
+            first = self._files.get(path)
+            if first is None:
+                self._files[path] = info
+            elif first.package is not info.package:
+                self._shared.setdefault(path, [first]).append(info)
+        self._provides: Dict[str, List[RpmPackage]] = {}
+        for pkg in self.packages:
+            for cap in pkg.provides:
+                owners = self._provides.setdefault(cap, [])
+                if not owners or owners[-1] is not pkg:
+                    owners.append(pkg)
+        self._sorted_paths: Optional[List[str]] = None
+        # Requirement -> providers; shared capabilities such as
+        # libc.so.6()(64bit) are resolved once.
+        self._resolved: Dict[str, List[str]] = {}
+
+    @classmethod
+    def parse(cls, text: str) -> "RpmDatabase":
+        """Build the index from output of ``rpm -qa --queryformat QUERYFORMAT``."""
+        packages: List[RpmPackage] = []
+        files: List[Tuple[str, RpmFile]] = []
+        pkg: Optional[RpmPackage] = None
+        for line in text.splitlines():
+            tag, _, rest = line.partition("\t")
+            if tag == "F" and pkg is not None:
+                parts = rest.split("\t", 10)
+                if len(parts) != 11 or not parts[10]:
+                    continue
+                flags, vflags, state, size, mode, mtime, digest, user, group, linkto, path = parts
+                files.append((path, RpmFile(pkg, _int(flags), _verify_flags(vflags), _int(state), _int(size),
+                                            _int(mode) & 0xFFFF, _int(mtime), digest,
+                                            user, group, linkto)))
+                pkg.files.append(path)
+            elif tag == "R" and pkg is not None:
+                if rest:
+                    pkg.requires.append(rest)
+            elif tag == "W" and pkg is not None:
+                if rest:
+                    pkg.recommends.append(rest)
+            elif tag == "V" and pkg is not None:
+                if rest:
+                    pkg.provides.append(rest)
+            elif tag == "P":
+                parts = rest.split("\t")
+                if len(parts) != 6:
+                    _debug(f"skipping malformed package record: {line!r}")
+                    pkg = None
+                    continue
+                epoch, name, version, release, arch, algo = parts
+                pkg = RpmPackage(
+                    name=name,
+                    epoch=epoch if epoch.isdigit() else "0",
+                    version=version,
+                    release=release,
+                    arch=arch,
+                    digest_algo=_int(algo),
+                )
+                packages.append(pkg)
+        return cls(packages, files)
+
+    @classmethod
+    def query(cls, executor, host_root: Path, queryformat: str = QUERYFORMAT) -> Optional["RpmDatabase"]:
+        """Run the bulk query against *host_root*; None if rpm fails or says nothing.
+
+        *queryformat* may be ``DEPS_QUERYFORMAT`` for a capability-only index.
+        """
+        result = run_rpm_query(executor, Path(host_root), ["-qa", "--queryformat", queryformat])
+        if result.returncode != 0:
+            _debug(f"bulk rpm query failed (rc={result.returncode})")
+            return None
+        db = cls.parse(result.stdout)
+        if not db.packages:
+            _debug("bulk rpm query returned no package records")
+            return None
+        _debug(f"indexed {len(db.packages)} packages, {len(db._files)} files")
+        return db
+
+    def __len__(self) -> int:
+        return len(self.packages)
+
+    def package(self, name: str) -> Optional[RpmPackage]:
+        """Return the first installed package called *name*."""
+        pkgs = self._by_name.get(name)
+        return pkgs[0] if pkgs else None
+
+    def file(self, path: str) -> Optional[RpmFile]:
+        """Return rpm's record of *path* (from its first owner), or None if unowned."""
+        return self._files.get(path)
+
+    def owner(self, path: str) -> Optional[str]:
+        """Return the name of the package owning *path*, or None."""
+        info = self._files.get(path)
+        return info.package.name if info is not None else None
+
+    def owners(self, path: str) -> List[str]:
+        """Return the names of every package owning *path*."""
+        shared = self._shared.get(path)
+        if shared is not None:
+            return [info.package.name for info in shared]
+        info = self._files.get(path)
+        return [info.package.name] if info is not None else []
+
+    def files_of(self, name: str) -> List[str]:
+        """Return every path shipped by packages called *name*."""
+        pkgs = self._by_name.get(name, [])
+        if len(pkgs) == 1:
+            return list(pkgs[0].files)
+        return [p for pkg in pkgs for p in pkg.files]
+
+    def is_config(self, path: str) -> bool:
+        """Return True if any owner marks *path* as %config."""
+        shared = self._shared.get(path)
+        if shared is not None:
+            return any(info.is_config for info in shared)
+        info = self._files.get(path)
+        return info is not None and info.is_config
+
+    def who_provides(self, capability: str) -> List[str]:
+        """Return the names of packages providing *capability*.
+
+        Like ``rpm -q --whatprovides``, a path is also provided by the
+        package(s) owning it.
+        """
+        pkgs = self._provides.get(capability)
+        if pkgs:
+            return [pkg.name for pkg in pkgs]
+        if capability.startswith("/"):
+            return self.owners(capability)
+        return []
+
+    def resolve(self, requirement: str) -> List[str]:
+        """Return the installed packages that satisfy *requirement*.
+
+        Plain capabilities go through ``who_provides``.  Rich dependencies
+        are evaluated against what is installed: every satisfied
+        alternative of an ``or`` counts, both sides of ``and``/``with``,
+        the left side of ``without``, and ``if``/``unless`` pick their
+        branch by whether the condition is installed.  A malformed rich
+        dependency resolves to nothing.
+        """
+        cached = self._resolved.get(requirement)
+        if cached is not None:
+            return cached
+        if not requirement.startswith("("):
+            providers = self.who_provides(requirement.split()[0]) if requirement.strip() else []
+        else:
+            try:
+                providers = sorted(self._resolve_node(parse_rich(requirement)))
+            except ValueError as exc:
+                _debug(f"cannot parse rich dependency {requirement!r}: {exc}")
+                providers = []
+        self._resolved[requirement] = providers
+        return providers
+
+    def _resolve_node(self, node) -> set:
+        op, arg = node
+        if op == "cap":
+            return set(self.who_provides(arg))
+        if op in ("and", "with", "or"):
+            out: set = set()
+            for term in arg:
+                out |= self._resolve_node(term)
+            return out
+        if op == "without":
+            return self._resolve_node(arg[0])
+        # if / unless: (then, cond[, else])
+        satisfied = bool(self._resolve_node(arg[1]))
+        if satisfied == (op == "if"):
+            return self._resolve_node(arg[0])
+        return self._resolve_node(arg[2]) if len(arg) > 2 else set()
+
+    def owned_paths(self, prefix: str = "") -> List[str]:
+        """Return every packaged path starting with *prefix*, sorted."""
+        if self._sorted_paths is None:
+            self._sorted_paths = sorted(self._files)
+        paths = self._sorted_paths
+        if not prefix:
+            return list(paths)
+        start = bisect.bisect_left(paths, prefix)
+        end = bisect.bisect_left(paths, prefix + "\U0010ffff", start)
+        return paths[start:end]
+
+
+class SharedRpmDatabase:
+    """Loads the ``RpmDatabase`` for a host once, on first use, for every caller."""
+
+    def __init__(self, executor, host_root: Path) -> None:
+        self._executor = executor
+        self._host_root = Path(host_root)
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._db: Optional[RpmDatabase] = None
+
+    def get(self) -> Optional[RpmDatabase]:
+        """Return the index, or None when there is no executor or the query failed."""
+        with self._lock:
+            if not self._loaded:
+                self._loaded = True
+                if self._executor is not None:
+                    with _perf.measure("inspectors", "rpmdb"):
+                        self._db = RpmDatabase.query(self._executor, self._host_root)
+            return self._db
@@ -0,0 +1,341 @@
+"""
+In-process reader for the sqlite rpmdb (RHEL 9+, Fedora 33+).
+
+``run_rpm_query`` tries this before spawning rpm.  For ``rpm -qa`` queries
+it opens ``rpmdb.sqlite`` under the host root read-only, decodes the RPM
+header blob of every installed package and renders the query format
+itself, so the answer costs no process start and takes no rpm lock — and
+still works when the rpm binary in the container cannot read the host's
+database format.
+
+Only what yoinkc asks for is supported: ``-qa`` with an optional
+``--queryformat`` made of plain ``%{TAG}`` / ``%{=TAG}`` / ``%-20{TAG}``
+references to the tags in ``TAGS``, ``[...]`` array iteration and ``\\n``/
+``\\t`` escapes.  For anything else, or if the database is missing,
+locked or malformed, ``query`` returns None and the caller falls back to
+the rpm subprocess.  Set ``YOINKC_NATIVE_RPMDB=0`` to always use rpm.
+
+A cassette (``--record``/``--replay``) holds only what went through the
+executor, so in-process reads are suspended while one is in use
+(``suspend_native_reads``) and the queries run as commands instead.
+"""
+
+import os
+import re
+import sqlite3
+import struct
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from ._util import debug as _debug_fn
+
+
+def _debug(msg: str) -> None:
+    _debug_fn("rpmdb_sqlite", msg)
+
+
+ENABLED = os.environ.get("YOINKC_NATIVE_RPMDB", "1") != "0"
+
+_suspended = False
+
+
+@contextmanager
+def suspend_native_reads() -> Iterator[None]:
+    """Answer no query in-process while active; host databases go through the executor."""
+    global _suspended
+    previous = _suspended
+    _suspended = True
+    try:
+        yield
+    finally:
+        _suspended = previous
+
+
+def native_reads_suspended() -> bool:
+    return _suspended
+
+# Where rpm keeps rpmdb.sqlite, newest layout first.  /var/lib/rpm is a
+# symlink to the sysimage directory on current Fedora, so it is checked by
+# path rather than by resolving the link outside the host root.
+DB_LOCATIONS = ("usr/lib/sysimage/rpm/rpmdb.sqlite", "var/lib/rpm/rpmdb.sqlite")
+
+# Tag numbers from rpm's rpmtag.h for every tag the query format may use.
+TAGS: Dict[str, int] = {
+    "SHA1HEADER": 269,
+    "NAME": 1000,
+    "VERSION": 1001,
+    "RELEASE": 1002,
+    "EPOCH": 1003,
+    "SUMMARY": 1004,
+    "INSTALLTIME": 1008,
+    "VENDOR": 1011,
+    "LICENSE": 1014,
+    "ARCH": 1022,
+    "OLDFILENAMES": 1027,
+    "FILESIZES": 1028,
+    "FILESTATES": 1029,
+    "FILEMODES": 1030,
+    "FILEMTIMES": 1034,
+    "FILEDIGESTS": 1035,
+    "FILELINKTOS": 1036,
+    "FILEFLAGS": 1037,
+    "FILEUSERNAME": 1039,
+    "FILEGROUPNAME": 1040,
+    "SOURCERPM": 1044,
+    "FILEVERIFYFLAGS": 1045,
+    "PROVIDENAME": 1047,
+    "REQUIRENAME": 1049,
+    "DIRINDEXES": 1116,
+    "BASENAMES": 1117,
+    "DIRNAMES": 1118,
+    "LONGFILESIZES": 5008,
+    "FILEDIGESTALGO": 5011,
+    "RECOMMENDNAME": 5046,
+}
+TAGS["FILEMD5S"] = TAGS["FILEDIGESTS"]
+
+# Header data types (rpmTagType).
+_CHAR, _INT8, _INT16, _INT32, _INT64, _STRING, _BIN, _STRING_ARRAY, _I18NSTRING = range(1, 10)
+_INT_FORMATS = {_CHAR: "B", _INT8: "B", _INT16: "H", _INT32: "I", _INT64: "Q"}
+
+_DEFAULT_QUERYFORMAT = r"%{NAME}-%{VERSION}-%{RELEASE}.%{ARCH}\n"
+_TOKEN = re.compile(r"%(-?\d+)?\{(=?)([A-Za-z0-9_]+)\}|\[|\]|\\(.)|%%|[^%\[\]\\]+", re.S)
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "\\": "\\"}
+
+Value = Union[str, int]
+
+
+class UnsupportedQuery(Exception):
+    """The query needs something this reader does not implement."""
+
+
+class HeaderError(Exception):
+    """An rpmdb header blob is truncated or inconsistent."""
+
+
+class Header:
+    """One package header, decoded on demand from its rpmdb blob."""
+
+    def __init__(self, blob: bytes) -> None:
+        if len(blob) < 8:
+            raise HeaderError("header blob too short")
+        il, dl = struct.unpack_from(">II", blob, 0)
+        start = 8 + 16 * il
+        if start + dl > len(blob):
+            raise HeaderError(f"header claims {il} entries and {dl} data bytes, blob has {len(blob)}")
+        self._data = blob[start:start + dl]
+        self._index: Dict[int, Tuple[int, int, int]] = {}
+        for i in range(il):
+            tag, typ, offset, count = struct.unpack_from(">IIiI", blob, 8 + 16 * i)
+            self._index[tag] = (typ, offset, count)
+        self._cache: Dict[int, Optional[List[Value]]] = {}
+
+    def get(self, tag: int) -> Optional[List[Value]]:
+        """Return the values of *tag* as a list, or None if the header lacks it."""
+        if tag not in self._cache:
+            self._cache[tag] = self._decode(tag)
+        return self._cache[tag]
+
+    def _decode(self, tag: int) -> Optional[List[Value]]:
+        entry = self._index.get(tag)
+        if entry is None:
+            return None
+        typ, offset, count = entry
+        data = self._data
+        if offset < 0 or offset > len(data):
+            raise HeaderError(f"tag {tag}: offset {offset} outside data")
+        if typ in _INT_FORMATS:
+            fmt = f">{count}{_INT_FORMATS[typ]}"
+            if offset + struct.calcsize(fmt) > len(data):
+                raise HeaderError(f"tag {tag}: {count} values overrun data")
+            return list(struct.unpack_from(fmt, data, offset))
+        if typ == _BIN:
+            if offset + count > len(data):
+                raise HeaderError(f"tag {tag}: binary overruns data")
+            return [data[offset:offset + count].hex()]
+        if typ in (_STRING, _STRING_ARRAY, _I18NSTRING):
+            return self._strings(tag, offset, 1 if typ == _STRING else count)
+        raise HeaderError(f"tag {tag}: unknown type {typ}")
+
+    def _strings(self, tag: int, offset: int, count: int) -> List[str]:
+        data = self._data
+        out: List[str] = []
+        pos = offset
+        for _ in range(count):
+            end = data.find(b"\0", pos)
+            if end < 0:
+                raise HeaderError(f"tag {tag}: unterminated string")
+            out.append(data[pos:end].decode("utf-8", errors="replace"))
+            pos = end + 1
+        return out
+
+    def tag(self, name: str) -> Optional[List[Value]]:
+        """Return the values of tag *name*, including the FILENAMES extension."""
+        if name == "FILENAMES":
+            basenames = self.get(TAGS["BASENAMES"])
+            if basenames is None:
+                return self.get(TAGS["OLDFILENAMES"])
+            dirnames = self.get(TAGS["DIRNAMES"]) or []
+            dirindexes = self.get(TAGS["DIRINDEXES"]) or []
+            return [f"{dirnames[d]}{b}" for d, b in zip(dirindexes, basenames)]
+        values = self.get(TAGS[name])
+        if values is None and name == "FILESIZES":
+            values = self.get(TAGS["LONGFILESIZES"])
+        return values
+
+
+def _compile(queryformat: str) -> List[tuple]:
+    """Parse *queryformat* into literal, tag and array items.
+
+    Raises ``UnsupportedQuery`` for syntax or tags this reader cannot render.
+    """
+    items: List[tuple] = []
+    stack: List[List[tuple]] = [items]
+    pos = 0
+    for m in _TOKEN.finditer(queryformat):
+        if m.start() != pos:
+            raise UnsupportedQuery(f"cannot parse query format at {queryformat[pos:]!r}")
+        pos = m.end()
+        text = m.group(0)
+        if m.group(3) is not None:
+            name = m.group(3).upper()
+            if name not in TAGS and name != "FILENAMES":
+                raise UnsupportedQuery(f"tag {name} not supported natively")
+            width = int(m.group(1)) if m.group(1) else 0
+            stack[-1].append(("tag", name, width, bool(m.group(2))))
+        elif text == "[":
+            if len(stack) > 1:
+                raise UnsupportedQuery("nested array iteration")
+            block: List[tuple] = []
+            stack[-1].append(("array", block))
+            stack.append(block)
+        elif text == "]":
+            if len(stack) == 1:
+                raise UnsupportedQuery("unbalanced ']' in query format")
+            stack.pop()
+        elif m.group(4) is not None:
+            stack[-1].append(("text", _ESCAPES.get(m.group(4), m.group(4))))
+        elif text == "%%":
+            stack[-1].append(("text", "%"))
+        else:
+            stack[-1].append(("text", text))
+    if pos != len(queryformat) or len(stack) != 1:
+        raise UnsupportedQuery("cannot parse query format")
+    return items
+
+
+def _pad(value: str, width: int) -> str:
+    return value.rjust(width) if width > 0 else value.ljust(-width)
+
+
+def _render(header: Header, items: List[tuple], out: List[str]) -> None:
+    for item in items:
+        kind = item[0]
+        if kind == "text":
+            out.append(item[1])
+        elif kind == "tag":
+            _, name, width, _ = item
+            values = header.tag(name)
+            out.append(_pad("(none)" if not values else str(values[0]), width))
+        else:
+            block = item[1]
+            arrays = {t[1]: header.tag(t[1]) for t in block if t[0] == "tag" and not t[3]}
+            n = max((len(v) for v in arrays.values() if v), default=0)
+            for i in range(n):
+                for t in block:
+                    if t[0] == "text":
+                        out.append(t[1])
+                        continue
+                    _, name, width, fixed = t
+                    values = header.tag(name) if fixed else arrays[name]
+                    idx = 0 if fixed else i
+                    value = values[idx] if values and idx < len(values) else "(none)"
+                    out.append(_pad(str(value), width))
+
+
+def find_database(host_root: Path) -> Optional[Path]:
+    """Return the host's rpmdb.sqlite, or None when it uses another backend."""
+    for rel in DB_LOCATIONS:
+        path = Path(host_root) / rel
+        if path.is_file():
+            return path
+    return None
+
+
+def connect_readonly(path: Path, table: str = "Packages") -> sqlite3.Connection:
+    """Open the sqlite database at *path* read-only, probing *table*.
+
+    On a read-only host mount sqlite cannot create the WAL index, so plain
+    ``mode=ro`` fails; when there is no pending write-ahead log the file is
+    complete on its own and is opened as immutable instead.
+    """
+    uri = path.resolve().as_uri()
+    try:
+        conn = sqlite3.connect(f"{uri}?mode=ro", uri=True)
+        conn.execute(f"SELECT 1 FROM {table} LIMIT 1")
+        return conn
+    except sqlite3.OperationalError:
+        wal = path.with_name(path.name + "-wal")
+        if wal.exists() and wal.stat().st_size > 0:
+            raise
+        return sqlite3.connect(f"{uri}?mode=ro&immutable=1", uri=True)
+
+
+def read_headers(path: Path) -> Iterator[Header]:
+    """Yield every package header in the sqlite rpmdb at *path*, in rpm -qa order."""
+    conn = connect_readonly(path)
+    try:
+        for (blob,) in conn.execute("SELECT blob FROM Packages ORDER BY hnum"):
+            yield Header(bytes(blob))
+    finally:
+        conn.close()
+
+
+def _parse_args(args: List[str]) -> str:
+    """Return the query format for a supported ``-qa`` invocation."""
+    queryformat = _DEFAULT_QUERYFORMAT
+    rest = list(args)
+    if "--queryformat" in rest:
+        i = rest.index("--queryformat")
+        if i + 1 >= len(rest):
+            raise UnsupportedQuery("--queryformat without a value")
+        queryformat = rest[i + 1]
+        del rest[i:i + 2]
+    if rest != ["-qa"]:
+        raise UnsupportedQuery(f"only plain -qa is handled natively: {args}")
+    return queryformat
+
+
+def query(host_root: Path, args: List[str]):
+    """Answer ``rpm <args>`` from the host's sqlite rpmdb.
+
+    Returns a ``RunResult``, or None when the query or database is not
+    supported (the caller should then run rpm).
+    """
+    if not ENABLED or _suspended:
+        return None
+    try:
+        items = _compile(_parse_args(args))
+    except UnsupportedQuery as exc:
+        _debug(str(exc))
+        return None
+    path = find_database(host_root)
+    if path is None:
+        return None
+    from .executor import RunResult
+
+    start = time.perf_counter()
+    out: List[str] = []
+    count = 0
+    try:
+        for header in read_headers(path):
+            _render(header, items, out)
+            count += 1
+    except (sqlite3.Error, HeaderError, struct.error, IndexError, OSError) as exc:
+        _debug(f"cannot read {path}: {exc}; falling back to rpm")
+        return None
+    _debug(f"answered -qa natively from {path}: {count} headers "
+           f"in {time.perf_counter() - start:.3f}s")
+    return RunResult(stdout="".join(out), stderr="", returncode=0)
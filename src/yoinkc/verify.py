@@ -0,0 +1,309 @@
+"""
+Native package file verification — the in-process replacement for ``rpm -Va``.
+
+Every packaged file in scope is compared with what the rpmdb recorded for
+it (``RpmDatabase``): size, mode, digest, link target, owner, group and
+mtime, skipping whatever the package excluded with ``%verify(not ...)``.
+Results use ``rpm -Va``'s flag string (``S.5....T.``; ``missing``
+for absent files) so they are drop-in ``RpmVaEntry`` values, and unlike
+``rpm -Va`` they name the owning package.
+
+Two things make it much faster than rpm.  Files are checked on a thread
+pool (stat and hashing release the GIL).  And a file whose size and mtime
+both match the rpmdb is taken as unmodified without being read, so only
+files that look touched are hashed — a size change alone already proves
+the digest differs.
+
+With a ``VerifyCache`` (``--cache-dir``), the outcome of each digest
+comparison is kept between runs, keyed by the file's inode, size, mtime
+and ctime and by the owning package's NEVRA and recorded digest.  A file
+that is still in the state it was last hashed in is not read again, so a
+repeat run over an unchanged host is a stat sweep.
+
+The scope limits which files are checked at all:
+
+* ``etc`` — files under /etc, the only results the config inspector uses
+* ``config`` — files packaged as %config, wherever they live
+* ``all`` — every packaged file, like ``rpm -Va``
+"""
+
+import contextvars
+import hashlib
+import os
+import sqlite3
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from . import deadline as _deadline, progress as _progress
+from ._util import debug as _debug_fn
+from .rpmdb import (
+    RPMFILE_MISSINGOK, RPMVERIFY_FILEDIGEST, RPMVERIFY_FILESIZE, RPMVERIFY_GROUP, RPMVERIFY_LINKTO,
+    RPMVERIFY_MODE, RPMVERIFY_MTIME, RPMVERIFY_USER, RpmDatabase, RpmFile,
+)
+from .schema import RpmVaEntry
+
+
+def _debug(msg: str) -> None:
+    _debug_fn("verify", msg)
+
+
+SCOPES = ("etc", "config", "all")
+DEFAULT_SCOPE = "all"
+
+# Worker threads for stat/hash work.
+DEFAULT_JOBS = min(8, os.cpu_count() or 1)
+
+# Files handed to a worker at a time.
+CHUNK_SIZE = 256
+
+# PGPHASHALGO values rpm stores in FILEDIGESTALGO; packages without the tag
+# use MD5.
+_HASHES = {0: "md5", 1: "md5", 2: "sha1", 8: "sha256", 9: "sha384", 10: "sha512", 11: "sha224"}
+
+# Positions in rpm's verify flag string, SM5DLUGTP.
+_S, _M, _5, _D, _L, _U, _G, _T, _P = range(9)
+
+
+def _id_names(path: Path) -> Dict[int, str]:
+    """Map ids to names from the host's passwd or group file (0 is always root)."""
+    names: Dict[int, str] = {0: "root"}
+    try:
+        text = path.read_text(errors="replace")
+    except OSError:
+        return names
+    for line in text.splitlines():
+        parts = line.split(":")
+        if len(parts) >= 3 and parts[2].isdigit():
+            names.setdefault(int(parts[2]), parts[0])
+    return names
+
+
+def select_files(rpmdb: RpmDatabase, scope: str = DEFAULT_SCOPE) -> List[Tuple[str, RpmFile]]:
+    """Return the (path, record) pairs *scope* covers, sorted by path.
+
+    Ghost files and files rpm did not install (nodocs, other languages,
+    replaced or shared) are skipped, as ``rpm -Va`` does; so is /boot.
+    """
+    if scope not in SCOPES:
+        raise ValueError(f"unknown verify scope: {scope}")
+    out: List[Tuple[str, RpmFile]] = []
+    for path in rpmdb.owned_paths("/etc/" if scope == "etc" else ""):
+        if path.startswith("/boot/"):
+            continue
+        info = rpmdb.file(path)
+        if info is None or info.is_ghost or not info.is_installed:
+            continue
+        if scope == "config" and not rpmdb.is_config(path):
+            continue
+        out.append((path, info))
+    return out
+
+
+# (inode, size, mtime_ns, ctime_ns, package NEVRA, rpmdb digest)
+CacheKey = Tuple[int, int, int, int, str, str]
+
+
+class VerifyCache:
+    """Digest comparison results from earlier runs, stored in sqlite.
+
+    The whole table is read when the cache is opened and rewritten by
+    ``save`` with just the entries this run used, so files that left the
+    verify scope or the host drop out.  An unreadable database is treated
+    as empty.
+    """
+
+    FILENAME = "verify.sqlite"
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._old: Dict[str, Tuple[CacheKey, bool]] = {}
+        self._used: Dict[str, Tuple[CacheKey, bool]] = {}
+        self.hits = 0
+        self.misses = 0
+        try:
+            conn = sqlite3.connect(self.path)
+            try:
+                rows = conn.execute("SELECT path, ino, size, mtime_ns, ctime_ns, nevra, digest, matches "
+                                    "FROM digests").fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as exc:
+            _debug(f"starting with an empty verify cache ({exc})")
+            rows = []
+        for path, *key, matches in rows:
+            self._old[path] = (tuple(key), bool(matches))  # type: ignore[assignment]
+
+    def lookup(self, path: str, key: CacheKey) -> Optional[bool]:
+        """Return whether *path*'s digest matched when it was last in state *key*."""
+        entry = self._old.get(path)
+        with self._lock:
+            if entry is not None and entry[0] == key:
+                self.hits += 1
+                self._used[path] = entry
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def store(self, path: str, key: CacheKey, matches: bool) -> None:
+        with self._lock:
+            self._used[path] = (key, matches)
+
+    def save(self) -> None:
+        """Replace the stored entries with the ones used in this run."""
+        with self._lock:
+            rows = [(path, *key, int(matches)) for path, (key, matches) in self._used.items()]
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path)
+        except (OSError, sqlite3.Error) as exc:
+            _debug(f"cannot write verify cache {self.path}: {exc}")
+            return
+        try:
+            with conn:
+                conn.execute("DROP TABLE IF EXISTS digests")
+                conn.execute("CREATE TABLE digests (path TEXT PRIMARY KEY, ino INTEGER, size INTEGER, "
+                             "mtime_ns INTEGER, ctime_ns INTEGER, nevra TEXT, digest TEXT, matches INTEGER)")
+                conn.executemany("INSERT INTO digests VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        except sqlite3.DatabaseError as exc:
+            _debug(f"cannot write verify cache {self.path}: {exc}; discarding it")
+            conn.close()
+            self.path.unlink(missing_ok=True)
+            return
+        conn.close()
+
+    def to_dict(self) -> dict:
+        """Return hit/miss counts for ``meta["cache"]``."""
+        return {"path": str(self.path), "hits": self.hits, "misses": self.misses}
+
+
+def _digest(full: str, algo: int) -> Optional[str]:
+    name = _HASHES.get(algo)
+    if name is None:
+        return None
+    h = hashlib.new(name)
+    with open(full, "rb") as f:
+        while True:
+            block = f.read(1 << 20)
+            if not block:
+                break
+            h.update(block)
+    return h.hexdigest()
+
+
+class _Verifier:
+    def __init__(self, host_root: Path, cache: Optional[VerifyCache] = None) -> None:
+        self._root = str(host_root)
+        self._cache = cache
+        self._users = _id_names(Path(host_root) / "etc" / "passwd")
+        self._groups = _id_names(Path(host_root) / "etc" / "group")
+
+    def check(self, path: str, info: RpmFile) -> Optional[str]:
+        """Return the verify flags for *path*, or None when it matches the rpmdb."""
+        full = os.path.join(self._root, path.lstrip("/"))
+        try:
+            st = os.lstat(full)
+        except OSError:
+            return None if info.flags & RPMFILE_MISSINGOK else "missing"
+
+        flags = ["."] * 9
+        # Checks the package turned off with %verify(not ...) are skipped,
+        # as rpm -V does.
+        vflags = info.verify_flags
+        want_type = stat.S_IFMT(info.mode)
+        have_type = stat.S_IFMT(st.st_mode)
+        if want_type == stat.S_IFLNK:
+            if vflags & RPMVERIFY_LINKTO:
+                try:
+                    target = os.readlink(full) if have_type == stat.S_IFLNK else None
+                except OSError:
+                    target = None
+                if target != info.linkto:
+                    flags[_L] = "L"
+        elif vflags & RPMVERIFY_MODE and (st.st_mode & 0xFFFF) != info.mode:
+            flags[_M] = "M"
+        if want_type == stat.S_IFREG and have_type == stat.S_IFREG:
+            size_differs = st.st_size != info.size
+            mtime_differs = int(st.st_mtime) != info.mtime
+            if size_differs and vflags & RPMVERIFY_FILESIZE:
+                flags[_S] = "S"
+            if vflags & RPMVERIFY_FILEDIGEST:
+                if size_differs:
+                    flags[_5] = "5"
+                elif mtime_differs and info.digest:
+                    # Same size but touched: only now is reading the file worth it.
+                    flags[_5] = self._compare_digest(path, full, st, info)
+            if mtime_differs and vflags & RPMVERIFY_MTIME:
+                flags[_T] = "T"
+        if vflags & RPMVERIFY_USER and self._users.get(st.st_uid) != info.user:
+            flags[_U] = "U"
+        if vflags & RPMVERIFY_GROUP and self._groups.get(st.st_gid) != info.group:
+            flags[_G] = "G"
+        result = "".join(flags)
+        return None if result == "........." else result
+
+    def _compare_digest(self, path: str, full: str, st: os.stat_result, info: RpmFile) -> str:
+        """Return the digest flag for *path*: ".", "5", or "?" if it cannot be read."""
+        key: CacheKey = (st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns,
+                         info.package.nevra, info.digest)
+        if self._cache is not None:
+            matches = self._cache.lookup(path, key)
+            if matches is not None:
+                return "." if matches else "5"
+        try:
+            actual = _digest(full, info.package.digest_algo)
+        except OSError:
+            return "?"
+        if actual is None:
+            return "."
+        if self._cache is not None:
+            self._cache.store(path, key, actual == info.digest)
+        return "." if actual == info.digest else "5"
+
+
+def verify_files(
+    rpmdb: RpmDatabase,
+    host_root: Path,
+    scope: str = DEFAULT_SCOPE,
+    jobs: int = DEFAULT_JOBS,
+    cache: Optional[VerifyCache] = None,
+) -> List[RpmVaEntry]:
+    """Verify the packaged files in *scope* against *rpmdb*; return the mismatches.
+
+    With *cache*, digest comparisons from earlier runs are reused and the
+    cache is saved afterwards.
+    """
+    files = select_files(rpmdb, scope)
+    verifier = _Verifier(host_root, cache)
+    counter = _progress.Counter("verify", len(files))
+
+    def _chunk(items: List[Tuple[str, RpmFile]]) -> List[RpmVaEntry]:
+        out: List[RpmVaEntry] = []
+        # Past the time budget the remaining files are left unverified.
+        if _deadline.expired("file verification"):
+            return out
+        for path, info in items:
+            flags = verifier.check(path, info)
+            if flags is not None:
+                out.append(RpmVaEntry(path=path, flags=flags, package=info.package.name))
+        counter.advance(len(items))
+        return out
+
+    chunks = [files[i:i + CHUNK_SIZE] for i in range(0, len(files), CHUNK_SIZE)]
+    if jobs <= 1 or len(chunks) <= 1:
+        results = [_chunk(c) for c in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="yoinkc-verify") as pool:
+            # Each chunk runs in a copy of this context so deadline hits and
+            # progress events are attributed to the calling inspector.
+            futures = [pool.submit(contextvars.copy_context().run, _chunk, c) for c in chunks]
+            results = [f.result() for f in futures]
+    entries = [e for chunk in results for e in chunk]
+    if cache is not None:
+        cache.save()
+        _debug(f"verify cache: {cache.hits} hits, {cache.misses} misses")
+    _debug(f"verified {len(files)} files (scope={scope}, jobs={jobs}): {len(entries)} modified")
+    return entries
@@ -1,9 +1,13 @@
 """Tests for baseline generation (base image query)."""
 
+import gzip
+import json
 import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 import yoinkc.baseline as baseline_mod
 from yoinkc.baseline import (
     BaselineResolver,
@@ -16,6 +20,14 @@ from yoinkc.executor import RunResult
 FIXTURES = Path(__file__).parent / "fixtures"
 
 
+def _bundle(names, presets=None):
+    """``_BUNDLE_SCRIPT`` output for a base image with *names* installed."""
+    out = "@@ packages\n" + "".join(f"{n}\t0:{n}-1.0-1.el9.x86_64\n" for n in names)
+    for path, text in (presets or {}).items():
+        out += f"@@ file {path}\n{text}"
+    return out
+
+
 def _make_executor(podman_result=None, probe_ok=True):
     """Build a mock executor that handles the nsenter probe and podman commands."""
     def executor(cmd, cwd=None):
@@ -161,10 +173,10 @@ def test_get_baseline_no_executor_no_file():
 def test_resolver_with_podman(_mock_userns):
     """Resolver queries podman when probe succeeds."""
     host_root = FIXTURES / "host_etc"
-    pkg_list = (FIXTURES / "base_image_packages.txt").read_text()
+    pkg_list = (FIXTURES / "base_image_bundle.txt").read_text()
 
     def podman_handler(cmd):
-        if "rpm" in cmd:
+        if "run" in cmd:
             return RunResult(stdout=pkg_list, stderr="", returncode=0)
         return RunResult(stdout="", stderr="", returncode=1)
 
@@ -284,10 +296,10 @@ def test_resolve_target_image_no_executor():
 @patch.object(baseline_mod, "in_user_namespace", return_value=False)
 def test_resolve_target_image_with_executor(_mock_userns):
     """resolve() with --target-image and an executor queries podman."""
-    pkg_list = (FIXTURES / "base_image_packages.txt").read_text()
+    pkg_list = (FIXTURES / "base_image_bundle.txt").read_text()
 
     def podman_handler(cmd):
-        if "rpm" in cmd:
+        if "run" in cmd:
             return RunResult(stdout=pkg_list, stderr="", returncode=0)
         return RunResult(stdout="", stderr="", returncode=1)
 
@@ -369,6 +381,26 @@ def test_pull_image_triggers_subprocess_when_not_cached(_mock_userns):
     assert "nsenter" in pull_cmd
 
 
+@patch.object(baseline_mod, "in_user_namespace", return_value=False)
+def test_background_pull_reports_status_instead_of_streaming(_mock_userns, capsys):
+    """With stream_pull off, podman's progress is captured, not inherited."""
+    kwargs_seen = []
+
+    def fake_subprocess_run(cmd, **kwargs):
+        kwargs_seen.append(kwargs)
+        return subprocess.CompletedProcess(cmd, returncode=0, stderr=b"Copying blob ...\n")
+
+    resolver = BaselineResolver(_not_cached_executor)
+    resolver.stream_pull = False
+    with patch("yoinkc.baseline.subprocess.run", fake_subprocess_run):
+        assert resolver.pull_image("quay.io/centos-bootc/centos-bootc:stream9") is True
+
+    assert kwargs_seen[0]["stderr"] == subprocess.PIPE
+    err = capsys.readouterr().err
+    assert "Pulled baseline image quay.io/centos-bootc/centos-bootc:stream9" in err
+    assert "Copying blob" not in err
+
+
 @patch.object(baseline_mod, "in_user_namespace", return_value=False)
 def test_pull_image_returns_false_on_subprocess_failure(_mock_userns):
     """pull_image() returns False when podman pull exits non-zero."""
@@ -432,3 +464,263 @@ def test_pull_image_skipped_when_nsenter_unavailable(_mock_userns):
 
     assert result is False
     assert len(subprocess_calls) == 0, "subprocess.run must not be called when nsenter unavailable"
+
+
+def test_auth_and_image_probes_run_once_per_resolver():
+    """Packages and presets queries share the auth and image-exists probes."""
+    calls = []
+
+    def podman(cmd):
+        calls.append(cmd)
+        if "--get-login" in cmd:
+            return RunResult(stdout="user\n", stderr="", returncode=0)
+        return RunResult(stdout=_bundle(["bash"], {"/usr/lib/systemd/system-preset/90-default.preset": "disable *\n"}),
+                         stderr="", returncode=0)
+
+    resolver = BaselineResolver(_make_executor(podman_result=podman))
+    image = "registry.redhat.io/rhel9/rhel-bootc:9.6"
+    assert resolver.query_packages(image) == {"bash"}
+    assert resolver.query_presets(image) == "disable *\n"
+    assert sum("--get-login" in c for c in calls) == 1
+    # One container start serves both queries.
+    assert sum("run" in c for c in calls) == 1
+
+
+# ---------------------------------------------------------------------------
+# BaselineCache — digest-keyed query results on disk
+# ---------------------------------------------------------------------------
+
+def _digest_podman(calls, digest="sha256:" + "a" * 64):
+    def podman(cmd):
+        calls.append(cmd)
+        if "inspect" in cmd:
+            return RunResult(stdout=f"{digest}\n", stderr="", returncode=0)
+        if "run" in cmd:
+            return RunResult(stdout=_bundle(["bash", "glibc"], {"/usr/lib/systemd/system-preset/90.preset": "enable sshd.service\n"}),
+                             stderr="", returncode=0)
+        return RunResult(stdout="", stderr="", returncode=1)
+    return podman
+
+
+@patch.object(baseline_mod, "in_user_namespace", return_value=False)
+def test_baseline_cache_skips_podman_run_on_hit(_mock_userns, tmp_path):
+    image = "quay.io/centos-bootc/centos-bootc:stream9"
+    first_calls, second_calls = [], []
+    first = BaselineResolver(_make_executor(podman_result=_digest_podman(first_calls)),
+                             cache=baseline_mod.BaselineCache(tmp_path))
+    assert first.query_packages(image) == {"bash", "glibc"}
+    assert first.query_presets(image) == "enable sshd.service\n"
+
+    cache = baseline_mod.BaselineCache(tmp_path)
+    second = BaselineResolver(_make_executor(podman_result=_digest_podman(second_calls)), cache=cache)
+    assert second.query_packages(image) == {"bash", "glibc"}
+    assert second.query_presets(image) == "enable sshd.service\n"
+    assert not any("run" in c for c in second_calls)
+    assert sum("inspect" in c for c in second_calls) == 1
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+@patch.object(baseline_mod, "in_user_namespace", return_value=False)
+def test_baseline_cache_is_keyed_by_digest(_mock_userns, tmp_path):
+    image = "quay.io/centos-bootc/centos-bootc:stream9"
+    BaselineResolver(_make_executor(podman_result=_digest_podman([])),
+                     cache=baseline_mod.BaselineCache(tmp_path)).query_packages(image)
+    calls = []
+    updated = _digest_podman(calls, digest="sha256:" + "b" * 64)
+    BaselineResolver(_make_executor(podman_result=updated),
+                     cache=baseline_mod.BaselineCache(tmp_path)).query_packages(image)
+    assert any("run" in c for c in calls)
+
+
+@patch.object(baseline_mod, "in_user_namespace", return_value=False)
+def test_baseline_cache_is_checked_again_after_pull(_mock_userns, tmp_path):
+    """Without skopeo the digest is only known after the pull; a hit then skips podman run."""
+    image = "quay.io/centos-bootc/centos-bootc:stream9"
+    digest = "sha256:" + "d" * 64
+    cache = baseline_mod.BaselineCache(tmp_path)
+    cache.put("bundle", digest, _bundle(["bash", "glibc"]))
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        if cmd[-1] == "true" and "nsenter" in cmd:
+            return RunResult(stdout="", stderr="", returncode=0)
+        if "podman" in cmd and "inspect" in cmd:
+            return RunResult(stdout=f"{digest}\n", stderr="", returncode=0)
+        # Not in the local store, and no skopeo.
+        return RunResult(stdout="", stderr="", returncode=1)
+
+    resolver = BaselineResolver(executor, cache=cache)
+    with patch("yoinkc.baseline.subprocess.run",
+               lambda cmd, **kw: subprocess.CompletedProcess(cmd, returncode=0)):
+        assert resolver.query_packages(image) == {"bash", "glibc"}
+    assert any("skopeo" in c for c in calls)
+    assert not any("run" in c for c in calls)
+    assert cache.hits == 1
+
+
+def test_baseline_cache_discards_corrupt_entries(tmp_path):
+    digest = "sha256:" + "c" * 64
+    cache = baseline_mod.BaselineCache(tmp_path)
+    cache.put("bundle", digest, _bundle(["bash"]))
+    key = cache._key("bundle", digest)
+    payload = cache._store.get(key)
+    payload["data"] = _bundle(["bash", "malware"])
+    cache._store.put(key, payload)
+    assert cache.get("bundle", digest) is None
+    assert cache._store.get(key) is None
+    assert cache.misses == 1
+
+
+def test_bundle_parses_every_section():
+    text = (
+        "@@ packages\nbash\t0:bash-5.1-6.el9.x86_64\nglibc\t0:glibc-2.34-1.el9.i686\n"
+        "glibc\t0:glibc-2.34-1.el9.x86_64\n"
+        "@@ etc_files\n/etc/bashrc\tabc123\n/etc/skel\t\n"
+        "@@ unit_files\nsshd.service\ntimers.target\n"
+        "@@ file /usr/lib/systemd/system-preset/90-default.preset\nenable sshd.service\n"
+        "@@ file /usr/lib/systemd/system-preset/85-display.preset\ndisable gdm.service\n"
+        "@@ file /usr/lib/sysctl.d/50-default.conf\nkernel.panic = 0\n"
+    )
+    bundle = baseline_mod.BaselineBundle.parse(text)
+    assert bundle.package_names == {"bash", "glibc"}
+    assert len(bundle.packages) == 3
+    assert bundle.etc_files == {"/etc/bashrc": "abc123", "/etc/skel": ""}
+    assert bundle.unit_files == ["sshd.service", "timers.target"]
+    assert bundle.preset_text == "disable gdm.service\nenable sshd.service\n"
+    assert bundle.sysctl == {"/usr/lib/sysctl.d/50-default.conf": "kernel.panic = 0\n"}
+
+
+@patch.object(baseline_mod, "in_user_namespace", return_value=False)
+def test_bundle_without_packages_is_a_failure(_mock_userns):
+    resolver = BaselineResolver(_make_executor(
+        podman_result=RunResult(stdout="@@ packages\n@@ etc_files\n", stderr="rpm: not found", returncode=0)))
+    assert resolver.query_packages("quay.io/fedora/fedora-bootc:41") is None
+    assert resolver.query_presets("quay.io/fedora/fedora-bootc:41") is None
+
+
+def _mount_executor(calls, image_root, mountpoint="/var/lib/containers/storage/overlay/abc/merged"):
+    records = "P\t(none)\tbash\t5.1\t6.el9\tx86_64\t8\nF\t0\t-1\t0\t10\t33188\t0\tfeed\troot\troot\t\t/etc/bashrc\n"
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        if cmd[-1] == "true" and "nsenter" in cmd:
+            return RunResult(stdout="", stderr="", returncode=0)
+        if "podman" in cmd and "exists" in cmd:
+            return RunResult(stdout="", stderr="", returncode=0)
+        if "podman" in cmd and "mount" in cmd:
+            return RunResult(stdout=f"{mountpoint}\n", stderr="", returncode=0)
+        if "podman" in cmd and "run" in cmd:
+            return RunResult(stdout=_bundle(["from-run"]), stderr="", returncode=0)
+        if cmd[0] == "rpm" and str(image_root) in " ".join(cmd):
+            return RunResult(stdout=records, stderr="", returncode=0)
+        return RunResult(stdout="", stderr="", returncode=0)
+    return executor
+
+
+@patch.object(baseline_mod, "in_user_namespace", return_value=False)
+def test_mounted_image_is_read_without_running_it(_mock_userns, tmp_path):
+    mountpoint = "/var/lib/containers/storage/overlay/abc/merged"
+    image_root = tmp_path / mountpoint.lstrip("/")
+    (image_root / "usr/lib/systemd/system-preset").mkdir(parents=True)
+    (image_root / "usr/lib/systemd/system-preset/90-default.preset").write_text("enable sshd.service")
+    (image_root / "usr/lib/systemd/system/sshd.service").parent.mkdir(parents=True)
+    (image_root / "usr/lib/systemd/system/sshd.service").write_text("[Unit]\n")
+    calls = []
+    resolver = BaselineResolver(_mount_executor(calls, image_root), mount_root=tmp_path)
+    bundle = resolver.query_bundle("quay.io/fedora/fedora-bootc:41")
+    assert bundle.packages == [("bash", "0:bash-5.1-6.el9.x86_64")]
+    assert bundle.etc_files == {"/etc/bashrc": "feed"}
+    assert bundle.unit_files == ["sshd.service"]
+    assert resolver.query_presets("quay.io/fedora/fedora-bootc:41") == "enable sshd.service"
+    assert not any("run" in c for c in calls)
+    assert any("unmount" in c for c in calls)
+    # The cached form round-trips.
+    again = baseline_mod.BaselineBundle.parse(bundle.to_text())
+    assert again.packages == bundle.packages and again.preset_text == "enable sshd.service\n"
+
+
+@patch.object(baseline_mod, "in_user_namespace", return_value=False)
+def test_invisible_mount_falls_back_to_podman_run(_mock_userns, tmp_path):
+    calls = []
+    resolver = BaselineResolver(_mount_executor(calls, tmp_path / "nowhere"), mount_root=tmp_path)
+    assert resolver.query_packages("quay.io/fedora/fedora-bootc:41") == {"from-run"}
+    assert any("unmount" in c for c in calls)
+
+
+# ---------------------------------------------------------------------------
+# Exported bundle files (yoinkc baseline export / --baseline-bundle)
+# ---------------------------------------------------------------------------
+
+def _exported(tmp_path):
+    bundle = baseline_mod.BaselineBundle.parse(
+        _bundle(["bash", "glibc"], {"/usr/lib/systemd/system-preset/90.preset": "enable sshd.service\n",
+                                    "/usr/lib/sysctl.d/50-default.conf": "kernel.panic = 0\n"}))
+    bundle.image = "registry.redhat.io/rhel9/rhel-bootc:9.6"
+    bundle.digest = "sha256:" + "d" * 64
+    path = tmp_path / "rhel-bootc_9.6.baseline.json.gz"
+    baseline_mod.write_baseline_bundle_file(bundle, path)
+    return path
+
+
+def test_bundle_file_round_trips(tmp_path):
+    bundle = baseline_mod.load_baseline_bundle_file(_exported(tmp_path))
+    assert bundle.package_names == {"bash", "glibc"}
+    assert bundle.preset_text == "enable sshd.service\n"
+    assert bundle.sysctl == {"/usr/lib/sysctl.d/50-default.conf": "kernel.panic = 0\n"}
+    assert bundle.image == "registry.redhat.io/rhel9/rhel-bootc:9.6"
+    assert bundle.digest == "sha256:" + "d" * 64
+
+
+def test_bundle_file_rejects_tampering_and_newer_versions(tmp_path):
+    path = _exported(tmp_path)
+    payload = json.loads(gzip.decompress(path.read_bytes()))
+    payload["bundle"]["packages"].append({"name": "extra", "nevra": "0:extra-1-1.x86_64"})
+    path.write_bytes(gzip.compress(json.dumps(payload).encode()))
+    with pytest.raises(ValueError, match="integrity"):
+        baseline_mod.load_baseline_bundle_file(path)
+
+    payload = json.loads(gzip.decompress(_exported(tmp_path).read_bytes()))
+    payload["version"] = baseline_mod.BUNDLE_FILE_VERSION + 1
+    path.write_bytes(gzip.compress(json.dumps(payload).encode()))
+    with pytest.raises(ValueError, match="unsupported version"):
+        baseline_mod.load_baseline_bundle_file(path)
+
+
+def test_resolver_with_bundle_runs_nothing(tmp_path):
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return RunResult(stdout="", stderr="", returncode=1)
+
+    bundle = baseline_mod.load_baseline_bundle_file(_exported(tmp_path))
+    resolver = BaselineResolver(executor, bundle=bundle)
+    names, image, no_baseline = resolver.resolve(FIXTURES / "host_etc", "rhel", "9.4")
+    assert (names, image, no_baseline) == ({"bash", "glibc"}, "registry.redhat.io/rhel9/rhel-bootc:9.6", False)
+    assert resolver.query_presets(image) == "enable sshd.service\n"
+    assert calls == []
+
+
+def test_baseline_export_command(tmp_path, monkeypatch):
+    from yoinkc.__main__ import main
+
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        if "exists" in cmd:
+            return RunResult(stdout="", stderr="", returncode=0)
+        if "inspect" in cmd:
+            return RunResult(stdout="sha256:" + "e" * 64 + "\n", stderr="", returncode=0)
+        if "run" in cmd:
+            return RunResult(stdout=_bundle(["bash"]), stderr="", returncode=0)
+        return RunResult(stdout="", stderr="", returncode=1)
+
+    monkeypatch.setattr("yoinkc.executor.subprocess_executor", executor)
+    out = tmp_path / "b.json.gz"
+    assert main(["baseline", "export", "quay.io/fedora/fedora-bootc:41", "-o", str(out)]) == 0
+    assert not any("nsenter" in c for c in calls)
+    bundle = baseline_mod.load_baseline_bundle_file(out)
+    assert bundle.package_names == {"bash"}
+    assert bundle.digest == "sha256:" + "e" * 64
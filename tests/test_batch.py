@@ -0,0 +1,66 @@
+"""Tests for the adaptive concurrent batch runner (yoinkc.batch)."""
+
+import asyncio
+import random
+
+import pytest
+
+from yoinkc.batch import BatchRunner, arg_bytes
+from yoinkc.executor import run_sync
+
+
+def test_results_merge_in_item_order():
+    items = [f"pkg{i:03d}" for i in range(200)]
+    rng = random.Random(3)
+
+    async def fn(chunk):
+        await asyncio.sleep(rng.random() / 1000)
+        return [name.upper() for name in chunk]
+
+    batches = run_sync(BatchRunner(initial=7, concurrency=4).run(fn, items))
+    assert [name for chunk, _ in batches for name in chunk] == items
+    assert [name for _, result in batches for name in result] == [n.upper() for n in items]
+
+
+def test_batches_fit_the_argument_limit():
+    items = ["x" * 100] * 50
+    runner = BatchRunner(initial=1000, arg_limit=2000)
+    fixed = ["dnf", "repoquery", "--installed"]
+    batches = run_sync(runner.run(lambda chunk: asyncio.sleep(0, len(chunk)), items, fixed_args=fixed))
+    assert sum(len(c) for c, _ in batches) == 50
+    assert all(arg_bytes(fixed + c) <= 2000 for c, _ in batches)
+    # An item larger than the limit still goes out, alone.
+    huge = run_sync(runner.run(lambda chunk: asyncio.sleep(0, chunk), ["y" * 5000, "z"]))
+    assert [c for c, _ in huge] == [["y" * 5000], ["z"]]
+
+
+def test_concurrency_is_bounded():
+    running = peak = 0
+
+    async def fn(chunk):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+
+    run_sync(BatchRunner(initial=1, max_items=1, concurrency=3).run(fn, [str(i) for i in range(30)]))
+    assert peak == 3
+
+
+@pytest.mark.parametrize("elapsed, grows", [(0.01, True), (10.0, False)])
+def test_size_adapts_to_latency(elapsed, grows):
+    runner = BatchRunner(initial=50, max_items=1000, target_seconds=2.0)
+    runner._observe(50, elapsed)
+    assert (runner.size > 50) is grows
+    assert runner.size <= 100
+
+
+def test_later_batches_use_the_adapted_size():
+    async def fn(chunk):
+        await asyncio.sleep(0.0005 * len(chunk) + 0.005)  # fixed start-up cost dominates
+        return len(chunk)
+
+    runner = BatchRunner(initial=2, concurrency=1, target_seconds=0.05)
+    sizes = [n for _, n in run_sync(runner.run(fn, [str(i) for i in range(200)]))]
+    assert sizes[0] == 2 and max(sizes) > 8
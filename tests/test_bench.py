@@ -0,0 +1,53 @@
+"""Tests for the synthetic host generator and benchmark harness (yoinkc.bench)."""
+
+import json
+
+import pytest
+
+from yoinkc.bench import HostShape, build_host, run_scale
+from yoinkc.bench.cli import parse_args
+from yoinkc.inspectors import run_all
+
+
+_TINY = HostShape(
+    packages=40, deps_per_package=2, modified_configs=5, unowned_files=12,
+    opt_apps=2, opt_depth=3, binaries_per_app=2, usr_local_binaries=3,
+    venvs=1, venv_packages=4, lockfiles=1, cron_jobs=3, systemd_units=6,
+)
+
+
+@pytest.fixture(scope="module")
+def tiny_host(tmp_path_factory):
+    return build_host(tmp_path_factory.mktemp("synthetic"), _TINY)
+
+
+def test_synthetic_host_matches_its_shape(tiny_host):
+    snap = run_all(tiny_host.root, executor=tiny_host.executor(),
+                   baseline_packages_file=tiny_host.baseline_file)
+    n_base = int(_TINY.packages * _TINY.base_fraction)
+    assert len(snap.rpm.packages_added) == _TINY.packages - n_base
+    assert len(snap.rpm.rpm_va) == _TINY.modified_configs
+    assert snap.rpm.leaf_packages and snap.rpm.auto_packages
+    unowned = [f for f in snap.config.files if f.path.startswith("/etc/synthetic/")]
+    assert len(unowned) == _TINY.unowned_files
+    assert "synth-unit0000.service" in snap.services.enabled_units
+    assert len(snap.scheduled_tasks.cron_jobs) == _TINY.cron_jobs
+    methods = {i.method for i in snap.non_rpm_software.items}
+    assert "python venv" in methods and "npm package-lock.json" in methods
+    assert any(m.startswith("readelf") for m in methods)
+
+
+def test_run_scale_reports_phases(tmp_path):
+    result = run_scale("tiny", _TINY, repeat=2, workdir=tmp_path)
+    assert len(result["runs"]) == 2
+    assert set(result["best"]) == {"inspect_s", "redact_s", "serialize_s", "render_s", "total_s"}
+    assert result["commands"] > 0 and result["peak_rss_kb"] > 0
+    assert "rpm" in result["perf"]["inspectors"]
+    assert (tmp_path / "tiny" / "out-0" / "Containerfile").exists()
+    json.dumps(result)
+
+
+def test_cli_rejects_unknown_scale():
+    assert parse_args(["--scales", "small,large"]).scales == ["small", "large"]
+    with pytest.raises(SystemExit):
+        parse_args(["--scales", "huge"])
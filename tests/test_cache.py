@@ -0,0 +1,66 @@
+"""Tests for the inspector result cache (yoinkc.cache)."""
+
+import os
+
+from yoinkc import cache
+from yoinkc.executor import RunResult
+
+
+def _rpmdb_executor(headers):
+    def run(cmd, cwd=None):
+        return RunResult(stdout="\n".join(headers) + "\n", stderr="", returncode=0)
+    return run
+
+
+def test_fingerprint_changes_when_file_changes(tmp_path):
+    etc = tmp_path / "etc"
+    etc.mkdir()
+    conf = etc / "app.conf"
+    conf.write_text("a=1\n")
+    before = cache.Fingerprinter(tmp_path, None).fingerprint(["etc"])
+    assert cache.Fingerprinter(tmp_path, None).fingerprint(["etc"]) == before
+
+    conf.write_text("a=22\n")
+    assert cache.Fingerprinter(tmp_path, None).fingerprint(["etc"]) != before
+
+
+def test_fingerprint_tracks_rpmdb_cookie(tmp_path):
+    one = cache.Fingerprinter(tmp_path, _rpmdb_executor(["aaa", "bbb"]))
+    same = cache.Fingerprinter(tmp_path, _rpmdb_executor(["bbb", "aaa"]))
+    other = cache.Fingerprinter(tmp_path, _rpmdb_executor(["aaa", "ccc"]))
+    assert one.fingerprint([cache.RPMDB]) == same.fingerprint([cache.RPMDB])
+    assert one.fingerprint([cache.RPMDB]) != other.fingerprint([cache.RPMDB])
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+    store = cache.ResultCache(tmp_path, max_bytes=10 ** 9)
+    blob = {"data": os.urandom(2048).hex()}
+    for i, key in enumerate(("a", "b", "c")):
+        store.put(key, blob)
+        os.utime(store._path(key), ns=(i * 10 ** 9, i * 10 ** 9))
+    assert store.get("a") == blob  # "a" becomes most recently used
+    size = store._path("a").stat().st_size
+    store.max_bytes = 2 * size
+    store.evict()
+    assert store.get("b") is None
+    assert store.get("a") == blob
+    assert store.get("c") == blob
+
+
+def test_section_cache_replays_warnings(tmp_path):
+    sections = cache.SectionCache(cache.ResultCache(tmp_path), cache.Fingerprinter(tmp_path, None))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        warnings.append({"source": "x", "message": "m", "severity": "warning"})
+        return ["result"]
+
+    warnings = []
+    assert sections.lookup("x", [], {}, compute, warnings, list, list) == ["result"]
+    warnings = []
+    assert sections.lookup("x", [], {}, compute, warnings, list, list) == ["result"]
+    assert len(calls) == 1
+    assert warnings == [{"source": "x", "message": "m", "severity": "warning"}]
+    assert sections.to_dict()["hits"] == ["x"]
+    assert sections.to_dict()["misses"] == ["x"]
@@ -28,6 +28,15 @@ def test_defaults():
     assert args.push_to_github is None
     assert args.public is False
     assert args.yes is False
+    assert args.jobs == 4
+    assert args.record is None
+    assert args.replay is None
+    assert args.replay_latency is False
+    assert args.cache_dir is None
+    assert args.cache_max_size == 256
+    assert args.only is None
+    assert args.skip is None
+    assert args.sections is None
 
 
 def test_from_snapshot_flags():
@@ -148,6 +157,161 @@ def test_no_baseline_reaches_inspectors():
         assert call_kwargs.kwargs.get("no_baseline_opt_in") is True
 
 
+def test_jobs_reaches_inspectors():
+    """--jobs is parsed and passed through to run_all."""
+    import unittest.mock
+    args = parse_args(["--jobs", "2"])
+    assert args.jobs == 2
+
+    with unittest.mock.patch("yoinkc.inspectors.run_all") as mock_run_all:
+        mock_run_all.return_value = unittest.mock.MagicMock()
+        from yoinkc.__main__ import _run_inspectors
+        _run_inspectors(Path("/host"), args)
+        assert mock_run_all.call_args.kwargs.get("jobs") == 2
+
+
+def test_jobs_must_be_positive():
+    with pytest.raises(SystemExit):
+        parse_args(["--jobs", "0"])
+
+
+def test_record_and_replay_are_mutually_exclusive():
+    with pytest.raises(SystemExit):
+        parse_args(["--record", "/tmp/a.cassette", "--replay", "/tmp/b.cassette"])
+
+
+def test_replay_latency_requires_replay():
+    with pytest.raises(SystemExit):
+        parse_args(["--replay-latency"])
+
+
+def test_record_wraps_executor_passed_to_run_all(tmp_path):
+    """--record hands run_all a RecordingExecutor and closes the cassette afterwards."""
+    from yoinkc.executor import RecordingExecutor
+    cassette = tmp_path / "run.cassette"
+    args = parse_args(["--record", str(cassette)])
+    with unittest.mock.patch("yoinkc.inspectors.run_all") as mock_run_all:
+        mock_run_all.return_value = unittest.mock.MagicMock()
+        from yoinkc.__main__ import _run_inspectors
+        _run_inspectors(tmp_path, args)
+        assert isinstance(mock_run_all.call_args.kwargs.get("executor"), RecordingExecutor)
+    assert cassette.exists()
+
+
+def test_cache_dir_reaches_inspectors(tmp_path):
+    """--cache-dir and --cache-max-size are passed through to run_all."""
+    args = parse_args(["--cache-dir", str(tmp_path), "--cache-max-size", "8"])
+    with unittest.mock.patch("yoinkc.inspectors.run_all") as mock_run_all:
+        mock_run_all.return_value = unittest.mock.MagicMock()
+        from yoinkc.__main__ import _run_inspectors
+        _run_inspectors(Path("/host"), args)
+        assert mock_run_all.call_args.kwargs.get("cache_dir") == tmp_path
+        assert mock_run_all.call_args.kwargs.get("cache_max_bytes") == 8 * 1024 * 1024
+
+
+def test_cache_dir_rejected_with_from_snapshot(tmp_path):
+    with pytest.raises(SystemExit):
+        parse_args(["--from-snapshot", str(tmp_path / "s.json"), "--cache-dir", str(tmp_path)])
+
+
+def test_baseline_cache_reaches_inspectors(tmp_path):
+    args = parse_args(["--baseline-cache", str(tmp_path), "--baseline-mount"])
+    with unittest.mock.patch("yoinkc.inspectors.run_all") as mock_run_all:
+        mock_run_all.return_value = unittest.mock.MagicMock()
+        from yoinkc.__main__ import _run_inspectors
+        _run_inspectors(Path("/host"), args)
+        assert mock_run_all.call_args.kwargs.get("baseline_cache_dir") == tmp_path
+        assert mock_run_all.call_args.kwargs.get("baseline_mount") is True
+    with pytest.raises(SystemExit):
+        parse_args(["--from-snapshot", str(tmp_path / "s.json"), "--baseline-cache", str(tmp_path)])
+
+
+def test_baseline_bundle_validation(tmp_path):
+    bundle = tmp_path / "b.json.gz"
+    with pytest.raises(SystemExit):
+        parse_args(["--baseline-bundle", str(bundle)])
+    bundle.write_bytes(b"")
+    assert parse_args(["--baseline-bundle", str(bundle)]).baseline_bundle == bundle
+    with pytest.raises(SystemExit):
+        parse_args(["--baseline-bundle", str(bundle), "--baseline-packages", str(bundle)])
+
+
+def test_only_and_skip_select_sections():
+    args = parse_args(["--only", "rpm,services,config", "--skip", "config"])
+    assert args.sections == ["rpm", "services"]
+    args = parse_args(["--skip", "non_rpm_software,storage"])
+    assert "storage" not in args.sections and "rpm" in args.sections
+
+
+def test_only_rejects_unknown_section():
+    with pytest.raises(SystemExit):
+        parse_args(["--only", "rpm,packages"])
+
+
+def test_only_and_skip_cannot_cancel_out():
+    with pytest.raises(SystemExit):
+        parse_args(["--only", "rpm", "--skip", "rpm"])
+
+
+def test_time_budget_reaches_inspectors():
+    args = parse_args(["--time-budget", "90"])
+    with unittest.mock.patch("yoinkc.inspectors.run_all") as mock_run_all:
+        mock_run_all.return_value = unittest.mock.MagicMock()
+        from yoinkc.__main__ import _run_inspectors
+        _run_inspectors(Path("/host"), args)
+        assert mock_run_all.call_args.kwargs.get("time_budget") == 90.0
+
+
+def test_time_budget_must_be_positive():
+    with pytest.raises(SystemExit):
+        parse_args(["--time-budget", "0"])
+
+
+def test_verify_scope_reaches_inspectors():
+    assert parse_args([]).verify_scope == "all"
+    args = parse_args(["--verify-scope", "etc"])
+    with unittest.mock.patch("yoinkc.inspectors.run_all") as mock_run_all:
+        mock_run_all.return_value = unittest.mock.MagicMock()
+        from yoinkc.__main__ import _run_inspectors
+        _run_inspectors(Path("/host"), args)
+        assert mock_run_all.call_args.kwargs.get("verify_scope") == "etc"
+    with pytest.raises(SystemExit):
+        parse_args(["--verify-scope", "usr"])
+
+
+def test_verify_jobs_reaches_inspectors():
+    assert parse_args([]).verify_jobs is None
+    args = parse_args(["--verify-jobs", "4"])
+    with unittest.mock.patch("yoinkc.inspectors.run_all") as mock_run_all:
+        mock_run_all.return_value = unittest.mock.MagicMock()
+        from yoinkc.__main__ import _run_inspectors
+        _run_inspectors(Path("/host"), args)
+        assert mock_run_all.call_args.kwargs.get("verify_jobs") == 4
+    with pytest.raises(SystemExit):
+        parse_args(["--verify-jobs", "0"])
+
+
+def test_progress_file_receives_events(tmp_path):
+    import json
+    events_file = tmp_path / "progress.jsonl"
+    args = parse_args(["--progress-file", str(events_file)])
+
+    def fake_run_all(*a, **kw):
+        from yoinkc import progress
+        progress.emit("run_start")
+        return unittest.mock.MagicMock()
+
+    with unittest.mock.patch("yoinkc.inspectors.run_all", side_effect=fake_run_all):
+        from yoinkc.__main__ import _run_inspectors
+        _run_inspectors(Path("/host"), args)
+    assert json.loads(events_file.read_text())["event"] == "run_start"
+
+
+def test_progress_fd_and_file_are_mutually_exclusive(tmp_path):
+    with pytest.raises(SystemExit):
+        parse_args(["--progress-fd", "3", "--progress-file", str(tmp_path / "p")])
+
+
 def _make_main_snapshot():
     """Minimal snapshot mock for main() tests."""
     snap = unittest.mock.MagicMock()
@@ -0,0 +1,65 @@
+"""Tests for the --time-budget deadline (yoinkc.deadline)."""
+
+from yoinkc import deadline
+from yoinkc.executor import RunResult
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_helpers_are_noops_without_deadline():
+    assert deadline.expired("anything") is False
+    assert deadline.exhausted() is False
+    assert deadline.command_timeout(300) == 300
+
+
+def test_expired_marks_current_section():
+    clock = _Clock()
+    d = deadline.Deadline(10, clock=clock)
+    with d.activate(), deadline.section("rpm"):
+        assert deadline.expired("dnf dependency walk") is False
+        clock.now += 10
+        assert deadline.expired("dnf dependency walk") is True
+        assert deadline.expired("dnf dependency walk") is True
+        with deadline.section("config"):
+            assert deadline.expired() is True
+    assert d.incomplete() == {"config": [], "rpm": ["dnf dependency walk"]}
+
+
+def test_exhausted_does_not_mark():
+    d = deadline.Deadline(0)
+    with d.activate(), deadline.section("rpm"):
+        assert deadline.exhausted() is True
+    assert d.incomplete() == {}
+
+
+def test_command_timeout_clamped_to_remaining_budget():
+    clock = _Clock()
+    d = deadline.Deadline(30, clock=clock)
+    with d.activate():
+        assert deadline.command_timeout(300) == 30
+        assert deadline.command_timeout(5) == 5
+        clock.now += 60
+        assert deadline.command_timeout(300) == deadline.MIN_COMMAND_TIMEOUT
+
+
+def test_dnf_dependency_walk_stops_at_deadline():
+    from yoinkc.inspectors.rpm import _classify_deps_via_dnf
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd[-1])
+        return RunResult(stdout="", stderr="", returncode=0)
+
+    d = deadline.Deadline(0)
+    with d.activate(), deadline.section("rpm"):
+        depends_on = _classify_deps_via_dnf(executor, "/", {"a", "b", "c"})
+    # Only the probe ran; the result still covers every package.
+    assert calls == ["a"]
+    assert set(depends_on) == {"a", "b", "c"}
+    assert d.incomplete() == {"rpm": ["dnf dependency walk"]}
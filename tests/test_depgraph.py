@@ -0,0 +1,70 @@
+"""Tests for the SCC-condensed dependency closure (yoinkc.depgraph)."""
+
+import random
+
+from yoinkc.depgraph import DependencyClosure, reverse_tree
+from yoinkc.executor import RunResult
+from yoinkc.inspectors.rpm import _classify_leaf_auto
+from yoinkc.schema import PackageEntry
+
+
+def _walk(graph, start):
+    seen = set()
+    stack = list(graph.get(start, ()))
+    while stack:
+        node = stack.pop()
+        if node not in seen:
+            seen.add(node)
+            stack.extend(graph.get(node, ()))
+    seen.discard(start)
+    return sorted(seen)
+
+
+def test_cycles_reach_every_member():
+    graph = {"a": {"b"}, "b": {"c"}, "c": {"a", "d"}, "d": set(), "e": {"e"}}
+    closure = DependencyClosure(graph)
+    assert closure.descendants("a") == ["b", "c", "d"]
+    assert closure.descendants("c") == ["a", "b", "d"]
+    assert closure.descendants("d") == []
+    assert closure.descendants("e") == []
+    assert closure.descendants("a", within=closure.mask({"b", "d", "zzz"})) == ["b", "d"]
+    assert closure.descendants("unknown") == []
+
+
+def test_matches_per_node_walk_on_random_graphs():
+    rng = random.Random(7)
+    for _ in range(20):
+        names = [f"p{i}" for i in range(60)]
+        graph = {n: set(rng.sample(names, rng.randint(0, 4))) for n in names}
+        closure = DependencyClosure(graph)
+        for n in names:
+            assert closure.descendants(n) == _walk(graph, n)
+
+
+def test_deep_chain_does_not_recurse():
+    graph = {f"p{i:05d}": {f"p{i + 1:05d}"} for i in range(20000)}
+    assert len(DependencyClosure(graph).descendants("p00000")) == 20000
+
+
+def test_reverse_tree():
+    assert reverse_tree({"httpd": ["apr"], "mod_ssl": ["apr", "openssl"]}) == {
+        "apr": ["httpd", "mod_ssl"], "openssl": ["mod_ssl"],
+    }
+
+
+def test_leaf_tree_from_direct_deps_with_cycle(tmp_path):
+    # rpm -qR fallback: direct edges only, with a cycle between b and c.
+    requires = {"a": "b\n", "b": "c\n", "c": "b\n", "d": ""}
+
+    def executor(cmd, cwd=None):
+        if "-qR" in cmd:
+            return RunResult(stdout=requires[cmd[-1]], stderr="", returncode=0)
+        if "--whatprovides" in cmd:
+            caps = cmd[cmd.index("--whatprovides") + 1:]
+            return RunResult(stdout="".join(f"{c}-1-1.x86_64\n" for c in caps), stderr="", returncode=0)
+        return RunResult(stdout="", stderr="", returncode=1)
+
+    packages = [PackageEntry(name=n, epoch="0", version="1", release="1", arch="x86_64") for n in requires]
+    leaf, auto, tree = _classify_leaf_auto(executor, tmp_path, packages)
+    assert (leaf, auto) == (["a", "d"], ["b", "c"])
+    assert tree == {"a": ["b", "c"], "d": []}
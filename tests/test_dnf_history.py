@@ -0,0 +1,140 @@
+"""Tests for the dnf history database reader (yoinkc.dnf_history)."""
+
+import sqlite3
+
+import pytest
+
+from yoinkc import rpmdb_sqlite
+from yoinkc.dnf_history import DnfHistory
+from yoinkc.executor import RunResult
+from yoinkc.inspectors.rpm import _classify_leaf_auto, run as run_rpm
+from yoinkc.rpmdb import RpmDatabase
+
+
+# (trans_id, trans_ok, [(action, reason, repo, name, version)])
+_TRANSACTIONS = [
+    (1, True, [(1, 2, "baseos", "bash", "5.1"), (1, 1, "baseos", "glibc", "2.34"),
+               (1, 2, "appstream", "httpd", "2.4.57"), (1, 1, "appstream", "apr", "1.7.0")]),
+    (2, True, [(6, 2, "appstream", "httpd", "2.4.62"), (7, 2, "appstream", "httpd", "2.4.57"),
+               (1, 4, "epel", "htop", "3.2")]),
+    (3, True, [(8, 0, None, "telnet", "0.17")]),
+    (4, False, [(1, 2, "epel", "nginx", "1.24")]),
+    (5, True, [(11, 1, "appstream", "apr", "1.7.0"), (8, 0, None, "vim-enhanced", "8.2")]),
+]
+
+
+def _make_dnf4(host_root):
+    path = host_root / "var/lib/dnf/history.sqlite"
+    path.parent.mkdir(parents=True)
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE trans (id INTEGER PRIMARY KEY, state INTEGER);
+        CREATE TABLE repo (id INTEGER PRIMARY KEY, repoid TEXT);
+        CREATE TABLE rpm (item_id INTEGER PRIMARY KEY, name TEXT, epoch INTEGER,
+                          version TEXT, release TEXT, arch TEXT);
+        CREATE TABLE trans_item (id INTEGER PRIMARY KEY, trans_id INTEGER, item_id INTEGER,
+                                 repo_id INTEGER, action INTEGER, reason INTEGER, state INTEGER);
+    """)
+    repos = {}
+    for tid, ok, items in _TRANSACTIONS:
+        conn.execute("INSERT INTO trans VALUES (?, ?)", (tid, 1 if ok else 2))
+        for action, reason, repo, name, version in items:
+            item = conn.execute("INSERT INTO rpm (name, epoch, version, release, arch) VALUES (?, 0, ?, '1.el9', 'x86_64')",
+                                (name, version)).lastrowid
+            repo_id = None
+            if repo:
+                repo_id = repos.setdefault(repo, conn.execute("INSERT INTO repo (repoid) VALUES (?)", (repo,)).lastrowid)
+            conn.execute("INSERT INTO trans_item (trans_id, item_id, repo_id, action, reason, state) VALUES (?, ?, ?, ?, ?, 1)",
+                         (tid, item, repo_id, action, reason))
+    conn.commit()
+    conn.close()
+
+
+def _make_dnf5(host_root):
+    path = host_root / "usr/lib/sysimage/libdnf5/transaction_history.sqlite"
+    path.parent.mkdir(parents=True)
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE trans_state (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE trans_item_action (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE trans_item_reason (id INTEGER PRIMARY KEY, name TEXT);
+        CREATE TABLE trans (id INTEGER PRIMARY KEY, state_id INTEGER);
+        CREATE TABLE repo (id INTEGER PRIMARY KEY, repoid TEXT);
+        CREATE TABLE rpm (item_id INTEGER PRIMARY KEY, name TEXT, epoch INTEGER,
+                          version TEXT, release TEXT, arch TEXT);
+        CREATE TABLE trans_item (id INTEGER PRIMARY KEY, trans_id INTEGER, item_id INTEGER,
+                                 repo_id INTEGER, action_id INTEGER, reason_id INTEGER, state_id INTEGER);
+        INSERT INTO trans_state VALUES (1, 'Started'), (2, 'Ok'), (3, 'Error');
+        INSERT INTO trans_item_action VALUES (1, 'Install'), (2, 'Upgrade'), (5, 'Remove'), (6, 'Replaced');
+        INSERT INTO trans_item_reason VALUES (0, 'None'), (1, 'Dependency'), (2, 'User');
+        INSERT INTO trans VALUES (1, 2), (2, 2);
+        INSERT INTO repo VALUES (1, 'fedora');
+        INSERT INTO rpm VALUES (1, 'git', 0, '2.43', '1.fc40', 'x86_64'),
+                               (2, 'perl', 4, '5.38', '1.fc40', 'x86_64'),
+                               (3, 'nano', 0, '7.2', '1.fc40', 'x86_64');
+        INSERT INTO trans_item VALUES (1, 1, 1, 1, 1, 2, 2), (2, 1, 2, 1, 1, 1, 2),
+                                      (3, 1, 3, 1, 1, 2, 2), (4, 2, 3, NULL, 5, 0, 2);
+    """)
+    conn.commit()
+    conn.close()
+
+
+def test_dnf4_history(tmp_path):
+    _make_dnf4(tmp_path)
+    history = DnfHistory.load(tmp_path)
+    assert history.removed == ["vim-enhanced", "telnet"]
+    assert history.reason("bash") == "user"
+    assert history.reason("apr") == "dependency"  # reason change
+    assert history.reason("htop") == "weak dependency"
+    assert history.reason("nginx") == "unknown"  # failed transaction
+    assert history.user_installed({"bash", "glibc", "httpd", "apr", "nginx"}) == {"bash", "httpd", "nginx"}
+    assert history.from_repo("httpd", "0", "2.4.62", "1.el9", "x86_64") == "appstream"
+    assert history.from_repo("httpd", "0", "2.4.99", "1.el9", "x86_64") is None
+    assert history.from_repo("htop", "0", "3.2", "1.el9", "x86_64") == "epel"
+
+
+def test_dnf5_history(tmp_path):
+    _make_dnf5(tmp_path)
+    history = DnfHistory.load(tmp_path)
+    assert history.removed == ["nano"]
+    assert history.user_installed({"git", "perl"}) == {"git"}
+    assert history.from_repo("perl", "4", "5.38", "1.fc40", "x86_64") == "fedora"
+
+
+@pytest.mark.parametrize("content", [None, b"not a database"])
+def test_missing_or_unreadable_history(tmp_path, content):
+    if content is not None:
+        path = tmp_path / "var/lib/dnf/history.sqlite"
+        path.parent.mkdir(parents=True)
+        path.write_bytes(content)
+    assert DnfHistory.load(tmp_path) is None
+
+
+def test_not_read_while_a_cassette_is_in_use(tmp_path):
+    _make_dnf4(tmp_path)
+    with rpmdb_sqlite.suspend_native_reads():
+        assert DnfHistory.load(tmp_path) is None
+    assert DnfHistory.load(tmp_path) is not None
+
+
+def test_rpm_inspector_reads_history_instead_of_dnf(tmp_path):
+    _make_dnf4(tmp_path)
+    db = RpmDatabase.parse("".join(
+        f"P\t(none)\t{name}\t{version}\t1.el9\tx86_64\t8\nV\t{name}\n"
+        for name, version in [("bash", "5.1"), ("glibc", "2.34"), ("httpd", "2.4.62"), ("apr", "1.7.0")]
+    ))
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return RunResult(stdout="", stderr="", returncode=1)
+
+    (tmp_path / "etc").mkdir()
+    section = run_rpm(tmp_path, executor, rpmdb=db)
+    assert not any("dnf" in c for c in calls), calls
+    assert section.dnf_history_removed == ["vim-enhanced", "telnet"]
+    assert {p.name: p.source_repo for p in section.packages_added}["httpd"] == "appstream"
+    leaf, auto, _ = _classify_leaf_auto(executor, tmp_path, section.packages_added, rpmdb=db,
+                                        history=DnfHistory.load(tmp_path))
+    assert (leaf, auto) == (["bash", "httpd"], ["apr", "glibc"])
+    assert not any("dnf" in c for c in calls), calls
@@ -0,0 +1,145 @@
+"""Tests for the record/replay and async executors."""
+
+import asyncio
+import gzip
+import json
+import threading
+import time
+
+import pytest
+
+from yoinkc.executor import (
+    MemoizingExecutor,
+    RecordingExecutor,
+    ReplayExecutor,
+    RunResult,
+    is_idempotent,
+    run_sync,
+    to_async,
+)
+
+
+def _counting_executor(calls):
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return RunResult(stdout=f"out {len(calls)}\n", stderr="", returncode=len(calls) % 2)
+    return executor
+
+
+def test_record_then_replay_round_trip(tmp_path):
+    cassette = tmp_path / "host.cassette"
+    calls: list = []
+    with RecordingExecutor(_counting_executor(calls), cassette, host_root="/host") as rec:
+        first = rec(["rpm", "--dbpath", "/host/var/lib/rpm", "-qa"])
+        second = rec(["rpm", "--dbpath", "/host/var/lib/rpm", "-qa"])
+        other = rec(["lsmod"])
+
+    replay = ReplayExecutor(cassette)
+    assert replay(["rpm", "--dbpath", "/host/var/lib/rpm", "-qa"]) == first
+    assert replay(["rpm", "--dbpath", "/host/var/lib/rpm", "-qa"]) == second
+    # Recordings exhausted: the last one keeps being served.
+    assert replay(["rpm", "--dbpath", "/host/var/lib/rpm", "-qa"]) == second
+    assert replay(["lsmod"]) == other
+    assert len(calls) == 3
+
+
+def test_replay_unknown_command_is_not_found(tmp_path):
+    cassette = tmp_path / "empty.cassette"
+    RecordingExecutor(_counting_executor([]), cassette).close()
+    result = ReplayExecutor(cassette)(["dnf", "history", "list"])
+    assert result.returncode == 127
+    assert "not in cassette" in result.stderr
+
+
+def test_replay_maps_host_root(tmp_path):
+    cassette = tmp_path / "host.cassette"
+    with RecordingExecutor(_counting_executor([]), cassette, host_root="/host") as rec:
+        recorded = rec(["systemctl", "--root", "/host", "list-unit-files"])
+    replay = ReplayExecutor(cassette, host_root=str(tmp_path / "copy"))
+    assert replay(["systemctl", "--root", str(tmp_path / "copy"), "list-unit-files"]) == recorded
+
+
+def test_replay_latency_sleeps(tmp_path, monkeypatch):
+    cassette = tmp_path / "slow.cassette"
+    with gzip.open(cassette, "wt") as fh:
+        fh.write(json.dumps({"format": "yoinkc-cassette", "version": 1, "host_root": "/"}) + "\n")
+        fh.write(json.dumps({"cmd": ["lsmod"], "cwd": None, "stdout": "", "stderr": "",
+                             "returncode": 0, "duration": 1.5}) + "\n")
+    slept: list = []
+    monkeypatch.setattr("yoinkc.executor.time.sleep", slept.append)
+    ReplayExecutor(cassette)(["lsmod"])
+    assert slept == []
+    ReplayExecutor(cassette, replay_latency=True)(["lsmod"])
+    assert slept == [1.5]
+
+
+def test_replay_rejects_non_cassette(tmp_path):
+    bogus = tmp_path / "bogus.gz"
+    with gzip.open(bogus, "wt") as fh:
+        fh.write("{}\n")
+    with pytest.raises(ValueError):
+        ReplayExecutor(bogus)
+
+
+
+def test_to_async_bounds_concurrency():
+    lock = threading.Lock()
+    state = {"now": 0, "peak": 0}
+
+    def slow_executor(cmd, cwd=None):
+        with lock:
+            state["now"] += 1
+            state["peak"] = max(state["peak"], state["now"])
+        time.sleep(0.02)
+        with lock:
+            state["now"] -= 1
+        return RunResult(stdout=cmd[0], stderr="", returncode=0)
+
+    aexec = to_async(slow_executor, concurrency=3)
+
+    async def _run():
+        return await asyncio.gather(*(aexec([str(i)]) for i in range(12)))
+    results = run_sync(_run())
+    assert [r.stdout for r in results] == [str(i) for i in range(12)]
+    assert 1 < state["peak"] <= 3
+
+
+def test_to_async_returns_async_executors_unchanged():
+    aexec = to_async(_counting_executor([]))
+    assert to_async(aexec) is aexec
+
+
+def test_is_idempotent_classification():
+    assert is_idempotent(["rpm", "--dbpath", "/host/var/lib/rpm", "-qf", "/etc/x"])
+    assert is_idempotent(["nsenter", "-t", "1", "-m", "--", "podman", "login", "--get-login", "r.io"])
+    assert is_idempotent(["chroot", "/host", "semanage", "port", "-l", "-C"])
+    assert not is_idempotent(["nsenter", "-t", "1", "-m", "--", "podman", "image", "exists", "img"])
+    assert not is_idempotent(["podman", "ps", "-a"])
+
+
+def test_memoizing_executor_single_flight():
+    calls: list = []
+    release = threading.Event()
+
+    def slow(cmd, cwd=None):
+        calls.append(cmd)
+        release.wait(5)
+        return RunResult(stdout="ok", stderr="", returncode=0)
+
+    memo = MemoizingExecutor(slow)
+    results: list = []
+    threads = [threading.Thread(target=lambda: results.append(memo(["rpm", "-qa"])))
+               for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert [r.stdout for r in results] == ["ok"] * 4
+    assert (memo.hits, memo.misses) == (3, 1)
+
+    memo(["podman", "ps"])
+    memo(["podman", "ps"])
+    assert calls.count(["podman", "ps"]) == 2
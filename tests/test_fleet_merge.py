@@ -154,6 +154,34 @@ class TestMergeNoneSection:
         merged = merge_snapshots([s1, s2], min_prevalence=100)
         assert merged.rpm is None
 
+    def test_skipped_section_excluded_from_totals(self):
+        from yoinkc.fleet.merge import merge_snapshots
+        s1 = _snap("web-01", rpm=RpmSection(packages_added=[
+            PackageEntry(name="httpd", version="2.4", release="1", arch="x86_64"),
+        ]))
+        s2 = _snap("web-02")
+        s2.meta["skipped_sections"] = ["rpm"]
+        merged = merge_snapshots([s1, s2], min_prevalence=100)
+        pkg = merged.rpm.packages_added[0]
+        assert (pkg.fleet.count, pkg.fleet.total) == (1, 1)
+        assert pkg.include is True
+        assert "skipped_sections" not in merged.meta
+
+    def test_section_skipped_everywhere_stays_marked(self):
+        from yoinkc.fleet.merge import merge_snapshots
+        s1, s2 = _snap("web-01"), _snap("web-02")
+        s1.meta["skipped_sections"] = ["rpm", "storage"]
+        s2.meta["skipped_sections"] = ["rpm"]
+        merged = merge_snapshots([s1, s2], min_prevalence=100)
+        assert merged.meta["skipped_sections"] == ["rpm"]
+
+    def test_section_incomplete_on_any_host_is_marked(self):
+        from yoinkc.fleet.merge import merge_snapshots
+        s1, s2 = _snap("web-01"), _snap("web-02")
+        s2.meta["incomplete_sections"] = ["non_rpm_software"]
+        merged = merge_snapshots([s1, s2], min_prevalence=100)
+        assert merged.meta["incomplete_sections"] == ["non_rpm_software"]
+
 
 from yoinkc.schema import (
     ConfigSection, ConfigFileEntry, ContainerSection,
@@ -33,8 +33,8 @@ def _fixture_executor(cmd, cwd=None):
         return RunResult(stdout="testuser\n", stderr="", returncode=0)
     if "podman" in cmd and "image" in cmd and "exists" in cmd:
         return RunResult(stdout="", stderr="", returncode=0)
-    if "podman" in cmd and "rpm" in cmd and "-qa" in cmd:
-        return RunResult(stdout=(FIXTURES / "base_image_packages.txt").read_text(), stderr="", returncode=0)
+    if "podman" in cmd and "run" in cmd and "bash" in cmd:
+        return RunResult(stdout=(FIXTURES / "base_image_bundle.txt").read_text(), stderr="", returncode=0)
     if "rpm" in cmd and "-qa" in cmd:
         return RunResult(stdout=(FIXTURES / "rpm_qa_output.txt").read_text(), stderr="", returncode=0)
     if "rpm" in cmd and "-Va" in cmd:
@@ -822,6 +822,262 @@ def test_run_all_with_fixtures(host_root, fixture_executor):
     assert snapshot.users_groups is not None
 
 
+def test_run_all_records_perf(host_root, fixture_executor):
+    """run_all stores per-inspector timings and subprocess counts in meta.perf."""
+    snapshot = run_all(host_root, executor=fixture_executor)
+    perf = snapshot.meta["perf"]
+    assert perf["total_wall_s"] >= 0
+    assert perf["inspectors"]["rpm"]["subprocesses"] > 0
+    assert "users_groups" in perf["inspectors"]
+    assert "rpm -qa" in perf["commands"]
+
+
+def test_run_all_reports_rss_delta_only_for_serial_runs(host_root, fixture_executor):
+    """Peak RSS growth is process-wide, so it is left out when inspectors run in parallel."""
+    parallel = run_all(host_root, executor=fixture_executor, jobs=4)
+    assert all("rss_delta_kb" not in e for e in parallel.meta["perf"]["inspectors"].values())
+    serial = run_all(host_root, executor=fixture_executor, jobs=1)
+    assert all("rss_delta_kb" in e for e in serial.meta["perf"]["inspectors"].values())
+
+
+def test_run_all_parallel_matches_serial(host_root, fixture_executor):
+    """Running inspectors concurrently yields the same snapshot as --jobs 1."""
+    serial = run_all(host_root, executor=fixture_executor, jobs=1)
+    parallel = run_all(host_root, executor=fixture_executor, jobs=8)
+    for snap in (serial, parallel):
+        snap.meta.pop("timestamp", None)
+        snap.meta.pop("perf", None)
+    assert parallel.model_dump() == serial.model_dump()
+
+
+def test_replayed_run_all_matches_recorded(host_root, fixture_executor, tmp_path):
+    """A full inspection replayed from a cassette reproduces the recorded snapshot."""
+    from yoinkc.executor import RecordingExecutor, ReplayExecutor
+    cassette = tmp_path / "fixture.cassette"
+    with RecordingExecutor(fixture_executor, cassette, host_root=str(host_root)) as rec:
+        recorded = run_all(host_root, executor=rec)
+    replayed = run_all(host_root, executor=ReplayExecutor(cassette))
+    for snap in (recorded, replayed):
+        snap.meta.pop("timestamp")
+        snap.meta.pop("perf")
+    assert replayed.model_dump() == recorded.model_dump()
+
+
+def test_cassette_runs_do_not_read_host_databases_in_process(host_root, fixture_executor, tmp_path, monkeypatch):
+    """Recorded and replayed runs send rpmdb queries through the executor."""
+    from yoinkc import rpmdb_sqlite
+    from yoinkc.executor import RecordingExecutor, ReplayExecutor
+    suspended = []
+    real_query = rpmdb_sqlite.query
+    monkeypatch.setattr(rpmdb_sqlite, "query", lambda root, args: (
+        suspended.append(rpmdb_sqlite.native_reads_suspended()) or real_query(root, args)))
+
+    cassette = tmp_path / "fixture.cassette"
+    with RecordingExecutor(fixture_executor, cassette, host_root=str(host_root)) as rec:
+        run_all(host_root, executor=rec, sections=["rpm"])
+    run_all(host_root, executor=ReplayExecutor(cassette), sections=["rpm"])
+    assert len(suspended) >= 2 and all(suspended)
+    run_all(host_root, executor=fixture_executor, sections=["rpm"])
+    assert not suspended[-1]
+
+
+def test_cached_run_all_skips_unchanged_sections(host_root, fixture_executor, tmp_path):
+    """A second run with --cache-dir reuses cached sections without re-classifying packages."""
+    calls = []
+
+    def counting_executor(cmd, cwd=None):
+        calls.append(cmd)
+        return fixture_executor(cmd, cwd)
+
+    first = run_all(host_root, executor=counting_executor, cache_dir=tmp_path)
+    assert any("-qR" in c for c in calls)
+    calls.clear()
+    second = run_all(host_root, executor=counting_executor, cache_dir=tmp_path)
+    assert not any("-qR" in c or "repoquery" in c for c in calls)
+    # File verification is not part of the cached rpm section: packaged
+    # files anywhere on the host may have changed.
+    assert any("-Va" in c for c in calls)
+    assert "rpm" in second.meta["cache"]["hits"]
+    assert "config" in second.meta["cache"]["hits"]
+    assert second.meta["cache"]["misses"] == []
+    for snap in (first, second):
+        for key in ("timestamp", "perf", "cache"):
+            snap.meta.pop(key)
+    assert second.model_dump() == first.model_dump()
+
+
+def test_cached_rpm_section_is_keyed_on_baseline(host_root, fixture_executor, tmp_path):
+    """A different baseline re-classifies packages instead of reusing the cached section."""
+    cache_dir = tmp_path / "cache"
+    first_file = tmp_path / "first.txt"
+    first_file.write_text("bash\ncoreutils\n")
+    second_file = tmp_path / "second.txt"
+    second_file.write_text("bash\ncoreutils\nhttpd\n")
+
+    first = run_all(host_root, executor=fixture_executor, sections=["rpm"],
+                    baseline_packages_file=first_file, cache_dir=cache_dir)
+    second = run_all(host_root, executor=fixture_executor, sections=["rpm"],
+                     baseline_packages_file=second_file, cache_dir=cache_dir)
+    assert "rpm" in second.meta["cache"]["misses"]
+    assert "httpd" in {p.name for p in first.rpm.packages_added}
+    assert "httpd" not in {p.name for p in second.rpm.packages_added}
+    again = run_all(host_root, executor=fixture_executor, sections=["rpm"],
+                    baseline_packages_file=second_file, cache_dir=cache_dir)
+    assert "rpm" in again.meta["cache"]["hits"]
+
+
+def test_run_all_only_prunes_shared_prerequisites(host_root, fixture_executor):
+    """Selecting sections skips the others and any prerequisite nobody needs."""
+    calls = []
+
+    def counting_executor(cmd, cwd=None):
+        calls.append(cmd)
+        return fixture_executor(cmd, cwd)
+
+    snap = run_all(host_root, executor=counting_executor, sections=["rpm", "services"])
+    assert snap.rpm is not None and snap.services is not None
+    assert snap.config is None and snap.selinux is None
+    assert "config" in snap.meta["skipped_sections"]
+    assert "rpm" not in snap.meta["skipped_sections"]
+    # No RPM-owned path query: config, scheduled_tasks and selinux are skipped.
+    assert not any("[%{FILENAMES}\n]" in c for c in calls)
+
+    calls.clear()
+    snap = run_all(host_root, executor=counting_executor, sections=["network"])
+    assert snap.network is not None and snap.rpm is None
+    # No baseline resolution when neither packages nor services are wanted.
+    assert not any("podman" in c for c in calls)
+
+
+def test_time_budget_returns_partial_sections(host_root, fixture_executor, tmp_path):
+    """An exhausted budget flags truncated sections instead of failing."""
+    snap = run_all(host_root, executor=fixture_executor, time_budget=1e-9, cache_dir=tmp_path)
+    assert snap.config is not None
+    assert "config" in snap.meta["incomplete_sections"]
+    assert any(w["source"] == "config" and "--time-budget" in w["message"]
+               for w in snap.warnings)
+    # Partial results are never cached.
+    assert not list(tmp_path.glob("*.json.gz"))
+
+
+def test_spent_time_budget_does_not_fail_fast_on_base_image_query(host_root, fixture_executor):
+    """A base image query cut short by the budget yields a partial rpm section, not SystemExit."""
+    from yoinkc import deadline
+
+    def executor(cmd, cwd=None):
+        # Like subprocess_executor: once the budget is spent, the container
+        # run gets the minimum timeout, which is too short for it to finish.
+        if "podman" in cmd and "run" in cmd and deadline.command_timeout(300) < 300:
+            return RunResult(stdout="", stderr="Command timed out after 1.0s", returncode=-1)
+        return fixture_executor(cmd, cwd=cwd)
+
+    snap = run_all(host_root, executor=executor, time_budget=1e-9)
+    assert snap.rpm is not None and snap.rpm.no_baseline
+    assert "rpm" in snap.meta["incomplete_sections"]
+    assert any(w["source"] == "rpm" and "--time-budget" in w["message"] for w in snap.warnings)
+
+
+def test_run_all_emits_progress_events(host_root, fixture_executor):
+    import io
+    import json
+    from yoinkc import progress
+    sink = io.StringIO()
+    sink.close = lambda: None
+    stream = progress.ProgressStream(sink)
+    with stream.activate():
+        run_all(host_root, executor=fixture_executor, sections=["rpm"])
+    stream.close()
+    events = [json.loads(line) for line in sink.getvalue().splitlines()]
+    assert events[0]["event"] == "run_start" and events[-1]["event"] == "run_finish"
+    finish = [e for e in events if e["event"] == "inspector_finish"]
+    assert any(e["inspector"] == "rpm" and e["ok"] for e in finish)
+    assert any(e["event"] == "command" and e["inspector"] == "rpm" and e["command"] == "rpm -Va"
+               for e in events)
+
+
+def test_prune_tasks_keeps_dependencies():
+    from yoinkc.inspectors._scheduler import InspectorTask, prune_tasks
+    noop = lambda r, tw: None
+    tasks = [
+        InspectorTask("a", noop),
+        InspectorTask("b", noop, deps=("a",)),
+        InspectorTask("c", noop),
+    ]
+    assert [t.name for t in prune_tasks(tasks, ["b"])] == ["a", "b"]
+    with pytest.raises(ValueError):
+        prune_tasks(tasks, ["nope"])
+
+
+def test_scheduler_respects_dependencies_and_warning_order():
+    """Tasks start only after their deps finish; warnings merge in declaration order."""
+    import threading
+    from yoinkc.inspectors._scheduler import InspectorTask, run_tasks
+
+    release = threading.Event()
+
+    def slow(results, tw):
+        release.wait(5)
+        tw.append({"source": "slow"})
+        return "slow"
+
+    def fast(results, tw):
+        tw.append({"source": "fast"})
+        release.set()
+        return "fast"
+
+    def dependent(results, tw):
+        tw.append({"source": "dependent"})
+        return results["slow"] + "+dep"
+
+    warnings: list = []
+    results = run_tasks([
+        InspectorTask("slow", slow),
+        InspectorTask("fast", fast),
+        InspectorTask("dependent", dependent, deps=("slow",)),
+    ], warnings, jobs=4)
+    assert results == {"slow": "slow", "fast": "fast", "dependent": "slow+dep"}
+    assert [w["source"] for w in warnings] == ["slow", "fast", "dependent"]
+
+
+def test_scheduler_fail_fast_does_not_wait_for_running_siblings():
+    import threading
+    import time
+    from yoinkc.inspectors._scheduler import InspectorTask, run_tasks
+    release = threading.Event()
+    started = []
+
+    def slow(results, tw):
+        release.wait(10)
+
+    def failing(results, tw):
+        raise SystemExit(1)
+
+    def later(results, tw):
+        started.append("later")
+
+    t0 = time.monotonic()
+    try:
+        with pytest.raises(SystemExit):
+            run_tasks([
+                InspectorTask("slow", slow),
+                InspectorTask("failing", failing),
+                InspectorTask("later", later, deps=("failing",)),
+            ], [], jobs=4)
+        assert time.monotonic() - t0 < 5
+        assert started == []
+    finally:
+        release.set()
+
+
+def test_scheduler_rejects_forward_dependency():
+    from yoinkc.inspectors._scheduler import InspectorTask, run_tasks
+    with pytest.raises(ValueError):
+        run_tasks([
+            InspectorTask("a", lambda r, tw: None, deps=("b",)),
+            InspectorTask("b", lambda r, tw: None),
+        ], [])
+
+
 def _no_baseline_executor(cmd, cwd=None):
     """Executor where podman always fails but rpm/systemctl work."""
     if "podman" in cmd:
@@ -878,6 +1134,78 @@ def test_run_all_no_baseline_warning(host_root):
     assert any("--no-baseline" in w.get("message", "") for w in rpm_warnings)
 
 
+def test_base_image_query_overlaps_host_inspection(host_root, fixture_executor):
+    """The image query runs in the background while rpm verifies files."""
+    import threading
+    verified = threading.Event()
+
+    def executor(cmd, cwd=None):
+        if "-Va" in cmd:
+            verified.set()
+        if "podman" in cmd and "run" in cmd:
+            # Only answers once host inspection is under way.
+            if not verified.wait(10):
+                return RunResult(stdout="", stderr="timed out", returncode=1)
+        return fixture_executor(cmd, cwd=cwd)
+
+    snapshot = run_all(host_root, executor=executor)
+    assert snapshot.rpm.no_baseline is False
+    assert "bash" not in [p.name for p in snapshot.rpm.packages_added]
+
+
+def test_missing_registry_auth_fails_before_inspection(host_root, capsys):
+    """The auth check stays synchronous, so no host inspection work starts."""
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return _no_baseline_executor(cmd, cwd=cwd)
+
+    with pytest.raises(SystemExit):
+        run_all(host_root, executor=executor)
+    assert not any("-Va" in c or "-qa" in c for c in calls)
+    assert "sudo podman login registry.redhat.io" in capsys.readouterr().err
+
+
+def test_background_query_failure_still_fails_fast(host_root, fixture_executor, capsys):
+    def executor(cmd, cwd=None):
+        if "podman" in cmd and "run" in cmd:
+            return RunResult(stdout="", stderr="no space left on device", returncode=125)
+        return fixture_executor(cmd, cwd=cwd)
+
+    with pytest.raises(SystemExit):
+        run_all(host_root, executor=executor)
+    assert "Could not query the base image package list" in capsys.readouterr().err
+
+
+def test_background_query_exception_becomes_no_baseline(host_root, fixture_executor, monkeypatch):
+    """An error in the background query is settled once, as a warning."""
+    from yoinkc.baseline import BaselineResolver
+
+    def boom(self, *args, **kwargs):
+        raise RuntimeError("podman exploded")
+
+    monkeypatch.setattr(BaselineResolver, "resolve", boom)
+    snapshot = run_all(host_root, executor=fixture_executor, no_baseline_opt_in=True)
+    assert snapshot.rpm.no_baseline is True
+    messages = [w["message"] for w in snapshot.warnings]
+    assert "Base image query failed: podman exploded" in messages
+    assert any("Running without baseline" in m for m in messages)
+
+
+def test_kernel_boot_alone_does_not_query_base_image(host_root):
+    """kernel_boot uses the host's sysctl defaults and never fails fast."""
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return _no_baseline_executor(cmd, cwd=cwd)
+
+    snapshot = run_all(host_root, executor=executor, sections=["kernel_boot"])
+    assert "vm.swappiness" in {s.key for s in snapshot.kernel_boot.sysctl_overrides}
+    assert not any("podman" in c or "nsenter" in c for c in calls)
+
+
 def test_cross_major_warning_in_snapshot(host_root, fixture_executor):
     """Cross-major-version warning appears in snapshot.warnings."""
     snapshot = run_all(
@@ -1012,6 +1340,26 @@ def test_classify_leaf_auto_falls_back_when_dnf_repoquery_fails(host_root):
     assert dep_tree["httpd"] == ["mod_ssl"]
 
 
+def test_classify_deps_keeps_providers_from_partly_failed_batch(host_root):
+    """One capability without a provider does not drop the rest of its batch."""
+    from yoinkc.inspectors.rpm import _classify_deps_via_rpm
+
+    def executor(cmd, cwd=None):
+        if "-qR" in cmd and "httpd" in cmd:
+            return RunResult(stdout="mod_ssl\nhttpd-core\nlibmissing.so.1()(64bit)\n", stderr="", returncode=0)
+        if "-qR" in cmd:
+            return RunResult(stdout="", stderr="", returncode=0)
+        if "--whatprovides" in cmd:
+            return RunResult(stdout="httpd-core-2.4.62-1.el9.x86_64\n"
+                                    "no package provides libmissing.so.1()(64bit)\n"
+                                    "mod_ssl-1:2.4.62-1.el9.x86_64\n",
+                             stderr="", returncode=1)
+        return RunResult(stdout="", stderr="", returncode=1)
+
+    deps = _classify_deps_via_rpm(executor, host_root, {"httpd", "httpd-core", "mod_ssl"})
+    assert deps["httpd"] == {"httpd-core", "mod_ssl"}
+
+
 def test_classify_leaf_auto_uses_userinstalled(host_root):
     """When dnf repoquery --userinstalled succeeds, it determines the leaf set."""
     from yoinkc.inspectors.rpm import _classify_leaf_auto
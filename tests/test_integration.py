@@ -39,8 +39,8 @@ def _fixture_executor(cmd, cwd=None):
         return RunResult(stdout="testuser\n", stderr="", returncode=0)
     if "podman" in cmd and "image" in cmd and "exists" in cmd:
         return RunResult(stdout="", stderr="", returncode=0)
-    if "podman" in cmd and "rpm" in cmd and "-qa" in cmd:
-        return RunResult(stdout=(FIXTURES / "base_image_packages.txt").read_text(), stderr="", returncode=0)
+    if "podman" in cmd and "run" in cmd and "bash" in cmd:
+        return RunResult(stdout=(FIXTURES / "base_image_bundle.txt").read_text(), stderr="", returncode=0)
     if "rpm" in cmd and "-qa" in cmd:
         return RunResult(stdout=(FIXTURES / "rpm_qa_output.txt").read_text(), stderr="", returncode=0)
     if "rpm" in cmd and "-Va" in cmd:
@@ -0,0 +1,73 @@
+"""Tests for perf telemetry collection (yoinkc.perf)."""
+
+from yoinkc import perf
+from yoinkc.executor import RunResult
+
+
+def _echo_executor(cmd, cwd=None):
+    return RunResult(stdout="x" * 10, stderr="", returncode=0)
+
+
+def test_command_label_strips_wrappers():
+    assert perf.command_label(["rpm", "--dbpath", "/host/var/lib/rpm", "-qa"]) == "rpm -qa"
+    assert perf.command_label(
+        ["nsenter", "-t", "1", "-m", "-u", "-i", "-n", "--", "podman", "image", "exists", "img"]
+    ) == "podman image"
+    assert perf.command_label(["chroot", "/host", "semanage", "boolean", "-l"]) == "semanage boolean"
+    assert perf.command_label(["lsmod"]) == "lsmod"
+
+
+def test_measure_attributes_subprocesses_to_scope():
+    recorder = perf.PerfRecorder()
+    executor = perf.instrument(_echo_executor, recorder)
+    with recorder.activate():
+        with perf.measure("inspectors", "rpm"):
+            executor(["rpm", "-qa"])
+            executor(["rpm", "-Va"])
+        executor(["lsmod"])
+    data = recorder.to_dict()
+    entry = data["inspectors"]["rpm"]
+    assert entry["subprocesses"] == 2
+    assert entry["stdout_bytes"] == 20
+    assert entry["wall_s"] >= 0
+    assert set(data["commands"]) == {"rpm -qa", "rpm -Va", "lsmod"}
+
+
+def test_measure_is_noop_without_active_recorder():
+    with perf.measure("inspectors", "rpm"):
+        pass
+
+
+def test_merge_into_preserves_other_groups():
+    meta = {"perf": {"inspectors": {"rpm": {"wall_s": 1.0}}, "total_wall_s": 2.0}}
+    recorder = perf.PerfRecorder()
+    with recorder.measure("renderers", "containerfile"):
+        pass
+    perf.merge_into(meta, recorder)
+    assert meta["perf"]["inspectors"]["rpm"]["wall_s"] == 1.0
+    assert meta["perf"]["total_wall_s"] == 2.0
+    assert "containerfile" in meta["perf"]["renderers"]
+
+
+def test_active_recorder_reaches_scheduler_threads():
+    from yoinkc.inspectors._scheduler import InspectorTask, run_tasks
+
+    def _work(results, warnings):
+        with perf.measure("inspectors", "worker"):
+            pass
+
+    recorder = perf.PerfRecorder()
+    with recorder.activate():
+        run_tasks([InspectorTask("a", _work), InspectorTask("b", _work)], [], jobs=2)
+    assert "worker" in recorder.to_dict()["inspectors"]
+
+
+def test_rss_delta_omitted_when_not_tracked():
+    serial = perf.PerfRecorder()
+    with serial.measure("inspectors", "rpm"):
+        pass
+    assert "rss_delta_kb" in serial.to_dict()["inspectors"]["rpm"]
+    parallel = perf.PerfRecorder(track_rss=False)
+    with parallel.measure("inspectors", "rpm"):
+        pass
+    assert "rss_delta_kb" not in parallel.to_dict()["inspectors"]["rpm"]
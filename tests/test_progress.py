@@ -0,0 +1,75 @@
+"""Tests for the JSONL progress event stream (yoinkc.progress)."""
+
+import io
+import json
+import threading
+
+from yoinkc import progress
+from yoinkc.executor import RunResult
+
+
+class _Sink(io.StringIO):
+    """StringIO that keeps its contents after close()."""
+
+    def close(self):
+        self.final = self.getvalue()
+        super().close()
+
+
+def _events(sink):
+    return [json.loads(line) for line in sink.final.splitlines()]
+
+
+def test_events_written_in_order_with_timestamps():
+    sink = _Sink()
+    stream = progress.ProgressStream(sink)
+    with stream.activate():
+        with progress.task("rpm", step=1, total=2):
+            progress.emit("custom", value=1)
+    stream.close()
+    events = _events(sink)
+    assert [e["event"] for e in events] == ["inspector_start", "custom", "inspector_finish"]
+    assert events[0]["step"] == 1 and events[2]["ok"] is True
+    assert all("ts" in e and "elapsed_s" in e for e in events)
+
+
+def test_helpers_are_noops_without_stream():
+    progress.emit("ignored")
+    progress.Counter("x", 3).advance()
+    run = progress.instrument(lambda cmd, cwd=None: RunResult("", "", 0))
+    assert run(["true"]).returncode == 0
+
+
+def test_blocked_reader_drops_instead_of_blocking():
+    release = threading.Event()
+
+    class _Blocked(_Sink):
+        def write(self, s):
+            release.wait()
+            return super().write(s)
+
+    sink = _Blocked()
+    stream = progress.ProgressStream(sink, queue_size=2)
+    for i in range(10):
+        stream.emit("tick", i=i)  # must return immediately
+    release.set()
+    stream.close()
+    events = _events(sink)
+    dropped = [e for e in events if e["event"] == "dropped"]
+    ticks = [e for e in events if e["event"] == "tick"]
+    assert dropped and sum(e["count"] for e in dropped) + len(ticks) == 10
+
+
+def test_counter_reports_final_batch():
+    sink = _Sink()
+    stream = progress.ProgressStream(sink)
+    counter = progress.Counter("dnf repoquery", 100)
+    with stream.activate(), progress.task("rpm"):
+        for _ in range(100):
+            counter.advance()
+    stream.close()
+    batches = [e for e in _events(sink) if e["event"] == "batch"]
+    # Throttled: the first and the final count, not one per item.
+    assert 1 <= len(batches) < 100
+    assert batches[-1] == {**batches[-1], "inspector": "rpm", "done": 100, "total": 100}
+
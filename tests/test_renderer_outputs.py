@@ -76,7 +76,7 @@ def _make_executor(pkg_list: Optional[str] = None):
 
 
 def _build_snapshot(with_baseline: bool):
-    pkg_list = (FIXTURES / "base_image_packages.txt").read_text() if with_baseline else None
+    pkg_list = (FIXTURES / "base_image_bundle.txt").read_text() if with_baseline else None
     with patch.object(preflight_mod, "in_user_namespace", return_value=False):
         snapshot = run_all_inspectors(
             FIXTURES / "host_etc",
@@ -246,6 +246,10 @@ class TestHtmlReport:
         assert "containerfile-pre" in html
         assert "FROM " in html
 
+    def test_performance_block_present(self, outputs_with_baseline):
+        html = self._html(outputs_with_baseline)
+        assert "<summary>Performance</summary>" in html
+
     def test_reset_button_present(self, outputs_with_baseline):
         """Reset button should be in the toolbar, disabled by default."""
         html = self._html(outputs_with_baseline)
@@ -288,6 +292,61 @@ class TestAuditReport:
         if snapshot.storage and snapshot.storage.fstab_entries:
             assert "Storage" in md or "fstab" in md.lower() or "Migration" in md
 
+    def test_performance_table(self, outputs_with_baseline):
+        md = self._md(outputs_with_baseline)
+        assert "## Performance" in md
+        assert "| rpm |" in md
+        assert "containerfile" in outputs_with_baseline["snapshot"].meta["perf"]["renderers"]
+
+    def test_skipped_sections_marked(self):
+        from yoinkc.schema import InspectionSnapshot, OsRelease
+        snapshot = InspectionSnapshot(
+            meta={"host_root": "/host", "skipped_sections": ["config", "storage"]},
+            os_release=OsRelease(name="RHEL", version_id="9.6", pretty_name="RHEL 9.6"),
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            render_containerfile(snapshot, Environment(), Path(tmp))
+            render_audit_report(snapshot, Environment(), Path(tmp))
+            cf = (Path(tmp) / "Containerfile").read_text()
+            md = (Path(tmp) / "audit-report.md").read_text()
+        assert "Not inspected (--only/--skip): config, storage" in cf
+        assert "**Partial inspection:**" in md and "`storage`" in md
+
+    def test_incomplete_sections_get_fixme(self):
+        from yoinkc.schema import InspectionSnapshot, OsRelease
+        snapshot = InspectionSnapshot(
+            meta={"host_root": "/host", "incomplete_sections": ["non_rpm_software"]},
+            os_release=OsRelease(name="RHEL", version_id="9.6", pretty_name="RHEL 9.6"),
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            render_containerfile(snapshot, Environment(), Path(tmp))
+            render_audit_report(snapshot, Environment(), Path(tmp))
+            cf = (Path(tmp) / "Containerfile").read_text()
+            md = (Path(tmp) / "audit-report.md").read_text()
+        assert "# FIXME: non_rpm_software inspection hit --time-budget" in cf
+        assert "**Incomplete inspection:**" in md and "`non_rpm_software`" in md
+
+    def test_dependencies_name_what_pulls_them_in(self):
+        from yoinkc.schema import InspectionSnapshot, OsRelease, PackageEntry, RpmSection
+        snapshot = InspectionSnapshot(
+            meta={"host_root": "/host"},
+            os_release=OsRelease(name="RHEL", version_id="9.6", pretty_name="RHEL 9.6"),
+            rpm=RpmSection(
+                packages_added=[
+                    PackageEntry(name=n, version="1", release="1", arch="x86_64")
+                    for n in ("httpd", "mod_ssl", "apr", "openssl-libs")
+                ],
+                leaf_packages=["httpd", "mod_ssl"],
+                auto_packages=["apr", "openssl-libs"],
+                leaf_dep_tree={"httpd": ["apr"], "mod_ssl": ["apr", "openssl-libs"]},
+            ),
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            render_audit_report(snapshot, Environment(), Path(tmp))
+            md = (Path(tmp) / "audit-report.md").read_text()
+        assert "- apr 1-1.x86_64 — pulled in by httpd, mod_ssl" in md
+        assert "- openssl-libs 1-1.x86_64 — pulled in by mod_ssl" in md
+
     def test_no_baseline_warning(self, outputs_no_baseline):
         md = self._md(outputs_no_baseline)
         assert "baseline" in md.lower() or "No baseline" in md
@@ -0,0 +1,247 @@
+"""Tests for the shared RPM database index (yoinkc.rpmdb)."""
+
+import threading
+from pathlib import Path
+
+from yoinkc.bench import HostShape, build_host
+from yoinkc.executor import RunResult
+from yoinkc.inspectors import run_all
+from yoinkc.inspectors.config import _rpm_owned_paths
+from yoinkc.inspectors.rpm import (
+    _classify_deps_via_rpm, _classify_deps_via_rpmdb, _classify_leaf_auto, run as run_rpm,
+)
+from yoinkc.inspectors.service import _resolve_owning_packages
+from yoinkc.rpmdb import DEPS_QUERYFORMAT, QUERYFORMAT, RpmDatabase, SharedRpmDatabase
+from yoinkc.schema import PackageEntry, ServiceSection, ServiceStateChange
+
+
+_OUTPUT = "\n".join([
+    "P\t(none)\tbash\t5.2.15\t2.el9\tx86_64\t8",
+    "F\t0\t-1\t0\t1389064\t33261\t1700000000\tabc123\troot\troot\t\t/usr/bin/bash",
+    "F\t0\t-1\t0\t0\t41471\t1700000000\t\troot\troot\tbash\t/usr/bin/sh",
+    "F\t17\t-1\t0\t18\t33188\t1700000000\tdef456\troot\troot\t\t/etc/skel/.bashrc",
+    "R\tlibc.so.6()(64bit)",
+    "R\trpmlib(CompressedFileNames)",
+    "V\tbash",
+    "V\t/bin/sh",
+    "P\t1\tglibc\t2.34\t100.el9\tx86_64\t8",
+    "F\t0\t-1\t0\t2300000\t33261\t1700000000\tfff000\troot\troot\t\t/usr/lib64/libc.so.6",
+    "F\t0\t-1\t0\t0\t16877\t1700000000\t\troot\troot\t\t/etc/ld.so.conf.d",
+    "F\t81\t-1\t0\t28\t33188\t1700000000\t123abc\troot\troot\t\t/etc/ld.so.conf",
+    "V\tlibc.so.6()(64bit)",
+    "V\tglibc",
+    "P\t(none)\tfilesystem\t3.16\t2.el9\tx86_64\t(none)",
+    "F\t0\t-1\t0\t0\t16877\t1700000000\t\troot\troot\t\t/etc",
+    "F\t0\t-1\t0\t0\t16877\t1700000000\t\troot\troot\t\t/etc/ld.so.conf.d",
+    "P\t(none)\tgpg-pubkey\tfd431d51\t4ae0493b\t(none)\t(none)",
+]) + "\n"
+
+
+def test_parse_packages_and_files():
+    db = RpmDatabase.parse(_OUTPUT)
+    assert [p.nevra for p in db.packages] == [
+        "0:bash-5.2.15-2.el9.x86_64",
+        "1:glibc-2.34-100.el9.x86_64",
+        "0:filesystem-3.16-2.el9.x86_64",
+        "0:gpg-pubkey-fd431d51-4ae0493b.(none)",
+    ]
+    assert db.package("bash").digest_algo == 8
+    info = db.file("/usr/bin/sh")
+    assert info.package.name == "bash" and info.linkto == "bash" and info.mode == 0o120777
+    assert db.file("/usr/bin/bash").digest == "abc123"
+    assert db.file("/nope") is None
+
+
+def test_owner_and_files_of():
+    db = RpmDatabase.parse(_OUTPUT)
+    assert db.owner("/usr/lib64/libc.so.6") == "glibc"
+    assert db.owner("/etc/passwd") is None
+    assert db.owners("/etc/ld.so.conf.d") == ["glibc", "filesystem"]
+    assert db.files_of("bash") == ["/usr/bin/bash", "/usr/bin/sh", "/etc/skel/.bashrc"]
+    assert db.files_of("missing") == []
+
+
+def test_is_config():
+    db = RpmDatabase.parse(_OUTPUT)
+    assert db.is_config("/etc/skel/.bashrc")
+    assert db.is_config("/etc/ld.so.conf")
+    assert not db.is_config("/usr/bin/bash")
+    assert not db.is_config("/etc/unowned")
+
+
+def test_who_provides_capabilities_and_paths():
+    db = RpmDatabase.parse(_OUTPUT)
+    assert db.who_provides("libc.so.6()(64bit)") == ["glibc"]
+    assert db.who_provides("/bin/sh") == ["bash"]
+    assert db.who_provides("/usr/lib64/libc.so.6") == ["glibc"]
+    assert db.who_provides("perl") == []
+
+
+def test_owned_paths_prefix():
+    db = RpmDatabase.parse(_OUTPUT)
+    assert db.owned_paths("/etc") == [
+        "/etc", "/etc/ld.so.conf", "/etc/ld.so.conf.d", "/etc/skel/.bashrc",
+    ]
+    assert db.owned_paths("/usr/lib64/") == ["/usr/lib64/libc.so.6"]
+    assert len(db.owned_paths()) == 7
+
+
+def test_query_uses_one_rpm_call_and_returns_none_on_failure(tmp_path):
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return RunResult(stdout=_OUTPUT, stderr="", returncode=0)
+
+    db = RpmDatabase.query(executor, tmp_path)
+    assert len(db) == 4
+    assert len(calls) == 1 and calls[0][-1] == QUERYFORMAT and "-qa" in calls[0]
+
+    def failing(cmd, cwd=None):
+        return RunResult(stdout="", stderr="error", returncode=1)
+
+    assert RpmDatabase.query(failing, tmp_path) is None
+
+    def old_format(cmd, cwd=None):
+        return RunResult(stdout="0:bash-5.2.15-2.el9.x86_64\n", stderr="", returncode=0)
+
+    assert RpmDatabase.query(old_format, tmp_path) is None
+
+
+def test_shared_database_loads_once(tmp_path):
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return RunResult(stdout=_OUTPUT, stderr="", returncode=0)
+
+    shared = SharedRpmDatabase(executor, tmp_path)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(shared.get())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+    assert SharedRpmDatabase(None, tmp_path).get() is None
+
+
+def test_inspectors_answer_from_index(tmp_path):
+    db = RpmDatabase.parse(_OUTPUT)
+
+    def no_lookups(cmd, cwd=None):
+        assert not {"-qa", "-qf", "-qR", "--whatprovides"} & set(cmd), cmd
+        return RunResult(stdout="", stderr="", returncode=1)
+
+    (tmp_path / "etc").mkdir()
+    section = run_rpm(tmp_path, no_lookups, rpmdb=db)
+    assert sorted(p.name for p in section.packages_added) == ["bash", "filesystem", "glibc"]
+    assert _rpm_owned_paths(no_lookups, tmp_path, rpmdb=db) == set(db.owned_paths("/etc"))
+    assert _classify_deps_via_rpmdb(db, {"bash", "glibc"}) == {"bash": {"glibc"}, "glibc": set()}
+
+    services = ServiceSection(state_changes=[
+        ServiceStateChange(unit="sshd.service", current_state="enabled",
+                           default_state="disabled", action="enable"),
+    ])
+    db2 = RpmDatabase.parse(
+        "P\t(none)\topenssh-server\t8.7p1\t38.el9\tx86_64\t8\n"
+        "F\t0\t-1\t0\t0\t33188\t1700000000\tab\troot\troot\t\t/usr/lib/systemd/system/sshd.service\n")
+    _resolve_owning_packages(no_lookups, tmp_path, services, rpmdb=db2)
+    assert services.state_changes[0].owning_package == "openssh-server"
+
+
+def test_run_all_shares_one_bulk_query(tmp_path):
+    shape = HostShape(
+        packages=30, deps_per_package=2, modified_configs=4, unowned_files=3,
+        opt_apps=1, opt_depth=1, binaries_per_app=1, usr_local_binaries=1,
+        venvs=0, venv_packages=0, lockfiles=0, cron_jobs=1, systemd_units=3,
+    )
+    host = build_host(Path(tmp_path), shape)
+    inner = host.executor()
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return inner(cmd, cwd=cwd)
+
+    snap = run_all(host.root, executor=executor, baseline_packages_file=host.baseline_file)
+    rpm_queries = [c for c in calls if "rpm" in c and "-Va" not in c]
+    assert sum(1 for c in rpm_queries if QUERYFORMAT in c) == 1
+    assert not any("-qf" in c or "[%{FILENAMES}\n]" in c for c in rpm_queries)
+    assert len(snap.rpm.packages_added) == shape.packages - int(shape.packages * shape.base_fraction)
+
+
+def test_rich_dependencies_resolve_against_installed():
+    db = RpmDatabase.parse(
+        "P\t(none)\ta\t1\t1\tx86_64\t8\nV\ta\n"
+        "P\t(none)\tb\t1\t1\tx86_64\t8\nV\tb\n"
+        "P\t(none)\tc\t1\t1\tx86_64\t8\nV\tc\n")
+    assert db.resolve("a >= 1.0") == ["a"]
+    assert db.resolve("(a or missing)") == ["a"]
+    assert db.resolve("(a and (b or c))") == ["a", "b", "c"]
+    assert db.resolve("(a if b else c)") == ["a"]
+    assert db.resolve("(a if missing else c)") == ["c"]
+    assert db.resolve("(a unless b)") == []
+    assert db.resolve("(a without b)") == ["a"]
+    assert db.resolve("(a or b and c)") == []
+
+
+def test_transitive_closure_walks_through_baseline_packages():
+    # app -> base-lib (not added) -> helper; tool recommends extra;
+    # plugin is only reachable through a rich dependency.
+    db = RpmDatabase.parse(
+        "P\t(none)\tapp\t1\t1\tx86_64\t8\nR\tbase-lib\nR\t(plugin if app)\nV\tapp\n"
+        "P\t(none)\tbase-lib\t1\t1\tx86_64\t8\nR\t/usr/bin/helper\nV\tbase-lib\n"
+        "P\t(none)\thelper\t1\t1\tx86_64\t8\nV\thelper\n"
+        "F\t0\t-1\t0\t1\t33261\t1700000000\tab\troot\troot\t\t/usr/bin/helper\n"
+        "P\t(none)\tplugin\t1\t1\tx86_64\t8\nR\tapp\nV\tplugin\n"
+        "P\t(none)\ttool\t1\t1\tx86_64\t8\nW\textra\nV\ttool\n"
+        "P\t(none)\textra\t1\t1\tx86_64\t8\nV\textra\n")
+    added = {"app", "helper", "plugin", "tool", "extra"}
+    assert _classify_deps_via_rpmdb(db, added) == {
+        "app": {"helper", "plugin"}, "helper": set(), "plugin": {"app", "helper"},
+        "tool": {"extra"}, "extra": set(),
+    }
+
+
+def test_leaf_auto_skips_dnf_with_index(tmp_path):
+    db = RpmDatabase.parse(_OUTPUT)
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return RunResult(stdout="", stderr="", returncode=1)
+
+    packages = [PackageEntry(name=n, epoch="0", version="1", release="1", arch="x86_64")
+                for n in ("bash", "glibc")]
+    leaf, auto, tree = _classify_leaf_auto(executor, tmp_path, packages, rpmdb=db)
+    assert (leaf, auto, tree) == (["bash"], ["glibc"], {"bash": ["glibc"]})
+    assert not any("--requires" in c for c in calls)
+
+
+def test_rpm_fallback_uses_one_capability_query(tmp_path):
+    shape = HostShape(
+        packages=40, deps_per_package=3, modified_configs=0, unowned_files=0,
+        opt_apps=0, opt_depth=1, binaries_per_app=0, usr_local_binaries=0,
+        venvs=0, venv_packages=0, lockfiles=0, cron_jobs=0, systemd_units=0,
+    )
+    host = build_host(Path(tmp_path), shape)
+    inner = host.executor()
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return inner(cmd, cwd=cwd)
+
+    added = {p.name for p in RpmDatabase.query(inner, host.root).packages[10:]}
+    depends_on = _classify_deps_via_rpm(executor, host.root, added)
+    assert [c for c in calls if DEPS_QUERYFORMAT in c] == calls and len(calls) == 1
+    assert any(depends_on.values())
+
+    def no_bulk(cmd, cwd=None):
+        if "--queryformat" in cmd:
+            return RunResult(stdout="", stderr="", returncode=1)
+        return inner(cmd, cwd=cwd)
+
+    assert _classify_deps_via_rpm(no_bulk, host.root, added) == depends_on
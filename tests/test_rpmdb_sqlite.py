@@ -0,0 +1,180 @@
+"""Tests for the in-process sqlite rpmdb reader (yoinkc.rpmdb_sqlite)."""
+
+import sqlite3
+import struct
+
+import pytest
+
+from yoinkc import rpmdb_sqlite
+from yoinkc._util import run_rpm_query
+from yoinkc.executor import RunResult
+from yoinkc.rpmdb import (
+    QUERYFORMAT, RPMVERIFY_ALL, RPMVERIFY_FILEDIGEST, RPMVERIFY_FILESIZE, RPMVERIFY_MTIME, RpmDatabase,
+)
+
+
+_INT16, _INT32, _STRING, _BIN, _STRING_ARRAY = 3, 4, 6, 7, 8
+
+
+def _header(entries):
+    """Encode {tag: (type, value)} as an rpmdb header blob."""
+    index, data = [], b""
+    for tag, (typ, value) in sorted(entries.items()):
+        if typ in (_INT16, _INT32):
+            fmt = "H" if typ == _INT16 else "I"
+            pad = (-len(data)) % struct.calcsize(fmt)
+            data += b"\0" * pad
+            offset, count = len(data), len(value)
+            data += struct.pack(f">{count}{fmt}", *value)
+        elif typ == _BIN:
+            offset, count = len(data), len(value)
+            data += value
+        elif typ == _STRING:
+            offset, count = len(data), 1
+            data += value.encode() + b"\0"
+        else:
+            offset, count = len(data), len(value)
+            data += b"".join(v.encode() + b"\0" for v in value)
+        index.append(struct.pack(">IIiI", tag, typ, offset, count))
+    return struct.pack(">II", len(index), len(data)) + b"".join(index) + data
+
+
+def _package(name, version, release, epoch=None, files=(), requires=(), provides=()):
+    t = rpmdb_sqlite.TAGS
+    entries = {
+        t["NAME"]: (_STRING, name),
+        t["VERSION"]: (_STRING, version),
+        t["RELEASE"]: (_STRING, release),
+        t["ARCH"]: (_STRING, "x86_64"),
+        t["SHA1HEADER"]: (_STRING, f"{name}-sha1"),
+    }
+    if epoch is not None:
+        entries[t["EPOCH"]] = (_INT32, [epoch])
+    if files:
+        dirs = sorted({f.rsplit("/", 1)[0] + "/" for f, *_ in files})
+        entries[t["DIRNAMES"]] = (_STRING_ARRAY, dirs)
+        entries[t["BASENAMES"]] = (_STRING_ARRAY, [f.rsplit("/", 1)[1] for f, *_ in files])
+        entries[t["DIRINDEXES"]] = (_INT32, [dirs.index(f.rsplit("/", 1)[0] + "/") for f, *_ in files])
+        entries[t["FILEFLAGS"]] = (_INT32, [flags for _, flags, _ in files])
+        # Config files get %verify(not md5 size mtime), like setup's /etc/passwd.
+        entries[t["FILEVERIFYFLAGS"]] = (_INT32, [0xFFFFFFDC if flags & 1 else 0xFFFFFFFF for _, flags, _ in files])
+        entries[t["FILEMODES"]] = (_INT16, [mode for _, _, mode in files])
+        entries[t["FILESIZES"]] = (_INT32, [10] * len(files))
+        entries[t["FILEMTIMES"]] = (_INT32, [1700000000] * len(files))
+        entries[t["FILEDIGESTS"]] = (_STRING_ARRAY, ["" if mode & 0o40000 else "ab12" for _, _, mode in files])
+        entries[t["FILEUSERNAME"]] = (_STRING_ARRAY, ["root"] * len(files))
+        entries[t["FILEGROUPNAME"]] = (_STRING_ARRAY, ["root"] * len(files))
+        entries[t["FILELINKTOS"]] = (_STRING_ARRAY, [""] * len(files))
+        entries[t["FILEDIGESTALGO"]] = (_INT32, [8])
+    if requires:
+        entries[t["REQUIRENAME"]] = (_STRING_ARRAY, list(requires))
+    if provides:
+        entries[t["PROVIDENAME"]] = (_STRING_ARRAY, list(provides))
+    return _header(entries)
+
+
+def _make_db(host_root, blobs, rel="var/lib/rpm/rpmdb.sqlite"):
+    path = host_root / rel
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE Packages (hnum INTEGER PRIMARY KEY AUTOINCREMENT, blob BLOB NOT NULL)")
+    conn.executemany("INSERT INTO Packages (blob) VALUES (?)", [(b,) for b in blobs])
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def host(tmp_path):
+    _make_db(tmp_path, [
+        _package("bash", "5.2.15", "2.el9",
+                 files=[("/usr/bin/bash", 0, 0o100755), ("/etc/skel/.bashrc", 17, 0o100644)],
+                 requires=["glibc", "rpmlib(CompressedFileNames)"], provides=["bash", "/bin/sh"]),
+        _package("glibc", "2.34", "100.el9", epoch=1,
+                 files=[("/etc/ld.so.conf.d", 0, 0o40755), ("/usr/lib64/libc.so.6", 0, 0o100755)],
+                 provides=["glibc"]),
+    ])
+    return tmp_path
+
+
+def _no_rpm(cmd, cwd=None):
+    raise AssertionError(f"unexpected command: {cmd}")
+
+
+def test_qa_default_format(host):
+    result = run_rpm_query(_no_rpm, host, ["-qa"])
+    assert result.returncode == 0
+    assert result.stdout == "bash-5.2.15-2.el9.x86_64\nglibc-2.34-100.el9.x86_64\n"
+
+
+def test_qa_queryformat_scalars_and_arrays(host):
+    nevra = run_rpm_query(_no_rpm, host, ["-qa", "--queryformat", r"%{EPOCH}:%{NAME}\n"])
+    assert nevra.stdout == "(none):bash\n1:glibc\n"
+    # A literal newline in the format (as config passes it) works as well as "\n".
+    files = run_rpm_query(_no_rpm, host, ["-qa", "--queryformat", "[%{FILENAMES}\n]"])
+    assert files.stdout.splitlines() == [
+        "/usr/bin/bash", "/etc/skel/.bashrc", "/etc/ld.so.conf.d", "/usr/lib64/libc.so.6",
+    ]
+    padded = run_rpm_query(_no_rpm, host, ["-qa", "--queryformat", r"[%{=NAME} %-6{FILEMODES}|\n]"])
+    assert padded.stdout.splitlines()[0] == "bash 33261 |"
+
+
+def test_bulk_index_query_matches_rpm_format(host):
+    db = RpmDatabase.query(_no_rpm, host)
+    assert [p.nevra for p in db.packages] == ["0:bash-5.2.15-2.el9.x86_64", "1:glibc-2.34-100.el9.x86_64"]
+    assert db.owner("/usr/lib64/libc.so.6") == "glibc"
+    assert db.is_config("/etc/skel/.bashrc")
+    assert db.file("/etc/ld.so.conf.d").digest == ""
+    assert db.file("/usr/bin/bash").digest == "ab12"
+    assert db.file("/usr/bin/bash").verify_flags == RPMVERIFY_ALL
+    assert db.file("/etc/skel/.bashrc").verify_flags == RPMVERIFY_ALL & ~(
+        RPMVERIFY_FILEDIGEST | RPMVERIFY_FILESIZE | RPMVERIFY_MTIME)
+    assert db.package("glibc").digest_algo == 8
+    assert db.who_provides("/bin/sh") == ["bash"]
+    assert db.package("bash").requires == ["glibc", "rpmlib(CompressedFileNames)"]
+
+
+def test_unsupported_queries_fall_back_to_rpm(host):
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return RunResult(stdout="from rpm\n", stderr="", returncode=0)
+
+    for args in (["-qf", "/usr/bin/bash"], ["-qa", "--queryformat", "%{INSTALLTID:date}\n"],
+                 ["-qa", "--queryformat", "%{NOSUCHTAG}"], ["-qa", "--queryformat", "%|EPOCH?{x}|"]):
+        assert run_rpm_query(executor, host, args).stdout == "from rpm\n"
+    assert len(calls) == 4
+
+
+def test_missing_or_corrupt_database_falls_back(tmp_path):
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return RunResult(stdout="from rpm\n", stderr="", returncode=0)
+
+    assert run_rpm_query(executor, tmp_path, ["-qa"]).stdout == "from rpm\n"
+    _make_db(tmp_path, [b"\x00\x00\x00\x05\x00\x00\x00\x10short"], rel="usr/lib/sysimage/rpm/rpmdb.sqlite")
+    assert run_rpm_query(executor, tmp_path, ["-qa"]).stdout == "from rpm\n"
+    assert len(calls) == 2
+
+
+def test_disabled_by_environment(host, monkeypatch):
+    monkeypatch.setattr(rpmdb_sqlite, "ENABLED", False)
+    assert rpmdb_sqlite.query(host, ["-qa"]) is None
+
+
+def test_suspended_reads_go_through_the_executor(host):
+    def executor(cmd, cwd=None):
+        return RunResult(stdout="from rpm\n", stderr="", returncode=0)
+
+    with rpmdb_sqlite.suspend_native_reads():
+        assert rpmdb_sqlite.native_reads_suspended()
+        assert run_rpm_query(executor, host, ["-qa"]).stdout == "from rpm\n"
+    assert not rpmdb_sqlite.native_reads_suspended()
+    assert run_rpm_query(executor, host, ["-qa"]).stdout.startswith("bash-")
+
+
+def test_bulk_queryformat_is_supported():
+    rpmdb_sqlite._compile(QUERYFORMAT)
@@ -0,0 +1,265 @@
+"""Tests for native package file verification (yoinkc.verify)."""
+
+import hashlib
+import os
+
+import pytest
+
+from yoinkc import rpmdb, verify
+from yoinkc.executor import RunResult
+from yoinkc.inspectors.rpm import run as run_rpm
+from yoinkc.rpmdb import RpmDatabase
+
+
+_MTIME = 1700000000
+
+
+def _record(host_root, path, flags=0, state=0, size=None, mtime=_MTIME, digest=None, verify_flags=-1):
+    """F record matching the file at *path* (overridable field by field)."""
+    full = host_root / path.lstrip("/")
+    st = full.lstat()
+    if digest is None:
+        digest = hashlib.sha256(full.read_bytes()).hexdigest() if full.is_file() and not full.is_symlink() else ""
+    linkto = os.readlink(full) if full.is_symlink() else ""
+    return (f"F\t{flags}\t{verify_flags}\t{state}\t{st.st_size if size is None else size}\t{st.st_mode}\t{mtime}"
+            f"\t{digest}\troot\troot\t{linkto}\t{path}")
+
+
+@pytest.fixture
+def host(tmp_path):
+    etc = tmp_path / "etc"
+    (etc / "app").mkdir(parents=True)
+    (tmp_path / "usr/bin").mkdir(parents=True)
+    files = {
+        "/etc/app/same.conf": "key = 1\n",
+        "/etc/app/grown.conf": "key = 1\nmore = 2\n",
+        "/etc/app/touched.conf": "key = 1\n",
+        "/etc/app/edited.conf": "key = 2\n",
+        "/etc/app/chmod.conf": "key = 1\n",
+        "/usr/bin/tool": "#!/bin/sh\n",
+    }
+    for path, text in files.items():
+        full = tmp_path / path.lstrip("/")
+        full.write_text(text)
+        full.chmod(0o644)
+        os.utime(full, (_MTIME, _MTIME))
+    os.symlink("tool", tmp_path / "usr/bin/tool-link")
+    # Whoever runs the tests owns the files; call them root on this host.
+    (etc / "passwd").write_text(f"root:x:{os.getuid()}:{os.getgid()}::/root:/bin/sh\n")
+    (etc / "group").write_text(f"root:x:{os.getgid()}:\n")
+    records = [
+        "P\t(none)\tapp\t1.0\t1.el9\tx86_64\t8",
+        _record(tmp_path, "/etc/app/same.conf", flags=17),
+        _record(tmp_path, "/etc/app/grown.conf", flags=17, size=8, mtime=_MTIME - 60,
+                digest=hashlib.sha256(b"key = 1\n").hexdigest()),
+        _record(tmp_path, "/etc/app/touched.conf", flags=17, mtime=_MTIME - 60),
+        _record(tmp_path, "/etc/app/edited.conf", flags=17, mtime=_MTIME - 60,
+                digest=hashlib.sha256(b"key = 1\n").hexdigest()),
+        _record(tmp_path, "/etc/app/chmod.conf", flags=17).replace("\t33188\t", "\t33152\t"),
+        "F\t17\t-1\t0\t8\t33188\t1700000000\tab\troot\troot\t\t/etc/app/gone.conf",
+        "F\t25\t-1\t0\t8\t33188\t1700000000\tab\troot\troot\t\t/etc/app/optional.conf",
+        "F\t64\t-1\t0\t8\t33188\t1700000000\tab\troot\troot\t\t/etc/app/ghost.conf",
+        "F\t2\t-1\t2\t8\t33188\t1700000000\tab\troot\troot\t\t/usr/share/doc/app/README",
+        _record(tmp_path, "/usr/bin/tool"),
+        _record(tmp_path, "/usr/bin/tool-link").replace("\ttool\t/usr/bin/tool-link", "\tother\t/usr/bin/tool-link"),
+    ]
+    return tmp_path, RpmDatabase.parse("\n".join(records) + "\n")
+
+
+def _by_path(entries):
+    return {e.path: e.flags for e in entries}
+
+
+def test_flags_match_rpm_va(host):
+    root, db = host
+    result = _by_path(verify.verify_files(db, root, scope="all", jobs=1))
+    assert result == {
+        "/etc/app/grown.conf": "S.5....T.",
+        "/etc/app/touched.conf": ".......T.",
+        "/etc/app/edited.conf": "..5....T.",
+        "/etc/app/chmod.conf": ".M.......",
+        "/etc/app/gone.conf": "missing",
+        "/usr/bin/tool-link": "....L....",
+    }
+
+
+def test_owning_package_is_filled_in(host):
+    root, db = host
+    assert {e.package for e in verify.verify_files(db, root, jobs=1)} == {"app"}
+
+
+def test_size_and_mtime_match_skips_hashing(host, monkeypatch):
+    root, db = host
+    hashed = []
+    real = verify._digest
+    monkeypatch.setattr(verify, "_digest", lambda full, algo: hashed.append(full) or real(full, algo))
+    verify.verify_files(db, root, jobs=1)
+    assert sorted(os.path.basename(p) for p in hashed) == ["edited.conf", "touched.conf"]
+
+
+def test_scopes(host):
+    root, db = host
+    etc = _by_path(verify.verify_files(db, root, scope="etc", jobs=1))
+    assert all(p.startswith("/etc/") for p in etc) and "/etc/app/grown.conf" in etc
+    config = verify.select_files(db, "config")
+    assert [p for p, _ in config] == [
+        "/etc/app/chmod.conf", "/etc/app/edited.conf", "/etc/app/gone.conf",
+        "/etc/app/grown.conf", "/etc/app/optional.conf", "/etc/app/same.conf",
+        "/etc/app/touched.conf",
+    ]
+    with pytest.raises(ValueError):
+        verify.select_files(db, "usr")
+
+
+def test_parallel_matches_serial(host, monkeypatch):
+    root, db = host
+    monkeypatch.setattr(verify, "CHUNK_SIZE", 1)
+    assert verify.verify_files(db, root, jobs=4) == verify.verify_files(db, root, jobs=1)
+
+
+def test_unknown_owner_is_flagged(host):
+    root, db = host
+    text = "P\t(none)\tapp\t1.0\t1.el9\tx86_64\t8\n" + _record(root, "/usr/bin/tool").replace(
+        "\troot\troot\t", "\tdaemon\troot\t") + "\n"
+    assert _by_path(verify.verify_files(RpmDatabase.parse(text), root, jobs=1)) == {
+        "/usr/bin/tool": ".....U...",
+    }
+
+
+def test_verify_attributes_excluded_by_package_are_skipped(host, monkeypatch):
+    root, _ = host
+    # setup packages /etc/passwd with %verify(not md5 size mtime).
+    not_md5_size_mtime = ~(rpmdb.RPMVERIFY_FILEDIGEST | rpmdb.RPMVERIFY_FILESIZE
+                           | rpmdb.RPMVERIFY_MTIME) & rpmdb.RPMVERIFY_ALL
+    text = "\n".join([
+        "P\t(none)\tsetup\t2.13.7\t9.el9\tnoarch\t8",
+        _record(root, "/etc/passwd", flags=17, size=0, mtime=_MTIME - 60, digest="ab",
+                verify_flags=not_md5_size_mtime),
+        _record(root, "/etc/group", flags=17, size=0, mtime=_MTIME - 60, digest="ab",
+                verify_flags=not_md5_size_mtime).replace("\troot\troot\t", "\tdaemon\troot\t"),
+    ]) + "\n"
+    hashed = []
+    monkeypatch.setattr(verify, "_digest", lambda full, algo: hashed.append(full))
+    assert _by_path(verify.verify_files(RpmDatabase.parse(text), root, jobs=1)) == {
+        "/etc/group": ".....U...",
+    }
+    assert hashed == []
+
+
+def test_rpm_inspector_uses_native_engine_with_rpmdb(host):
+    root, db = host
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        return RunResult(stdout="", stderr="", returncode=1)
+
+    section = run_rpm(root, executor, rpmdb=db, verify_scope="etc")
+    assert not any("-Va" in c for c in calls)
+    assert "/etc/app/grown.conf" in _by_path(section.rpm_va)
+
+
+def test_rpm_va_fallback_honours_scope(tmp_path):
+    (tmp_path / "etc").mkdir()
+    va = "S.5....T.  c /etc/foo.conf\n.......T.    /usr/bin/foo\n"
+    calls = []
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        if "-Va" in cmd:
+            return RunResult(stdout=va, stderr="", returncode=1)
+        return RunResult(stdout="", stderr="", returncode=1)
+
+    assert _by_path(run_rpm(tmp_path, executor, verify_scope="etc").rpm_va) == {"/etc/foo.conf": "S.5....T."}
+    run_rpm(tmp_path, executor, verify_scope="config")
+    assert "--configfiles" in [c for c in calls if "-Va" in c][-1]
+
+
+def _sharded_executor(calls, fail_shard=False):
+    modified = {"httpd": "S.5....T.  c /etc/httpd/conf/httpd.conf\n", "bash": "",
+                "sudo": ".M.......  c /etc/sudoers\n", "vim": "missing     /usr/bin/vim\n"}
+    files = {"httpd": ["/etc/httpd/conf/httpd.conf"], "bash": ["/usr/bin/bash"],
+             "sudo": ["/etc/sudoers"], "vim": ["/usr/bin/vim"]}
+
+    def executor(cmd, cwd=None):
+        calls.append(cmd)
+        if "-Va" in cmd:
+            return RunResult(stdout="".join(modified.values()), stderr="", returncode=1)
+        if "-V" in cmd:
+            names = [n for n in cmd if n in modified]
+            if fail_shard and "vim" in names:
+                return RunResult(stdout="", stderr="error: rpmdb open failed", returncode=1)
+            out = "".join(modified[n] for n in names)
+            return RunResult(stdout=out, stderr="", returncode=1 if out else 0)
+        if "--queryformat" in cmd and "-qa" in cmd:
+            return RunResult(stdout="".join(f"0:{n}-1.0-1.el9.x86_64\n" for n in files), stderr="", returncode=0)
+        if "--queryformat" in cmd:
+            names = [n for n in cmd if n in files]
+            return RunResult(stdout="".join(f"{n}\t{f}\n" for n in names for f in files[n]),
+                             stderr="", returncode=0)
+        return RunResult(stdout="", stderr="", returncode=1)
+    return executor
+
+
+def test_sharded_rpm_verify_attributes_packages(tmp_path):
+    (tmp_path / "etc").mkdir()
+    calls = []
+    section = run_rpm(tmp_path, _sharded_executor(calls), verify_jobs=2)
+    assert not any("-Va" in c for c in calls)
+    assert sum(1 for c in calls if "-V" in c) == 2
+    assert [(e.path, e.flags, e.package) for e in section.rpm_va] == [
+        ("/etc/httpd/conf/httpd.conf", "S.5....T.", "httpd"),
+        ("/etc/sudoers", ".M.......", "sudo"),
+        ("/usr/bin/vim", "missing", "vim"),
+    ]
+
+
+def test_failed_shard_falls_back_to_rpm_va(tmp_path):
+    (tmp_path / "etc").mkdir()
+    calls = []
+    section = run_rpm(tmp_path, _sharded_executor(calls, fail_shard=True), verify_jobs=2)
+    assert sum(1 for c in calls if "-Va" in c) == 1
+    assert len(section.rpm_va) == 3 and all(e.package is None for e in section.rpm_va)
+
+
+def test_cache_skips_rehashing_unchanged_files(host, tmp_path_factory, monkeypatch):
+    root, db = host
+    path = tmp_path_factory.mktemp("cache") / verify.VerifyCache.FILENAME
+    expected = verify.verify_files(db, root, jobs=1)
+    first = verify.VerifyCache(path)
+    assert verify.verify_files(db, root, jobs=1, cache=first) == expected
+    assert (first.hits, first.misses) == (0, 2)
+
+    hashed = []
+    real = verify._digest
+    monkeypatch.setattr(verify, "_digest", lambda full, algo: hashed.append(full) or real(full, algo))
+    second = verify.VerifyCache(path)
+    assert verify.verify_files(db, root, jobs=2, cache=second) == expected
+    assert hashed == [] and second.hits == 2
+
+    # Editing a file changes its ctime; the entry no longer applies.
+    (root / "etc/app/touched.conf").write_text("key = 9\n")
+    os.utime(root / "etc/app/touched.conf", (_MTIME, _MTIME))
+    third = verify.VerifyCache(path)
+    assert _by_path(verify.verify_files(db, root, jobs=1, cache=third))["/etc/app/touched.conf"] == "..5....T."
+    assert [os.path.basename(p) for p in hashed] == ["touched.conf"]
+
+
+def test_cache_is_invalidated_by_package_update(host, tmp_path):
+    root, db = host
+    path = tmp_path / "cache" / verify.VerifyCache.FILENAME
+    verify.verify_files(db, root, jobs=1, cache=verify.VerifyCache(path))
+    text = "\n".join(["P\t(none)\tapp\t1.1\t1.el9\tx86_64\t8",
+                      _record(root, "/etc/app/touched.conf", flags=17, mtime=_MTIME - 60)]) + "\n"
+    cache = verify.VerifyCache(path)
+    verify.verify_files(RpmDatabase.parse(text), root, jobs=1, cache=cache)
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_unreadable_cache_starts_empty(host, tmp_path):
+    root, db = host
+    path = tmp_path / verify.VerifyCache.FILENAME
+    path.write_bytes(b"not a database")
+    cache = verify.VerifyCache(path)
+    assert verify.verify_files(db, root, jobs=1, cache=cache)
+    assert cache.misses == 2